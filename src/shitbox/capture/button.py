@@ -69,7 +69,7 @@ class ButtonHandler:
             return
 
         self._running = True
-        self._thread = threading.Thread(target=self._monitor_loop, daemon=True)
+        self._thread = threading.Thread(target=self._monitor_loop, daemon=True, name="button")
         self._thread.start()
 
         log.info("button_handler_started", gpio_pin=self.gpio_pin)
@@ -1,16 +1,42 @@
 """Video recorder using ffmpeg for webcam capture."""
 
+import os
 import subprocess
 import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, Optional, Tuple
 
 from shitbox.utils.logging import get_logger
 
 log = get_logger(__name__)
 
+# File types removed by cleanup_old_captures
+MEDIA_SUFFIXES = (".mp4", ".jpg")
+
+# Decoder-side shortcuts for the MJPEG camera input: skip in-loop deblocking
+# on non-key frames, drop non-reference frames and allow fast decode paths.
+MJPEG_FAST_DECODE_ARGS = [
+    "-skip_loop_filter", "nonkey",
+    "-skip_frame", "nonref",
+    "-flags2", "fast",
+]
+
+
+def capture_date_dir(root: Path, timestamp: Optional[float] = None) -> Path:
+    """Return the root/<YYYY-MM-DD> directory captures are filed under.
+
+    Captures are grouped by local date, so the engine can find the video
+    recorded for an event from the event's start time.
+
+    Args:
+        root: Captures root directory.
+        timestamp: Unix time to file under; defaults to now.
+    """
+    when = datetime.now() if timestamp is None else datetime.fromtimestamp(timestamp)
+    return root / when.strftime("%Y-%m-%d")
+
 
 class VideoRecorder:
     """Record video from USB webcam using ffmpeg.
@@ -42,16 +68,50 @@ class VideoRecorder:
         self.fps = fps
         self.audio_device = audio_device
 
+        # Guards swapping _current_process out, so an exited recording is
+        # reported exactly once whichever thread notices it first
+        self._process_lock = threading.Lock()
         self._current_process: Optional[subprocess.Popen] = None
         self._current_output: Optional[Path] = None
         self._recording_start: Optional[float] = None
+        # root -> (date string, date subdirectory) so mkdir runs once per day
+        self._date_cache: Dict[Path, Tuple[str, Path]] = {}
 
     @property
     def is_recording(self) -> bool:
         """Check if currently recording."""
-        if self._current_process is None:
-            return False
-        return self._current_process.poll() is None
+        process = self._current_process
+        return process is not None and process.poll() is None
+
+    def reap_finished(self) -> None:
+        """Release an ffmpeg process that has exited and log its outcome.
+
+        Polled from the engine's telemetry loop so no thread has to block in
+        wait() for the whole recording.
+        """
+        with self._process_lock:
+            process = self._current_process
+            if process is None:
+                return
+            returncode = process.poll()
+            if returncode is None:
+                return
+            self._current_process = None
+            output = self._current_output
+            start = self._recording_start
+        self._finish_recording(process, returncode, output, start)
+
+    def _ensure_date_subdir(self, root: Path) -> Path:
+        """Return root/<YYYY-MM-DD>, creating it only when the date rolls over."""
+        subdir = capture_date_dir(root)
+        today = subdir.name
+        cached = self._date_cache.get(root)
+        if cached is not None and cached[0] == today:
+            return cached[1]
+
+        subdir.mkdir(parents=True, exist_ok=True)
+        self._date_cache[root] = (today, subdir)
+        return subdir
 
     def start_recording(
         self,
@@ -67,14 +127,13 @@ class VideoRecorder:
         Returns:
             Path to output file, or None if failed to start.
         """
+        self.reap_finished()
         if self.is_recording:
             log.warning("video_already_recording")
             return self._current_output
 
         # Create output directory with date subdirectory
-        today = datetime.now().strftime("%Y-%m-%d")
-        output_subdir = self.output_dir / today
-        output_subdir.mkdir(parents=True, exist_ok=True)
+        output_subdir = self._ensure_date_subdir(self.output_dir)
 
         # Generate unique filename
         timestamp = datetime.now().strftime("%H%M%S")
@@ -95,6 +154,7 @@ class VideoRecorder:
             "-input_format", "mjpeg",
             "-video_size", self.resolution,
             "-framerate", str(self.fps),
+            *MJPEG_FAST_DECODE_ARGS,
             "-i", self.device,
             # Audio input (ALSA)
             "-f", "alsa",
@@ -118,19 +178,15 @@ class VideoRecorder:
         )
 
         try:
-            self._current_process = subprocess.Popen(
+            process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.PIPE,
             )
-            self._current_output = output_path
-            self._recording_start = time.monotonic()
-
-            # Start thread to monitor completion
-            threading.Thread(
-                target=self._monitor_recording,
-                daemon=True,
-            ).start()
+            with self._process_lock:
+                self._current_process = process
+                self._current_output = output_path
+                self._recording_start = time.time()
 
             return output_path
 
@@ -146,45 +202,55 @@ class VideoRecorder:
         if not self.is_recording:
             return
 
+        with self._process_lock:
+            process = self._current_process
+            self._current_process = None
+        if process is None:
+            return
+
         log.info("video_recording_stopping")
 
         try:
-            self._current_process.terminate()
-            self._current_process.wait(timeout=5.0)
+            process.terminate()
+            process.wait(timeout=5.0)
         except subprocess.TimeoutExpired:
-            self._current_process.kill()
+            process.kill()
         except Exception as e:
             log.error("video_stop_error", error=str(e))
 
-        self._current_process = None
-
-    def _monitor_recording(self) -> None:
-        """Monitor ffmpeg process and log completion."""
-        if self._current_process is None:
-            return
-
-        # Wait for process to complete
-        returncode = self._current_process.wait()
-        duration = time.monotonic() - self._recording_start if self._recording_start else 0
+        if process.stderr:
+            process.stderr.close()
 
+    def _finish_recording(
+        self,
+        process: subprocess.Popen,
+        returncode: int,
+        output: Optional[Path],
+        start: Optional[float],
+    ) -> None:
+        """Log completion of an exited ffmpeg process and close its stderr."""
         if returncode == 0:
-            # Check file size
-            if self._current_output and self._current_output.exists():
-                size_mb = self._current_output.stat().st_size / (1024 * 1024)
+            # Check file size; the last write time marks the end of recording
+            try:
+                st = output.stat() if output else None
+            except OSError:
+                st = None
+            if st is not None:
+                start = start or st.st_mtime
                 log.info(
                     "video_recording_complete",
-                    output=str(self._current_output),
-                    duration_seconds=round(duration, 1),
-                    size_mb=round(size_mb, 2),
+                    output=str(output),
+                    duration_seconds=round(max(st.st_mtime - start, 0.0), 1),
+                    size_mb=round(st.st_size / (1024 * 1024), 2),
                 )
             else:
-                log.warning("video_file_missing", output=str(self._current_output))
+                log.warning("video_file_missing", output=str(output))
         else:
             # Get stderr for debugging
             stderr = ""
-            if self._current_process.stderr:
+            if process.stderr:
                 try:
-                    stderr = self._current_process.stderr.read().decode()[-500:]
+                    stderr = process.stderr.read().decode()[-500:]
                 except Exception:
                     pass
             log.error(
@@ -193,7 +259,8 @@ class VideoRecorder:
                 stderr=stderr,
             )
 
-        self._current_process = None
+        if process.stderr:
+            process.stderr.close()
 
     def capture_image(self, filename_prefix: str = "timelapse") -> Optional[Path]:
         """Capture a single image from the webcam.
@@ -205,16 +272,15 @@ class VideoRecorder:
             Path to output file, or None if failed.
         """
         # Create output directory with date subdirectory
-        today = datetime.now().strftime("%Y-%m-%d")
-        output_subdir = self.output_dir / "timelapse" / today
-        output_subdir.mkdir(parents=True, exist_ok=True)
+        output_subdir = self._ensure_date_subdir(self.output_dir / "timelapse")
 
         # Generate unique filename
         timestamp = datetime.now().strftime("%H%M%S")
         filename = f"{filename_prefix}_{timestamp}.jpg"
         output_path = output_subdir / filename
 
-        # Use ffmpeg to capture single frame
+        # Use ffmpeg to capture single frame. The camera already delivers
+        # JPEG frames, so copy one straight to disk instead of re-encoding.
         cmd = [
             "ffmpeg",
             "-y",
@@ -223,7 +289,8 @@ class VideoRecorder:
             "-video_size", self.resolution,
             "-i", self.device,
             "-frames:v", "1",
-            "-q:v", "2",  # High quality JPEG
+            "-c:v", "copy",
+            "-bsf:v", "mjpeg2jpeg",  # Add Huffman tables if the camera omits them
             str(output_path),
         ]
 
@@ -265,29 +332,56 @@ class VideoRecorder:
         deleted = 0
         cutoff = time.time() - (max_age_days * 86400)
 
-        # Clean up videos and timelapse images
-        for pattern in ("*.mp4", "*.jpg"):
-            for media_file in self.output_dir.rglob(pattern):
-                try:
-                    if media_file.stat().st_mtime < cutoff:
-                        media_file.unlink()
-                        deleted += 1
-                except Exception as e:
-                    log.warning("cleanup_file_error", file=str(media_file), error=str(e))
-
-        # Remove empty date directories
-        for subdir in self.output_dir.iterdir():
-            if subdir.is_dir():
-                try:
-                    subdir.rmdir()  # Only removes if empty
-                except OSError:
-                    pass  # Directory not empty
+        # Clean up videos and timelapse images. DirEntry.stat() reuses the
+        # result of the directory scan, and os.unlink skips Path construction.
+        for entry in self._iter_media_files(str(self.output_dir)):
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+                    deleted += 1
+            except FileNotFoundError:
+                pass  # Removed concurrently
+            except Exception as e:
+                log.warning("cleanup_file_error", file=entry.path, error=str(e))
+
+        # Remove empty directories bottom-up (date dirs and timelapse/<date>).
+        # Today's directories are kept: a capture may be about to write there.
+        root = str(self.output_dir)
+        today = capture_date_dir(self.output_dir).name
+        for dirpath, _, _ in os.walk(root, topdown=False):
+            if dirpath == root or os.path.basename(dirpath) == today:
+                continue
+            try:
+                os.rmdir(dirpath)  # Only removes if empty
+            except OSError:
+                pass  # Directory not empty
+        # Drop cached date dirs only once pruning is done, so the next
+        # capture re-checks its directory after any removal
+        self._date_cache.clear()
 
         if deleted > 0:
             log.info("video_cleanup_complete", deleted=deleted)
 
         return deleted
 
+    @classmethod
+    def _iter_media_files(cls, top: str) -> Iterator[os.DirEntry]:
+        """Recursively yield .mp4 and .jpg entries below top."""
+        try:
+            with os.scandir(top) as it:
+                entries = list(it)
+        except OSError:
+            return
+
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from cls._iter_media_files(entry.path)
+                elif entry.name.endswith(MEDIA_SUFFIXES):
+                    yield entry
+            except OSError:
+                continue
+
     def get_storage_size_mb(self) -> float:
         """Get total size of captures directory in MB."""
         if not self.output_dir.exists():
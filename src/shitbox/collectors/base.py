@@ -1,5 +1,6 @@
 """Base collector class for all sensors."""
 
+import functools
 import threading
 import time
 from abc import ABC, abstractmethod
@@ -11,6 +12,22 @@ from shitbox.utils.logging import get_logger
 
 log = get_logger(__name__)
 
+# Error-rate tracking: EWMA of read failures (1.0 = failed, 0.0 = ok)
+ERROR_EWMA_ALPHA = 0.05
+ERROR_RATE_THRESHOLD = 0.5
+ERROR_RATE_MIN_SAMPLES = 20
+
+# Above this rate the ~4 ms resolution of the coarse clock would add cadence jitter
+COARSE_CLOCK_MAX_RATE_HZ = 100.0
+
+# Cheaper, lower-resolution monotonic clock; falls back off Linux
+_monotonic_coarse: Callable[[], float]
+if hasattr(time, "CLOCK_MONOTONIC_COARSE"):
+    _monotonic_coarse = functools.partial(time.clock_gettime, time.CLOCK_MONOTONIC_COARSE)
+else:
+    _monotonic_coarse = time.monotonic
+
+
 # Type variable for specific reading types
 T = TypeVar("T")
 
@@ -38,11 +55,21 @@ class BaseCollector(ABC, Generic[T]):
         self.sample_rate_hz = sample_rate_hz
         self.sample_interval = 1.0 / sample_rate_hz
         self.callback = callback
+        self._clock: Callable[[], float] = (
+            _monotonic_coarse
+            if sample_rate_hz <= COARSE_CLOCK_MAX_RATE_HZ
+            else time.monotonic
+        )
 
         self._running = False
         self._thread: Optional[threading.Thread] = None
         self._error_count = 0
         self._max_errors = 10  # Stop after this many consecutive errors
+        # Slow-burn failures (e.g. every other read) never hit _max_errors,
+        # so also stop when the smoothed failure rate stays too high.
+        self._error_ewma = 0.0
+        self._error_threshold = ERROR_RATE_THRESHOLD
+        self._samples_seen = 0
         self._last_reading: Optional[T] = None
 
     @abstractmethod
@@ -98,7 +125,11 @@ class BaseCollector(ABC, Generic[T]):
 
         self._running = True
         self._error_count = 0
-        self._thread = threading.Thread(target=self._run_loop, daemon=True)
+        self._error_ewma = 0.0
+        self._samples_seen = 0
+        self._thread = threading.Thread(
+            target=self._run_loop, daemon=True, name=f"collector-{self.name}"
+        )
         self._thread.start()
 
     def stop(self) -> None:
@@ -119,7 +150,8 @@ class BaseCollector(ABC, Generic[T]):
         log.info("collector_loop_started", collector=self.name)
 
         while self._running:
-            loop_start = time.monotonic()
+            loop_start = self._clock()
+            failed = False
 
             try:
                 data = self.read()
@@ -133,6 +165,7 @@ class BaseCollector(ABC, Generic[T]):
                         self.callback(reading)
 
             except Exception as e:
+                failed = True
                 self._error_count += 1
                 log.error(
                     "collector_read_error",
@@ -150,14 +183,35 @@ class BaseCollector(ABC, Generic[T]):
                     self._running = False
                     break
 
+            if self._error_rate_exceeded(failed):
+                log.error(
+                    "collector_error_rate_exceeded",
+                    collector=self.name,
+                    error_rate=round(self._error_ewma, 2),
+                    threshold=self._error_threshold,
+                )
+                self._running = False
+                break
+
             # Sleep for remaining time to maintain sample rate
-            elapsed = time.monotonic() - loop_start
+            elapsed = self._clock() - loop_start
             sleep_time = self.sample_interval - elapsed
             if sleep_time > 0:
                 time.sleep(sleep_time)
 
         log.info("collector_loop_stopped", collector=self.name)
 
+    def _error_rate_exceeded(self, failed: bool) -> bool:
+        """Fold one read outcome into the error EWMA and check the threshold."""
+        self._samples_seen += 1
+        self._error_ewma = (1.0 - ERROR_EWMA_ALPHA) * self._error_ewma + (
+            ERROR_EWMA_ALPHA if failed else 0.0
+        )
+        return (
+            self._samples_seen >= ERROR_RATE_MIN_SAMPLES
+            and self._error_ewma > self._error_threshold
+        )
+
     @property
     def is_running(self) -> bool:
         """Check if collector is currently running."""
@@ -1,6 +1,6 @@
 """Environment data collector for BME680 sensor."""
 
-from typing import Callable, Optional
+from typing import Any, Callable, Optional
 
 from shitbox.collectors.base import BaseCollector
 from shitbox.storage.models import EnvironmentReading, Reading
@@ -21,6 +21,7 @@ class EnvironmentCollector(BaseCollector[EnvironmentReading]):
         self,
         config: EnvironmentConfig,
         callback: Optional[Callable[[Reading], None]] = None,
+        i2c: Any = None,
     ):
         super().__init__(
             name="environment",
@@ -29,7 +30,9 @@ class EnvironmentCollector(BaseCollector[EnvironmentReading]):
         )
         self.config = config
         self._sensor = None
-        self._i2c = None
+        # A bus passed in is shared with other devices and is not ours to deinit
+        self._i2c = i2c
+        self._owns_i2c = i2c is None
 
     def setup(self) -> None:
         """Initialise BME680 hardware."""
@@ -44,7 +47,8 @@ class EnvironmentCollector(BaseCollector[EnvironmentReading]):
                 address=hex(self.config.address),
             )
 
-            self._i2c = busio.I2C(board.SCL, board.SDA)
+            if self._i2c is None:
+                self._i2c = busio.I2C(board.SCL, board.SDA)
             self._sensor = Adafruit_BME680_I2C(self._i2c, address=self.config.address)
 
             log.info("environment_sensor_initialised")
@@ -99,7 +103,8 @@ class EnvironmentCollector(BaseCollector[EnvironmentReading]):
     def cleanup(self) -> None:
         """Release I2C resources."""
         if self._i2c:
-            self._i2c.deinit()
+            if self._owns_i2c:
+                self._i2c.deinit()
             self._i2c = None
             self._sensor = None
             log.info("environment_cleanup_complete")
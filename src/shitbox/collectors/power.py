@@ -1,6 +1,6 @@
 """Power data collector for INA219 sensor."""
 
-from typing import Callable, Optional
+from typing import Any, Callable, Optional
 
 from shitbox.collectors.base import BaseCollector
 from shitbox.storage.models import PowerReading, Reading
@@ -20,6 +20,7 @@ class PowerCollector(BaseCollector[PowerReading]):
         self,
         config: PowerConfig,
         callback: Optional[Callable[[Reading], None]] = None,
+        i2c: Any = None,
     ):
         super().__init__(
             name="power",
@@ -28,7 +29,9 @@ class PowerCollector(BaseCollector[PowerReading]):
         )
         self.config = config
         self._sensor = None
-        self._i2c = None
+        # A bus passed in is shared with other devices and is not ours to deinit
+        self._i2c = i2c
+        self._owns_i2c = i2c is None
 
     def setup(self) -> None:
         """Initialise INA219 hardware."""
@@ -43,7 +46,8 @@ class PowerCollector(BaseCollector[PowerReading]):
                 address=hex(self.config.address),
             )
 
-            self._i2c = busio.I2C(board.SCL, board.SDA)
+            if self._i2c is None:
+                self._i2c = busio.I2C(board.SCL, board.SDA)
             self._sensor = INA219(self._i2c, addr=self.config.address)
 
             log.info("power_sensor_initialised")
@@ -95,7 +99,8 @@ class PowerCollector(BaseCollector[PowerReading]):
     def cleanup(self) -> None:
         """Release I2C resources."""
         if self._i2c:
-            self._i2c.deinit()
+            if self._owns_i2c:
+                self._i2c.deinit()
             self._i2c = None
             self._sensor = None
             log.info("power_cleanup_complete")
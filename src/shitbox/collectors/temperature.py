@@ -1,6 +1,7 @@
 """Temperature data collector for MCP9808 sensor."""
 
-from typing import Callable, Optional
+import time
+from typing import Any, Callable, Optional
 
 from shitbox.collectors.base import BaseCollector
 from shitbox.storage.models import Reading, TemperatureReading
@@ -9,6 +10,9 @@ from shitbox.utils.logging import get_logger
 
 log = get_logger(__name__)
 
+# MCP9808 ambient temperature register: 13-bit two's complement, 1/16 C per LSB
+_REG_AMBIENT_TEMP = b"\x05"
+
 
 class TemperatureCollector(BaseCollector[TemperatureReading]):
     """Collector for MCP9808 I2C temperature sensor.
@@ -21,12 +25,14 @@ class TemperatureCollector(BaseCollector[TemperatureReading]):
         self,
         config: TemperatureConfig,
         callback: Optional[Callable[[Reading], None]] = None,
+        i2c: Any = None,
     ):
         """Initialise temperature collector.
 
         Args:
             config: Temperature sensor configuration.
             callback: Function to call with each reading.
+            i2c: Shared busio.I2C instance; one is created in setup() if None.
         """
         super().__init__(
             name="temperature",
@@ -35,7 +41,10 @@ class TemperatureCollector(BaseCollector[TemperatureReading]):
         )
         self.config = config
         self._sensor = None
-        self._i2c = None
+        # A bus passed in is shared with other devices and is not ours to deinit
+        self._i2c = i2c
+        self._owns_i2c = i2c is None
+        self._buf = bytearray(2)
 
     def setup(self) -> None:
         """Initialise MCP9808 hardware."""
@@ -50,8 +59,11 @@ class TemperatureCollector(BaseCollector[TemperatureReading]):
                 address=hex(self.config.address),
             )
 
-            # Create I2C bus
-            self._i2c = busio.I2C(board.SCL, board.SDA)
+            # Create I2C bus unless the engine shared one
+            if self._i2c is None:
+                self._i2c = busio.I2C(
+                    board.SCL, board.SDA, frequency=self.config.i2c_frequency_hz
+                )
 
             # Create sensor object
             self._sensor = adafruit_mcp9808.MCP9808(
@@ -79,7 +91,7 @@ class TemperatureCollector(BaseCollector[TemperatureReading]):
             return None
 
         try:
-            temp_celsius = self._sensor.temperature
+            temp_celsius = self._read_ambient()
 
             reading = TemperatureReading(
                 timestamp=self.now_utc(),
@@ -94,6 +106,24 @@ class TemperatureCollector(BaseCollector[TemperatureReading]):
             log.error("temperature_read_error", error=str(e))
             raise
 
+    def _read_ambient(self) -> float:
+        """Read the ambient register in one write-then-read transaction.
+
+        Skips the adafruit_mcp9808 property, which goes through its register
+        helpers on each access. The driver is still used in setup() to check
+        the device IDs.
+        """
+        i2c = self._i2c
+        buf = self._buf
+        while not i2c.try_lock():  # Bus may be shared with the OLED and sensors
+            time.sleep(0)
+        try:
+            i2c.writeto_then_readfrom(self.config.address, _REG_AMBIENT_TEMP, buf)
+        finally:
+            i2c.unlock()
+        raw = (buf[0] << 8) | buf[1]
+        return (raw & 0x0FFF) / 16.0 - (256.0 if raw & 0x1000 else 0.0)
+
     def to_reading(self, data: TemperatureReading) -> Reading:
         """Convert TemperatureReading to generic Reading."""
         return Reading.from_temperature(data)
@@ -101,7 +131,8 @@ class TemperatureCollector(BaseCollector[TemperatureReading]):
     def cleanup(self) -> None:
         """Release I2C resources."""
         if self._i2c:
-            self._i2c.deinit()
+            if self._owns_i2c:
+                self._i2c.deinit()
             self._i2c = None
             self._sensor = None
             log.info("temperature_cleanup_complete")
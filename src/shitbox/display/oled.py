@@ -14,6 +14,27 @@ if TYPE_CHECKING:
 
 log = get_logger(__name__)
 
+# SSD1306 geometry and commands
+WIDTH = 128
+HEIGHT = 64
+PAGES = HEIGHT // 8
+SET_MEM_ADDR = 0x20
+MEM_ADDR_VERTICAL = 0x01
+SET_COL_ADDR = 0x21
+SET_PAGE_ADDR = 0x22
+DATA_CONTROL_BYTE = 0x40  # Co=0, D/C=1: following bytes are display RAM
+
+# Labels that never change, drawn once into the chrome template: (x, y, text)
+CHROME_LABELS = ((0, 0, "GPS:"), (42, 16, "EVT:"), (36, 48, "BKL:"))
+
+# Printable ASCII is pre-rendered to glyph masks so per-frame text is blitted,
+# not laid out. Glyphs get side padding for ink that overhangs the advance.
+GLYPH_CHARS = "".join(chr(c) for c in range(32, 127))
+GLYPH_PAD = 2
+
+# PIL packs 1-bit rows MSB-first; SSD1306 pages put the top pixel in bit 0
+_BIT_REVERSE = bytes(int(f"{i:08b}"[::-1], 2) for i in range(256))
+
 
 class OLEDDisplayService:
     """Daemon thread that renders system status to an SSD1306 OLED.
@@ -22,15 +43,34 @@ class OLEDDisplayService:
     hardware imports inside start() so missing libs don't crash the engine.
     """
 
-    def __init__(self, config: OLEDConfig, engine: UnifiedEngine) -> None:
+    def __init__(
+        self, config: OLEDConfig, engine: UnifiedEngine, i2c: Any = None
+    ) -> None:
         self.config = config
         self.engine = engine
+        # Shared bus from the engine; start() opens its own if None
+        self._i2c = i2c
         self._running = False
         self._thread: Optional[threading.Thread] = None
+        # Set by the engine (via notify) when displayed status may have changed
+        self._dirty = threading.Event()
         self._display: Any = None
         self._image: Any = None
         self._draw: Any = None
         self._font: Any = None
+        self._chrome: Any = None
+        # Label text -> x where its value starts, right after the chrome label
+        self._value_x: dict[str, int] = {}
+        # Inverted label text -> (width, height) of its glyph bounding box
+        self._bbox_cache: dict[str, tuple[int, int]] = {}
+        # Character -> (mask image, advance width)
+        self._glyphs: dict[str, tuple[Any, int]] = {}
+        self._transpose: Any = None
+        # Frame last sent to the panel, column-major: byte (x * PAGES + page)
+        self._prev_frame = bytes(WIDTH * PAGES)
+        # Reused I2C payload: control byte followed by up to a full frame
+        self._i2c_buf = bytearray(1 + WIDTH * PAGES)
+        self._i2c_buf[0] = DATA_CONTROL_BYTE
 
     def start(self) -> None:
         """Initialise I2C + SSD1306 and start the render thread."""
@@ -43,16 +83,28 @@ class OLEDDisplayService:
             import busio
             from PIL import Image, ImageDraw, ImageFont
 
-            i2c = busio.I2C(board.SCL, board.SDA)
+            i2c = self._i2c
+            if i2c is None:
+                i2c = busio.I2C(
+                    board.SCL, board.SDA, frequency=self.config.i2c_frequency_hz
+                )
             self._display = adafruit_ssd1306.SSD1306_I2C(
-                128, 64, i2c, addr=self.config.address
+                WIDTH, HEIGHT, i2c, addr=self.config.address
             )
+            # Vertical addressing: RAM fills column by column, matching the
+            # byte order of the transposed PIL image (see _frame_bytes)
+            self._display.write_cmd(SET_MEM_ADDR)
+            self._display.write_cmd(MEM_ADDR_VERTICAL)
             self._display.fill(0)
             self._display.show()
+            self._prev_frame = bytes(WIDTH * PAGES)
 
-            self._image = Image.new("1", (128, 64))
+            self._image = Image.new("1", (WIDTH, HEIGHT))
             self._draw = ImageDraw.Draw(self._image)
             self._font = ImageFont.load_default()
+            self._build_chrome(Image, ImageDraw)
+            self._build_glyphs(Image, ImageDraw)
+            self._transpose = getattr(Image, "Transpose", Image).TRANSPOSE
 
             log.info(
                 "oled_display_started",
@@ -65,12 +117,13 @@ class OLEDDisplayService:
             return
 
         self._running = True
-        self._thread = threading.Thread(target=self._display_loop, daemon=True)
+        self._thread = threading.Thread(target=self._display_loop, daemon=True, name="oled")
         self._thread.start()
 
     def stop(self) -> None:
         """Stop the render thread and clear the display."""
         self._running = False
+        self._dirty.set()  # Wake the render loop so it sees _running
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=2.0)
 
@@ -83,79 +136,193 @@ class OLEDDisplayService:
 
         log.info("oled_display_stopped")
 
+    def notify(self) -> None:
+        """Request a redraw; called by the engine when status changes."""
+        self._dirty.set()
+
     def _display_loop(self) -> None:
-        """Main render loop."""
+        """Main render loop.
+
+        Renders when notified, at most every min_interval_seconds, and
+        otherwise every update_interval_seconds so the values that change
+        without a notification (G, CPU temperature) stay fresh.
+        """
+        interval = self.config.update_interval_seconds
+        last_render = 0.0
         while self._running:
+            # Wait relative to when the last render started, so render time
+            # does not stretch the idle period
+            self._dirty.wait(timeout=max(0.0, last_render + interval - time.monotonic()))
+            if not self._running:
+                break
+            # Hold off while inside the minimum interval; a notify arriving
+            # meanwhile is picked up by this render rather than lost
+            wait = self.config.min_interval_seconds - (time.monotonic() - last_render)
+            if wait > 0:
+                time.sleep(wait)
+            self._dirty.clear()
+            last_render = time.monotonic()
             try:
                 self._render()
             except Exception as e:
                 log.error("oled_render_error", error=str(e))
-            time.sleep(self.config.update_interval_seconds)
+            took = time.monotonic() - last_render
+            if took > interval:
+                log.warning("oled_render_slow", took_ms=round(took * 1000, 1))
+
+    def _build_chrome(self, image_mod: Any, draw_mod: Any) -> None:
+        """Render CHROME_LABELS into a template image pasted at the start of each frame."""
+        self._chrome = image_mod.new("1", (WIDTH, HEIGHT))
+        draw = draw_mod.Draw(self._chrome)
+        for x, y, text in CHROME_LABELS:
+            draw.text((x, y), text, font=self._font, fill=255)
+            self._value_x[text] = x + round(self._font.getlength(text, mode="1"))
+
+    def _build_glyphs(self, image_mod: Any, draw_mod: Any) -> None:
+        """Render each GLYPH_CHARS character once into a 1-bit mask."""
+        font = self._font
+        height = max(font.getbbox(ch, mode="1")[3] for ch in GLYPH_CHARS) + 1
+        for ch in GLYPH_CHARS:
+            advance = round(font.getlength(ch, mode="1"))
+            width = max(font.getbbox(ch, mode="1")[2], advance) + 2 * GLYPH_PAD
+            mask = image_mod.new("1", (width, height))
+            draw_mod.Draw(mask).text((GLYPH_PAD, 0), ch, font=font, fill=255)
+            self._glyphs[ch] = (mask, advance)
 
     def _draw_text(
         self, x: int, y: int, text: str, inverted: bool = False
     ) -> None:
         """Draw text, optionally inverted (white bg, black text)."""
         if inverted:
-            bbox = self._font.getbbox(text)
-            w = bbox[2] - bbox[0]
-            h = bbox[3] - bbox[1]
+            size = self._bbox_cache.get(text)
+            if size is None:
+                bbox = self._font.getbbox(text)
+                size = self._bbox_cache[text] = (bbox[2] - bbox[0], bbox[3] - bbox[1])
+            w, h = size
             self._draw.rectangle((x, y, x + w + 1, y + h + 3), fill=255)
-            self._draw.text((x + 1, y), text, font=self._font, fill=0)
+            self._blit_text(x + 1, y, text, 0)
         else:
-            self._draw.text((x, y), text, font=self._font, fill=255)
+            self._blit_text(x, y, text, 255)
+
+    def _blit_text(self, x: int, y: int, text: str, fill: int) -> None:
+        """Paste pre-rendered glyphs for text, falling back to draw.text."""
+        glyphs = self._glyphs
+        if not all(ch in glyphs for ch in text):
+            self._draw.text((x, y), text, font=self._font, fill=fill)
+            return
+        paste = self._image.paste
+        x -= GLYPH_PAD
+        for ch in text:
+            mask, advance = glyphs[ch]
+            paste(fill, (x, y), mask)
+            x += advance
 
     def _render(self) -> None:
         """Fetch status from engine and draw 4 lines to the OLED."""
         if not self._display or not self._draw:
             return
 
-        status = self.engine.get_status()
+        # Read every field once up front; the drawing below only touches locals
+        s = self.engine.get_status()
+        gps_connected = s["gps_available"]
+        gps_fix = s["gps_has_fix"]
+        sats = s["satellites"]
+        speed = s["speed_kmh"]
+        peak_g = s.get("peak_g", 0.0)
+        events = s["events_captured"]
+        recording = s["recording"]
+        imu_ok = s["imu_ok"]
+        env_ok = s["env_ok"]
+        net_ok = s["net_connected"]
+        backlog = s["sync_backlog"]
+        cpu_temp = s["cpu_temp"]
+        dt = self._draw_text
+        vx = self._value_x
 
-        # Clear
-        self._draw.rectangle((0, 0, 127, 63), fill=0)
+        # Clear to the static labels
+        self._image.paste(self._chrome)
 
         # Line 1: GPS + speed
         #   gpsd down       → inverted "GPS:---"
         #   gpsd up, no fix → inverted "GPS:NO FIX"
         #   has fix         → normal "GPS:5sat  45km/h"
-        gps_connected = status["gps_available"]
-        gps_fix = status["gps_has_fix"]
+        # The inverted variants paint over the chrome "GPS:" label.
         if gps_fix:
-            sats = status["satellites"]
-            sat_str = f"GPS:{sats}sat" if sats is not None else "GPS:OK"
-            speed = status["speed_kmh"]
-            speed_str = f"{speed:.0f}km/h" if speed else "0km/h"
-            self._draw_text(0, 0, sat_str)
-            self._draw_text(90, 0, speed_str)
+            dt(vx["GPS:"], 0, f"{sats}sat" if sats is not None else "OK")
+            dt(90, 0, f"{speed:.0f}km/h" if speed else "0km/h")
         elif gps_connected:
-            self._draw_text(0, 0, "GPS:NO FIX", inverted=True)
+            dt(0, 0, "GPS:NO FIX", inverted=True)
         else:
-            self._draw_text(0, 0, "GPS:---", inverted=True)
+            dt(0, 0, "GPS:---", inverted=True)
 
         # Line 2: peak G, event count, recording — REC inverted when active
-        peak_g = status.get("peak_g", 0.0)
-        events = status["events_captured"]
-        recording = status["recording"]
-        self._draw_text(0, 16, f"{peak_g:.1f}g")
-        self._draw_text(42, 16, f"EVT:{events}")
+        dt(0, 16, f"{peak_g:.1f}g")
+        dt(vx["EVT:"], 16, str(events))
         if recording:
-            self._draw_text(96, 16, "REC", inverted=True)
+            dt(96, 16, "REC", inverted=True)
 
         # Line 3: sensor health — each inverted when failed
-        imu_ok = status["imu_ok"]
-        env_ok = status["env_ok"]
-        self._draw_text(0, 32, "IMU", inverted=not imu_ok)
-        self._draw_text(44, 32, "ENV", inverted=not env_ok)
+        dt(0, 32, "IMU", inverted=not imu_ok)
+        dt(44, 32, "ENV", inverted=not env_ok)
 
         # Line 4: network, sync backlog, CPU temp — NET inverted when down
-        net_ok = status["net_connected"]
-        backlog = status["sync_backlog"]
-        cpu_temp = status["cpu_temp"]
-        temp_str = f"{cpu_temp:.0f}C" if cpu_temp is not None else "---"
-        self._draw_text(0, 48, "NET", inverted=not net_ok)
-        self._draw_text(36, 48, f"BKL:{backlog}")
-        self._draw_text(96, 48, temp_str)
-
-        self._display.image(self._image)
-        self._display.show()
+        dt(0, 48, "NET", inverted=not net_ok)
+        dt(vx["BKL:"], 48, str(backlog))
+        dt(96, 48, f"{cpu_temp:.0f}C" if cpu_temp is not None else "---")
+
+        self._flush(self._frame_bytes())
+
+    def _frame_bytes(self) -> bytes:
+        """Convert the PIL image to SSD1306 RAM order without a per-pixel loop.
+
+        Transposing makes each image row one display column; tobytes() then
+        packs it into 8 page bytes, and the bit reversal puts the top pixel
+        of each page in bit 0.
+        """
+        return self._image.transpose(self._transpose).tobytes().translate(_BIT_REVERSE)
+
+    def _flush(self, frame: bytes) -> None:
+        """Send only the 8-row pages that changed since the last frame.
+
+        Each run of consecutive changed pages goes out as one I2C burst, so a
+        full redraw is a single 1024-byte write.
+
+        Args:
+            frame: Column-major frame from _frame_bytes().
+        """
+        prev = self._prev_frame
+        run_start: Optional[int] = None
+        for page in range(PAGES + 1):
+            changed = page < PAGES and frame[page::PAGES] != prev[page::PAGES]
+            if changed and run_start is None:
+                run_start = page
+            elif not changed and run_start is not None:
+                self._write_pages(frame, run_start, page - 1)
+                run_start = None
+        self._prev_frame = frame
+
+    def _write_pages(self, frame: bytes, first: int, last: int) -> None:
+        """Write pages first..last of the frame as a single I2C burst.
+
+        The payload is copied into the preallocated _i2c_buf behind its
+        control byte, so no new buffer is built per write.
+        """
+        buf = self._i2c_buf
+        run = last - first + 1
+        end = 1 + WIDTH * run
+        if run == PAGES:
+            buf[1:] = frame
+        elif run == 1:
+            buf[1:end] = frame[first::PAGES]
+        else:
+            # Vertical addressing walks first..last within each column in turn
+            for x in range(WIDTH):
+                src = x * PAGES + first
+                dst = 1 + x * run
+                buf[dst:dst + run] = frame[src:src + run]
+
+        display = self._display
+        for cmd in (SET_COL_ADDR, 0, WIDTH - 1, SET_PAGE_ADDR, first, last):
+            display.write_cmd(cmd)
+        with display.i2c_device:
+            display.i2c_device.write(buf, end=end)
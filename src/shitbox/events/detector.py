@@ -1,7 +1,6 @@
 """Event detection from high-rate IMU data."""
 
 import math
-import time
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Callable, Dict, List, Optional
@@ -23,6 +22,16 @@ class EventType(Enum):
     BOOT = "boot"
 
 
+# Event types the detector tracks, and their slot in its per-type state lists
+_TRACKED_TYPES = (
+    EventType.HARD_BRAKE,
+    EventType.BIG_CORNER,
+    EventType.HIGH_G,
+    EventType.ROUGH_ROAD,
+)
+_HARD_BRAKE, _BIG_CORNER, _HIGH_G, _ROUGH_ROAD = range(len(_TRACKED_TYPES))
+
+
 @dataclass
 class Event:
     """A detected driving event."""
@@ -127,24 +136,54 @@ class EventDetector:
         self.config = config or DetectorConfig()
         self.on_event = on_event
 
-        # Active event tracking
-        self._active_events: Dict[EventType, dict] = {}
-
-        # Cooldown tracking (last event time per type)
-        self._last_event_time: Dict[EventType, float] = {}
+        # Active event state, one slot per _TRACKED_TYPES entry. Parallel
+        # lists rather than a dict per event: no allocation or hashing per sample.
+        n = len(_TRACKED_TYPES)
+        self._active: List[bool] = [False] * n
+        self._start_time: List[float] = [0.0] * n
+        self._peak_value: List[float] = [0.0] * n
+        self._peak_ax: List[float] = [0.0] * n
+        self._peak_ay: List[float] = [0.0] * n
+        self._peak_az: List[float] = [0.0] * n
+
+        # Cooldown tracking (end time of the last event per slot)
+        self._last_event_time: List[float] = [0.0] * n
+
+        # Minimum duration per slot, in _TRACKED_TYPES order
+        self._min_duration_ms: List[float] = [
+            self.config.hard_brake_min_duration_ms,
+            self.config.big_corner_min_duration_ms,
+            self.config.high_g_min_duration_ms,
+            self.config.rough_road_window_ms,
+        ]
 
         # Stats
         self.events_detected: Dict[EventType, int] = {t: 0 for t in EventType}
 
-        # Rolling window for rough road detection
-        self._az_window: List[float] = []
-        self._az_window_size = int(
-            self.config.rough_road_window_ms / 10
+        # Thresholds cached as plain floats for the per-sample hot path
+        self._hb_thr = self.config.hard_brake_threshold_g
+        self._bc_thr = self.config.big_corner_threshold_g
+        self._hg_thr_sq = self.config.high_g_threshold ** 2
+        self._rr_thr_sq = self.config.rough_road_threshold_stddev ** 2
+
+        # Rolling window for rough road detection: preallocated circular
+        # buffer with running sum / sum-of-squares so stddev is O(1)
+        self._az_window_size = max(
+            int(self.config.rough_road_window_ms / 10), 1
         )  # Assuming ~100 Hz
+        self._az_buf: List[float] = [0.0] * self._az_window_size
+        self._az_idx = 0
+        self._az_count = 0
+        self._az_sum = 0.0
+        self._az_sumsq = 0.0
 
     def process_sample(self, sample: IMUSample) -> Optional[Event]:
         """Process a new sample and check for events.
 
+        All four detectors run in a single pass: each sample field is read
+        once and an event's state is only touched when its threshold is
+        crossed or it is already active.
+
         Args:
             sample: New IMU sample.
 
@@ -152,72 +191,102 @@ class EventDetector:
             Completed Event if one just ended, None otherwise.
         """
         completed_event = None
-
-        # Check each event type
-        completed_event = self._check_hard_brake(sample) or completed_event
-        completed_event = self._check_big_corner(sample) or completed_event
-        completed_event = self._check_high_g(sample) or completed_event
-        completed_event = self._check_rough_road(sample) or completed_event
+        active = self._active
+        ax = sample.ax
+        ay = sample.ay
+
+        # Hard braking (strong negative ax)
+        if ax < self._hb_thr:
+            if active[_HARD_BRAKE]:
+                self._update_event(_HARD_BRAKE, sample, ax)
+            else:
+                self._start_event(_HARD_BRAKE, sample, ax)
+        elif active[_HARD_BRAKE]:
+            completed_event = self._end_event(_HARD_BRAKE, sample)
+
+        # Big corner (strong lateral ay)
+        if ay > self._bc_thr or -ay > self._bc_thr:
+            if active[_BIG_CORNER]:
+                self._update_event(_BIG_CORNER, sample, ay)
+            else:
+                self._start_event(_BIG_CORNER, sample, ay)
+        elif active[_BIG_CORNER]:
+            completed_event = self._end_event(_BIG_CORNER, sample) or completed_event
+
+        # High combined lateral/longitudinal g — squared compare; the sqrt is
+        # only taken when the magnitude is stored on an active or new event
+        combined_g_sq = ax * ax + ay * ay
+        if combined_g_sq > self._hg_thr_sq:
+            if active[_HIGH_G]:
+                self._update_event(_HIGH_G, sample, math.sqrt(combined_g_sq))
+            elif not self._is_on_cooldown(_HIGH_G, sample.timestamp):
+                self._start_event(_HIGH_G, sample, math.sqrt(combined_g_sq))
+        elif active[_HIGH_G]:
+            completed_event = self._end_event(_HIGH_G, sample) or completed_event
+
+        # Rough road (high variance in az) — variance against threshold squared;
+        # the stddev is only taken when it is stored as the event's peak value
+        variance = self._update_az_window(sample.az)
+        if variance is not None:
+            if variance > self._rr_thr_sq:
+                if active[_ROUGH_ROAD]:
+                    self._update_event(_ROUGH_ROAD, sample, math.sqrt(variance))
+                else:
+                    self._start_event(_ROUGH_ROAD, sample, math.sqrt(variance))
+            elif active[_ROUGH_ROAD]:
+                completed_event = self._end_event(_ROUGH_ROAD, sample) or completed_event
 
         return completed_event
 
-    def _is_on_cooldown(self, event_type: EventType) -> bool:
-        """Check if event type is in cooldown period."""
-        last_time = self._last_event_time.get(event_type, 0)
-        return (time.time() - last_time) < self.config.cooldown_seconds
+    def _is_on_cooldown(self, slot: int, now: float) -> bool:
+        """Check if an event type is in cooldown period.
+
+        Args:
+            slot: Index of the event type in _TRACKED_TYPES.
+            now: Timestamp of the current sample, the same clock the
+                last event end time was recorded on.
+        """
+        return (now - self._last_event_time[slot]) < self.config.cooldown_seconds
 
-    def _start_event(
-        self, event_type: EventType, sample: IMUSample, trigger_value: float
-    ) -> None:
+    def _start_event(self, slot: int, sample: IMUSample, trigger_value: float) -> None:
         """Start tracking a potential event."""
-        if event_type in self._active_events:
+        if self._active[slot]:
             return  # Already tracking
 
-        if self._is_on_cooldown(event_type):
+        if self._is_on_cooldown(slot, sample.timestamp):
             return
 
-        self._active_events[event_type] = {
-            "start_time": sample.timestamp,
-            "samples": [sample],
-            "peak_value": abs(trigger_value),
-            "peak_ax": sample.ax,
-            "peak_ay": sample.ay,
-            "peak_az": sample.az,
-        }
+        self._active[slot] = True
+        self._start_time[slot] = sample.timestamp
+        self._peak_value[slot] = abs(trigger_value)
+        self._peak_ax[slot] = sample.ax
+        self._peak_ay[slot] = sample.ay
+        self._peak_az[slot] = sample.az
 
-    def _update_event(
-        self, event_type: EventType, sample: IMUSample, current_value: float
-    ) -> None:
+    def _update_event(self, slot: int, sample: IMUSample, current_value: float) -> None:
         """Update an active event with new sample."""
-        if event_type not in self._active_events:
+        if not self._active[slot]:
             return
 
-        event = self._active_events[event_type]
-        event["samples"].append(sample)
+        value = abs(current_value)
+        if value > self._peak_value[slot]:
+            self._peak_value[slot] = value
+            self._peak_ax[slot] = sample.ax
+            self._peak_ay[slot] = sample.ay
+            self._peak_az[slot] = sample.az
 
-        if abs(current_value) > event["peak_value"]:
-            event["peak_value"] = abs(current_value)
-            event["peak_ax"] = sample.ax
-            event["peak_ay"] = sample.ay
-            event["peak_az"] = sample.az
-
-    def _end_event(self, event_type: EventType, sample: IMUSample) -> Optional[Event]:
+    def _end_event(self, slot: int, sample: IMUSample) -> Optional[Event]:
         """End an active event and return it if valid."""
-        if event_type not in self._active_events:
+        if not self._active[slot]:
             return None
 
-        event_data = self._active_events.pop(event_type)
-        duration_ms = (sample.timestamp - event_data["start_time"]) * 1000
+        self._active[slot] = False
+        event_type = _TRACKED_TYPES[slot]
+        start_time = self._start_time[slot]
+        duration_ms = (sample.timestamp - start_time) * 1000
 
         # Check minimum duration
-        min_duration = {
-            EventType.HARD_BRAKE: self.config.hard_brake_min_duration_ms,
-            EventType.BIG_CORNER: self.config.big_corner_min_duration_ms,
-            EventType.HIGH_G: self.config.high_g_min_duration_ms,
-            EventType.ROUGH_ROAD: self.config.rough_road_window_ms,
-        }.get(event_type, 0)
-
-        if duration_ms < min_duration:
+        if duration_ms < self._min_duration_ms[slot]:
             return None
 
         # Get pre-event samples from ring buffer
@@ -228,18 +297,18 @@ class EventDetector:
         # Create event
         event = Event(
             event_type=event_type,
-            start_time=event_data["start_time"],
+            start_time=start_time,
             end_time=sample.timestamp,
-            peak_value=event_data["peak_value"],
-            peak_ax=event_data["peak_ax"],
-            peak_ay=event_data["peak_ay"],
-            peak_az=event_data["peak_az"],
+            peak_value=self._peak_value[slot],
+            peak_ax=self._peak_ax[slot],
+            peak_ay=self._peak_ay[slot],
+            peak_az=self._peak_az[slot],
             samples=pre_samples,
         )
 
         # Update stats and cooldown
         self.events_detected[event_type] += 1
-        self._last_event_time[event_type] = sample.timestamp
+        self._last_event_time[slot] = sample.timestamp
 
         log.info(
             "event_detected",
@@ -253,75 +322,34 @@ class EventDetector:
 
         return event
 
-    def _check_hard_brake(self, sample: IMUSample) -> Optional[Event]:
-        """Check for hard braking (strong negative ax)."""
-        event_type = EventType.HARD_BRAKE
-        threshold = self.config.hard_brake_threshold_g
-
-        if sample.ax < threshold:
-            if event_type not in self._active_events:
-                self._start_event(event_type, sample, sample.ax)
-            else:
-                self._update_event(event_type, sample, sample.ax)
-            return None
-        else:
-            return self._end_event(event_type, sample)
-
-    def _check_big_corner(self, sample: IMUSample) -> Optional[Event]:
-        """Check for big corner (strong lateral ay)."""
-        event_type = EventType.BIG_CORNER
-        threshold = self.config.big_corner_threshold_g
+    def _update_az_window(self, az: float) -> Optional[float]:
+        """Push az into the rolling window and return its variance.
 
-        if abs(sample.ay) > threshold:
-            if event_type not in self._active_events:
-                self._start_event(event_type, sample, sample.ay)
-            else:
-                self._update_event(event_type, sample, sample.ay)
-            return None
-        else:
-            return self._end_event(event_type, sample)
-
-    def _check_high_g(self, sample: IMUSample) -> Optional[Event]:
-        """Check for high combined lateral/longitudinal g."""
-        event_type = EventType.HIGH_G
-        threshold = self.config.high_g_threshold
-
-        combined_g = math.sqrt(sample.ax ** 2 + sample.ay ** 2)
-
-        if combined_g > threshold:
-            if event_type not in self._active_events:
-                self._start_event(event_type, sample, combined_g)
-            else:
-                self._update_event(event_type, sample, combined_g)
-            return None
+        Returns None until the window is full.
+        """
+        size = self._az_window_size
+        idx = self._az_idx
+        old = self._az_buf[idx]
+        self._az_buf[idx] = az
+        idx += 1
+        if idx == size:
+            idx = 0
+        self._az_idx = idx
+
+        if self._az_count < size:
+            self._az_count += 1
+            self._az_sum += az
+            self._az_sumsq += az * az
+            if self._az_count < size:
+                return None
+        elif idx == 0:
+            # Recompute once per lap so running-sum float drift cannot accumulate
+            self._az_sum = sum(self._az_buf)
+            self._az_sumsq = sum(z * z for z in self._az_buf)
         else:
-            return self._end_event(event_type, sample)
+            self._az_sum += az - old
+            self._az_sumsq += az * az - old * old
 
-    def _check_rough_road(self, sample: IMUSample) -> Optional[Event]:
-        """Check for rough road (high variance in az)."""
-        event_type = EventType.ROUGH_ROAD
-        threshold = self.config.rough_road_threshold_stddev
-
-        # Maintain rolling window of az values
-        self._az_window.append(sample.az)
-        if len(self._az_window) > self._az_window_size:
-            self._az_window.pop(0)
-
-        if len(self._az_window) < self._az_window_size:
-            return None  # Not enough data yet
-
-        # Calculate standard deviation
-        mean_az = sum(self._az_window) / len(self._az_window)
-        variance = sum((z - mean_az) ** 2 for z in self._az_window) / len(
-            self._az_window
-        )
-        stddev = math.sqrt(variance)
-
-        if stddev > threshold:
-            if event_type not in self._active_events:
-                self._start_event(event_type, sample, stddev)
-            else:
-                self._update_event(event_type, sample, stddev)
-            return None
-        else:
-            return self._end_event(event_type, sample)
+        mean_az = self._az_sum / size
+        variance = self._az_sumsq / size - mean_az * mean_az
+        return variance if variance > 0.0 else 0.0
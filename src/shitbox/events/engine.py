@@ -9,8 +9,17 @@ Low-rate path (1 Hz):
 - GPS, IMU snapshot, temperature → SQLite → MQTT → Prometheus batch sync
 """
 
+import ctypes
+import ctypes.util
+import functools
+import itertools
+import json
+import math
+import os
+import queue
 import shutil
 import signal
+import socket
 import threading
 import time
 from dataclasses import dataclass, field
@@ -18,10 +27,12 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Optional
 
+import requests
+
 from shitbox.capture import buzzer, overlay, speaker
 from shitbox.capture.button import ButtonHandler
 from shitbox.capture.ring_buffer import VideoRingBuffer
-from shitbox.capture.video import VideoRecorder
+from shitbox.capture.video import VideoRecorder, capture_date_dir
 from shitbox.display.oled import OLEDDisplayService
 from shitbox.events.detector import DetectorConfig, Event, EventDetector, EventType
 from shitbox.events.ring_buffer import IMUSample, RingBuffer
@@ -37,6 +48,7 @@ from shitbox.sync.capture_sync import CaptureSyncService
 from shitbox.sync.connection import ConnectionMonitor
 from shitbox.sync.grafana import GrafanaAnnotator
 from shitbox.sync.mqtt_publisher import MQTTPublisher
+from shitbox.sync.prometheus_write import REMOTE_WRITE_HEADERS, encode_remote_write
 from shitbox.utils.config import (
     CaptureSyncConfig,
     Config,
@@ -45,12 +57,43 @@ from shitbox.utils.config import (
     load_config,
 )
 from shitbox.utils.logging import get_logger, setup_logging
+from shitbox.utils.priority import lower_thread_priority
 
 log = get_logger(__name__)
 
+# systemd sets these before exec and never changes them for the life of the process
+NOTIFY_SOCKET = os.environ.get("NOTIFY_SOCKET")
+WATCHDOG_USEC = os.environ.get("WATCHDOG_USEC")
+
 # Trip tracking constants
 TRIP_PERSIST_INTERVAL_S = 60.0
 AEST_OFFSET = timedelta(hours=10)
+EARTH_RADIUS_KM = 6371.0
+WAYPOINT_REACHED_KM = 5.0
+# Great-circle distance is never less than the latitude difference, so a
+# waypoint further than this many degrees north or south cannot be in range
+WAYPOINT_LAT_WINDOW_DEG = math.degrees(WAYPOINT_REACHED_KM / EARTH_RADIUS_KM)
+LOCATION_MOVE_KM = 1.0
+# gpsd reports older than this are treated as no fix (device unplugged, gpsd
+# stalled) rather than replayed as the current position
+GPSD_REPORT_MAX_AGE_S = 3.0
+# Place lookups are cached per grid cell of 1/200 degree (~500 m)
+GEOCACHE_CELLS_PER_DEGREE = 200
+GEOCACHE_MAX_ENTRIES = 256
+KM_PER_DEGREE = math.radians(EARTH_RADIUS_KM)
+
+
+def _watchdog_interval_s(watchdog_usec: Optional[str]) -> float:
+    """Return how often to ping the systemd watchdog.
+
+    systemd asks for pings at half of WatchdogSec (passed as WATCHDOG_USEC);
+    without it, fall back to once a second.
+    """
+    try:
+        usec = int(watchdog_usec or 0)
+    except ValueError:
+        usec = 0
+    return max(1.0, usec / 2_000_000) if usec > 0 else 1.0
 
 
 def _current_aest_date() -> str:
@@ -58,6 +101,17 @@ def _current_aest_date() -> str:
     return (datetime.now(timezone.utc) + AEST_OFFSET).strftime("%Y-%m-%d")
 
 
+@dataclass(slots=True)
+class PendingCapture:
+    """An event between detection and the end of its video save."""
+
+    event: Event
+    capture_until: float  # time.monotonic() when the post-event window closes
+    awaiting_video: bool = False  # A ring buffer save will report back
+    video_path: Optional[Path] = None  # Set if the save finishes first
+    json_path: Optional[Path] = None  # Set once the event is on disk
+
+
 @dataclass
 class EngineConfig:
     """Configuration for the unified engine."""
@@ -170,14 +224,16 @@ class EngineConfig:
     oled_i2c_bus: int = 1
     oled_i2c_address: int = 0x3C
     oled_update_interval: float = 1.0
+    oled_min_interval: float = 0.2
+    oled_i2c_frequency_hz: int = 400_000
 
     # Speaker (USB TTS)
     speaker_enabled: bool = False
     speaker_model_path: str = "/var/lib/shitbox/tts/en_US-lessac-medium.onnx"
     speaker_distance_announce_interval_km: float = 50.0
 
-    # Route waypoints (WaypointConfig objects loaded from YAML)
-    route_waypoints: list = field(default_factory=list)
+    # Route waypoints (WaypointConfig objects loaded from YAML, read-only)
+    route_waypoints: tuple = ()
 
     @classmethod
     def from_yaml_config(cls, config: Config) -> "EngineConfig":
@@ -269,6 +325,8 @@ class EngineConfig:
             oled_i2c_bus=config.display.oled.i2c_bus,
             oled_i2c_address=config.display.oled.address,
             oled_update_interval=config.display.oled.update_interval_seconds,
+            oled_min_interval=config.display.oled.min_interval_seconds,
+            oled_i2c_frequency_hz=config.display.oled.i2c_frequency_hz,
             # Speaker
             speaker_enabled=config.capture.speaker.enabled,
             speaker_model_path=config.capture.speaker.model_path,
@@ -276,7 +334,7 @@ class EngineConfig:
                 config.capture.speaker.distance_announce_interval_km
             ),
             # Route waypoints
-            route_waypoints=config.sensors.gps.route.waypoints,
+            route_waypoints=tuple(config.sensors.gps.route.waypoints),
         )
 
 
@@ -301,6 +359,13 @@ class UnifiedEngine:
             sample_rate_hz=config.imu_sample_rate_hz,
         )
 
+        self.detector = EventDetector(
+            ring_buffer=self.ring_buffer,
+            config=config.detector,
+            on_event=self._on_event,
+        )
+
+        # The sampler calls the detector directly: no engine hop per sample
         self.sampler = HighRateSampler(
             ring_buffer=self.ring_buffer,
             i2c_bus=config.i2c_bus,
@@ -308,13 +373,7 @@ class UnifiedEngine:
             sample_rate_hz=config.imu_sample_rate_hz,
             accel_range=config.accel_range,
             gyro_range=config.gyro_range,
-            on_sample=self._on_imu_sample,
-        )
-
-        self.detector = EventDetector(
-            ring_buffer=self.ring_buffer,
-            config=config.detector,
-            on_event=self._on_event,
+            on_sample=self.detector.process_sample,
         )
 
         self.event_storage = EventStorage(
@@ -329,10 +388,24 @@ class UnifiedEngine:
 
         # Low-rate components
         self.database = Database(config.database_path)
+        self._data_dir = str(self.database.db_path.parent)
 
-        # GPS collector (lazy init)
-        self._gps = None
+        # GPS: one watched gpsd connection, opened by _init_gps()
         self._gps_available = False
+        self._gpsd_sock: Optional[socket.socket] = None
+        self._gpsd_buffer = b""
+        self._gpsd_tpv: Optional[dict] = None
+        self._gpsd_tpv_time = 0.0
+        self._gpsd_satellites: Optional[int] = None
+
+        # systemd notifications: one datagram socket, connected on first use
+        self._notify_sock: Optional[socket.socket] = None
+
+        # One I2C bus object for every Blinka device, rather than a driver
+        # handle and lock per device
+        self.i2c: Any = None
+        if config.power_enabled or config.environment_enabled or config.oled_enabled:
+            self.i2c = self._open_i2c()
 
         # Power collector (lazy init)
         self._power_collector = None
@@ -346,7 +419,7 @@ class UnifiedEngine:
                     i2c_bus=config.i2c_bus,
                     address=config.power_i2c_address,
                 )
-                self._power_collector = PowerCollector(power_config)
+                self._power_collector = PowerCollector(power_config, i2c=self.i2c)
             except Exception as e:
                 log.error("power_collector_init_failed", error=str(e))
 
@@ -362,7 +435,9 @@ class UnifiedEngine:
                     i2c_bus=config.i2c_bus,
                     address=config.environment_i2c_address,
                 )
-                self._environment_collector = EnvironmentCollector(env_config)
+                self._environment_collector = EnvironmentCollector(
+                    env_config, i2c=self.i2c
+                )
             except Exception as e:
                 log.error("environment_collector_init_failed", error=str(e))
 
@@ -442,16 +517,19 @@ class UnifiedEngine:
         # Health collector (wired in start() once batch_sync is known)
         self._health_collector: Optional[HealthCollector] = None
 
-        # OLED display
+        # OLED display, and the notify-driven fields it last showed
         self.oled_display: Optional[OLEDDisplayService] = None
+        self._last_display_status: Optional[tuple] = None
         if config.oled_enabled:
             oled_config = OLEDConfig(
                 enabled=True,
                 i2c_bus=config.oled_i2c_bus,
                 address=config.oled_i2c_address,
                 update_interval_seconds=config.oled_update_interval,
+                min_interval_seconds=config.oled_min_interval,
+                i2c_frequency_hz=config.oled_i2c_frequency_hz,
             )
-            self.oled_display = OLEDDisplayService(oled_config, self)
+            self.oled_display = OLEDDisplayService(oled_config, self, i2c=self.i2c)
 
         # Manual capture components
         self.button_handler: Optional[ButtonHandler] = None
@@ -490,13 +568,21 @@ class UnifiedEngine:
 
         # State
         self._running = False
+        # Set by stop() and the signal handlers so sleeping loops wake at once
+        self._stop_event = threading.Event()
         self._telemetry_thread: Optional[threading.Thread] = None
-        self._pending_post_capture: dict = {}
-        self._event_json_paths: dict[int, Path] = {}
-        self._event_video_paths: dict[int, Path] = {}
+        # Captures still in their post-event window, then (if a video save
+        # is outstanding) saved captures waiting for it, by capture id
+        self._pending_post_capture: dict[int, PendingCapture] = {}
+        self._awaiting_video: dict[int, PendingCapture] = {}
+        # Guards both maps: video callbacks arrive on ring buffer threads
+        self._capture_lock = threading.Lock()
+        self._capture_ids = itertools.count(1)
+        # Set by any thread that changes a saved event; events.json is
+        # rebuilt once from the telemetry thread in _check_post_captures()
+        self._events_json_dirty = False
         self._manual_capture_count = 0
         self._last_timelapse_time = 0.0
-        self._last_wal_checkpoint: float = 0.0
         self._current_speed_kmh = 0.0
         self._current_lat: Optional[float] = None
         self._current_lon: Optional[float] = None
@@ -523,6 +609,8 @@ class UnifiedEngine:
         self._last_location_resolve_time: float = 0.0
         self._last_resolved_lat: Optional[float] = None
         self._last_resolved_lon: Optional[float] = None
+        # (lat cell, lon cell) -> (label, place lat, place lon); geocoder thread only
+        self._geocache: dict[tuple[int, int], tuple[str, float, float]] = {}
         self._reverse_geocoder: Any = None
         try:
             import reverse_geocoder as rg
@@ -530,9 +618,17 @@ class UnifiedEngine:
             log.info("reverse_geocoder_available")
         except ImportError:
             log.warning("reverse_geocoder_not_installed")
+        # Lookups run on their own thread. The telemetry loop queues the
+        # position and moves on; while a lookup is pending, later requests
+        # are dropped rather than queued behind it.
+        self._geocode_queue: queue.Queue = queue.Queue(maxsize=1)
+        self._geocode_thread: Optional[threading.Thread] = None
+        self._wal_checkpoint_thread: Optional[threading.Thread] = None
 
         # Stats
         self.telemetry_readings = 0
+        self._reading_batch: list[Reading] = []
+        self._last_reading_flush = 0.0
         self.events_captured = 0
         self.timelapse_images = 0
 
@@ -541,6 +637,20 @@ class UnifiedEngine:
         self._last_sample_count = 0
         self._health_failures = 0
         self._engine_start_time = 0.0
+        self._health_thread: Optional[threading.Thread] = None
+
+    def _open_i2c(self) -> Any:
+        """Open the shared I2C bus, or return None so devices open their own."""
+        try:
+            import board
+            import busio
+
+            return busio.I2C(
+                board.SCL, board.SDA, frequency=self.config.oled_i2c_frequency_hz
+            )
+        except Exception as e:
+            log.warning("shared_i2c_init_failed", error=str(e))
+            return None
 
     def _init_gps(self) -> bool:
         """Initialise GPS connection."""
@@ -548,9 +658,7 @@ class UnifiedEngine:
             return False
 
         try:
-            import gpsd
-            gpsd.connect(host=self.config.gps_host, port=self.config.gps_port)
-            self._gps = gpsd
+            self._ensure_gpsd_socket()
             self._gps_available = True
             log.info("gps_connected", host=self.config.gps_host)
             return True
@@ -596,24 +704,21 @@ class UnifiedEngine:
                     return True
             except Exception as e:
                 log.debug("gps_fix_poll_error", error=str(e))
-            time.sleep(1)
+            if self._stop_event.wait(1.0):
+                return False
 
         log.warning("gps_fix_timeout_at_startup", waited_seconds=max_wait)
         return False
 
-    def _on_imu_sample(self, sample: IMUSample) -> None:
-        """Called for each high-rate IMU sample."""
-        self.detector.process_sample(sample)
-
     # Event types that should trigger video recording
-    VIDEO_CAPTURE_EVENTS = {
+    VIDEO_CAPTURE_EVENTS = frozenset({
         EventType.HARD_BRAKE,
         EventType.HIGH_G,
         EventType.BIG_CORNER,
         EventType.ROUGH_ROAD,
         EventType.MANUAL_CAPTURE,
         EventType.BOOT,
-    }
+    })
 
     # Health watchdog
     HEALTH_CHECK_INTERVAL = 30.0
@@ -621,9 +726,18 @@ class UnifiedEngine:
     DISK_LOW_PCT = 10.0
     DISK_CRITICAL_PCT = 5.0
 
+    # Boot metric: how long to wait for recovery and then for the uplink
+    BOOT_METRIC_WAIT_S = 30.0
+
     # WAL checkpoint interval (5 minutes)
     WAL_CHECKPOINT_INTERVAL_S = 300.0
 
+    # Telemetry rows are buffered and written in one transaction per window
+    TELEMETRY_FLUSH_INTERVAL_S = 10.0
+    # Rows kept for retry after a failed write (a few windows' worth); the
+    # oldest are dropped beyond this
+    TELEMETRY_RETRY_MAX_ROWS = 300
+
     # Timelapse gap watchdog: alert if 3x interval passes with no capture
     TIMELAPSE_GAP_FACTOR = 3
 
@@ -634,18 +748,22 @@ class UnifiedEngine:
         # (e.g. hard brake → high G → hard brake) produce one video, not many.
         # Manual captures also extend rather than starting overlapping saves.
         # Boot events always go through (only fires once).
-        if self._pending_post_capture and event.event_type != EventType.BOOT:
-            # Extend the post-capture window of the most recent pending event
-            extension = self.config.detector.post_event_seconds
-            for pending in self._pending_post_capture.values():
-                new_until = time.monotonic() + extension
-                if new_until > pending["capture_until"]:
-                    pending["capture_until"] = new_until
+        with self._capture_lock:
+            suppressed = bool(self._pending_post_capture) and event.event_type != EventType.BOOT
+            if suppressed:
+                # Extend the post-capture window of the most recent pending event
+                extension = self.config.detector.post_event_seconds
+                for pending in self._pending_post_capture.values():
+                    new_until = time.monotonic() + extension
+                    if new_until > pending.capture_until:
+                        pending.capture_until = new_until
+                pending_count = len(self._pending_post_capture)
+        if suppressed:
             log.info(
                 "event_suppressed_capture_active",
                 suppressed_type=event.event_type.value,
                 peak_g=round(event.peak_value, 2),
-                pending_count=len(self._pending_post_capture),
+                pending_count=pending_count,
             )
             return
 
@@ -658,7 +776,11 @@ class UnifiedEngine:
         event.distance_to_destination_km = self._distance_to_destination_km
 
         # Start video recording/save for significant events
-        video_path = None
+        capture_id = next(self._capture_ids)
+        pending = PendingCapture(
+            event=event,
+            capture_until=time.monotonic() + self.config.detector.post_event_seconds,
+        )
         if event.event_type in self.VIDEO_CAPTURE_EVENTS:
             if self.video_ring_buffer and self.video_ring_buffer.is_running:
                 # Skip boot capture if buffer has no complete segments
@@ -675,13 +797,14 @@ class UnifiedEngine:
 
                 buzzer.beep_capture_start()
                 speaker.speak_capture_start(event.event_type.value)
-                eid = id(event)
+                # Register before the save starts so its callback finds it
+                pending.awaiting_video = True
+                with self._capture_lock:
+                    self._pending_post_capture[capture_id] = pending
                 self.video_ring_buffer.save_event(
                     prefix=event.event_type.value,
                     post_seconds=int(self.config.capture_post_seconds),
-                    callback=lambda path, _eid=eid: self._on_video_complete(
-                        _eid, path
-                    ),
+                    callback=functools.partial(self._on_video_complete, capture_id),
                 )
                 log.info(
                     "auto_event_video_save_triggered",
@@ -692,6 +815,7 @@ class UnifiedEngine:
                     duration_seconds=self.config.capture_video_duration,
                     filename_prefix=event.event_type.value,
                 )
+                pending.video_path = video_path
                 log.info(
                     "auto_event_video_started",
                     event_type=event.event_type.value,
@@ -699,27 +823,22 @@ class UnifiedEngine:
                 )
 
         # Schedule post-event capture
-        post_capture_until = time.monotonic() + self.config.detector.post_event_seconds
-        self._pending_post_capture[id(event)] = {
-            "event": event,
-            "capture_until": post_capture_until,
-            "video_path": video_path,
-        }
+        with self._capture_lock:
+            self._pending_post_capture[capture_id] = pending
+            pending_count = len(self._pending_post_capture)
         log.info(
             "event_queued_for_save",
             event_type=event.event_type.value,
-            event_id=id(event),
-            pending_count=len(self._pending_post_capture),
+            event_id=capture_id,
+            pending_count=pending_count,
             save_after_seconds=self.config.detector.post_event_seconds,
         )
+        self._notify_display()
 
         # Publish event to MQTT
         if self.mqtt and self.mqtt.is_connected:
-            event_payload = event.to_dict()
-            topic = f"{self.config.mqtt_topic_prefix}/event"
             try:
-                import json
-                self.mqtt._publish(topic, json.dumps(event_payload))
+                self.mqtt.publish_event(event.to_dict())
             except Exception as e:
                 log.error("mqtt_event_publish_error", error=str(e))
 
@@ -767,137 +886,165 @@ class UnifiedEngine:
     ) -> None:
         """Called when a video ring buffer save finishes.
 
-        Updates the saved event metadata with the video path and
-        regenerates events.json.
+        Updates the saved event metadata with the video path and marks
+        events.json for regeneration.
 
         Args:
-            event_id: The id() of the Event object, used to look up
-                      the saved JSON path.
+            event_id: Capture id assigned in _on_event().
             path: Path to the saved video file, or None on failure.
         """
         buzzer.beep_capture_end()
         speaker.speak_capture_end()
+        with self._capture_lock:
+            pending = self._awaiting_video.pop(event_id, None)
+            if pending is None:
+                pending = self._pending_post_capture.get(event_id)
+            json_path = None
+            if pending:
+                pending.awaiting_video = False
+                if path:
+                    pending.video_path = path
+                json_path = pending.json_path
         if not path:
             log.warning("capture_failed", event_id=event_id)
             return
 
         log.info("capture_complete", path=str(path), event_id=event_id)
 
-        json_path = self._event_json_paths.get(event_id)
+        # Not saved yet: _check_post_captures saves the path with the event
         if json_path:
             self.event_storage.update_event_video(json_path, path)
-            self.event_storage.generate_events_json()
-        else:
-            # Event hasn't been saved yet — stash path for
-            # _check_post_captures to pick up.
-            self._event_video_paths[event_id] = path
+            self._events_json_dirty = True
 
     def _check_post_captures(self) -> None:
         """Complete any pending post-event captures."""
         now = time.monotonic()
-        completed = []
+        saved_any = False
+
+        with self._capture_lock:
+            due = [
+                (event_id, pending)
+                for event_id, pending in self._pending_post_capture.items()
+                if now >= pending.capture_until
+            ]
+            for event_id, pending in due:
+                del self._pending_post_capture[event_id]
+                # Registered before saving so a video finishing mid-save
+                # still finds this capture
+                if pending.awaiting_video:
+                    self._awaiting_video[event_id] = pending
+
+        for event_id, pending in due:
+            event = pending.event
+            wait_seconds = now - pending.capture_until
+            log.info(
+                "post_capture_processing",
+                event_type=event.event_type.value,
+                event_id=event_id,
+                waited_extra_seconds=round(wait_seconds, 1),
+            )
+            # Get additional samples since event ended
+            event.samples.extend(self.ring_buffer.get_since(event.end_time))
 
-        for event_id, pending in self._pending_post_capture.items():
-            if now >= pending["capture_until"]:
-                event = pending["event"]
-                wait_seconds = now - pending["capture_until"]
+            # Check if video callback already fired
+            with self._capture_lock:
+                video_path = pending.video_path
+            if not video_path:
+                video_path = self._find_capture_video(event)
+
+            # Save to disk
+            try:
+                json_path, _ = self.event_storage.save_event(
+                    event, video_path=video_path
+                )
+                with self._capture_lock:
+                    # A late video callback updates the file from here on
+                    pending.json_path = json_path
+                    late_video = pending.video_path
+                if late_video and late_video != video_path:
+                    # The video finished while the event was being written
+                    self.event_storage.update_event_video(json_path, late_video)
+                    video_path = late_video
+                self.events_captured += 1
+                self._notify_display()
+                self._events_json_dirty = True
+                saved_any = True
                 log.info(
-                    "post_capture_processing",
+                    "event_saved_to_disk",
                     event_type=event.event_type.value,
-                    event_id=event_id,
-                    waited_extra_seconds=round(wait_seconds, 1),
+                    json_path=str(json_path),
+                    has_video=video_path is not None,
                 )
-                # Get additional samples since event ended
-                additional = self.ring_buffer.get_window(
-                    self.config.detector.post_event_seconds
-                )
-                event.samples.extend(
-                    s for s in additional if s.timestamp > event.end_time
+            except Exception as e:
+                with self._capture_lock:
+                    self._awaiting_video.pop(event_id, None)
+                log.error(
+                    "event_save_error",
+                    event_type=event.event_type.value,
+                    error=str(e),
+                    events_dir=self.config.events_dir,
+                    captures_dir=self.config.captures_dir,
                 )
 
-                # Check if video callback already fired
-                eid = id(event)
-                video_path = self._event_video_paths.pop(eid, None)
-                if not video_path:
-                    video_path = self._find_capture_video(event)
-
-                # Save to disk
-                try:
-                    json_path, _ = self.event_storage.save_event(
-                        event, video_path=video_path
-                    )
-                    self.events_captured += 1
-                    # Store json_path so late video callbacks can
-                    # update this event.
-                    self._event_json_paths[eid] = json_path
-                    self.event_storage.generate_events_json()
-                    log.info(
-                        "event_saved_to_disk",
-                        event_type=event.event_type.value,
-                        json_path=str(json_path),
-                        has_video=video_path is not None,
-                    )
-                    # Trigger immediate connectivity check and sync
-                    if self.config.uplink_enabled:
-                        connected = self.connection.check_connectivity()
-                        log.info("post_event_connectivity_check", connected=connected)
-                        if connected and self.capture_sync:
-                            try:
-                                self.capture_sync._do_sync()
-                            except Exception as e:
-                                log.error("post_event_sync_error", error=str(e))
-                except Exception as e:
-                    log.error(
-                        "event_save_error",
-                        event_type=event.event_type.value,
-                        error=str(e),
-                        events_dir=self.config.events_dir,
-                        captures_dir=self.config.captures_dir,
-                    )
-
-                # Post Grafana annotation
-                if self.grafana:
-                    self.grafana.annotate_event(event, video_path)
+            # Post Grafana annotation
+            if self.grafana:
+                self.grafana.annotate_event(event, video_path)
 
-                completed.append(event_id)
+        # One rebuild however many events were saved or given videos
+        if self._events_json_dirty:
+            self._events_json_dirty = False
+            try:
+                self.event_storage.generate_events_json()
+            except Exception as e:
+                log.error("events_json_generate_error", error=str(e))
 
-        for event_id in completed:
-            del self._pending_post_capture[event_id]
+        # Upload new captures now; the sync thread checks connectivity
+        if saved_any and self.config.uplink_enabled and self.capture_sync:
+            self.capture_sync.request_sync()
 
     def _find_capture_video(self, event: Event) -> Optional[Path]:
         """Find the most recent video capture matching an event."""
-        captures = Path(self.config.captures_dir)
-        event_date = datetime.fromtimestamp(event.start_time, tz=timezone.utc)
-        date_dir = captures / event_date.strftime("%Y-%m-%d")
-        if not date_dir.is_dir():
-            return None
+        date_dir = capture_date_dir(Path(self.config.captures_dir), event.start_time)
 
-        pattern = f"{event.event_type.value}_*.mp4"
-        matches = sorted(date_dir.glob(pattern), key=lambda p: p.stat().st_mtime, reverse=True)
-        return matches[0] if matches else None
+        prefix = f"{event.event_type.value}_"
+        best: Optional[str] = None
+        best_mtime = -1.0
+        try:
+            with os.scandir(date_dir) as it:
+                for entry in it:
+                    name = entry.name
+                    if not (name.startswith(prefix) and name.endswith(".mp4")):
+                        continue
+                    try:
+                        mtime = entry.stat().st_mtime
+                    except OSError:
+                        continue  # Deleted by cleanup since the listing
+                    if mtime > best_mtime:
+                        best, best_mtime = entry.path, mtime
+        except OSError:
+            return None
+        return Path(best) if best else None
 
     def _read_gps(self) -> Optional[Reading]:
-        """Read current GPS data."""
+        """Read current GPS data from the newest gpsd TPV report."""
         if not self._gps_available:
             return None
 
         try:
-            import json
-            import socket
-            packet = self._gps.get_current()
-
-            if packet.mode < 2:
+            self._poll_gpsd()
+            tpv = self._gpsd_tpv
+            if tpv is None or time.monotonic() - self._gpsd_tpv_time > GPSD_REPORT_MAX_AGE_S:
                 return None
 
-            # Get satellite count via direct socket (gpsd-py3 bug workaround)
-            satellites = self._get_satellite_count()
+            mode = tpv.get("mode", 0)
+            if mode < 2:
+                return None
 
             timestamp = datetime.now(timezone.utc)
-            if hasattr(packet, "time") and packet.time:
+            gps_time = tpv.get("time")
+            if gps_time:
                 try:
-                    timestamp = datetime.fromisoformat(
-                        packet.time.replace("Z", "+00:00")
-                    )
+                    timestamp = datetime.fromisoformat(gps_time.replace("Z", "+00:00"))
                 except (ValueError, AttributeError):
                     pass
 
@@ -905,16 +1052,18 @@ class UnifiedEngine:
             if not self._clock_synced_from_gps:
                 self._sync_clock_from_gps(timestamp)
 
+            speed = tpv.get("speed")
             reading = Reading(
                 timestamp_utc=timestamp,
                 sensor_type=SensorType.GPS,
-                latitude=packet.lat if hasattr(packet, "lat") else None,
-                longitude=packet.lon if hasattr(packet, "lon") else None,
-                altitude_m=packet.alt if packet.mode >= 3 and hasattr(packet, "alt") else None,
-                speed_kmh=(packet.hspeed * 3.6) if hasattr(packet, "hspeed") and packet.hspeed else None,
-                heading_deg=packet.track if hasattr(packet, "track") else None,
-                satellites=satellites,
-                fix_quality=packet.mode if hasattr(packet, "mode") else 0,
+                latitude=tpv.get("lat"),
+                longitude=tpv.get("lon"),
+                # gpsd 3.20+ reports altMSL; older releases only send alt
+                altitude_m=tpv.get("altMSL", tpv.get("alt")) if mode >= 3 else None,
+                speed_kmh=(speed * 3.6) if speed else None,
+                heading_deg=tpv.get("track"),
+                satellites=self._gpsd_satellites,
+                fix_quality=mode,
             )
             return reading
 
@@ -932,9 +1081,6 @@ class UnifiedEngine:
         Uses clock_settime via ctypes — requires CAP_SYS_TIME capability
         on the systemd service.
         """
-        import ctypes
-        import ctypes.util
-
         try:
             drift = abs((gps_time - datetime.now(timezone.utc)).total_seconds())
             if drift < 30:
@@ -981,53 +1127,92 @@ class UnifiedEngine:
         """
         FAKE_HWCLOCK_FILE = "/etc/fake-hwclock.data"
         try:
-            time_str = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+            line = time.strftime("%Y-%m-%d %H:%M:%S\n", time.gmtime())
             with open(FAKE_HWCLOCK_FILE, "w") as f:
-                f.write(time_str + "\n")
-            log.debug("fake_hwclock_saved", time=time_str)
+                f.write(line)
+            log.debug("fake_hwclock_saved", time=line.rstrip())
         except Exception as e:
             log.debug("fake_hwclock_save_failed", error=str(e))
 
-    def _get_satellite_count(self) -> Optional[int]:
-        """Get satellite count directly from gpsd."""
-        import json
-        import socket
-
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(2.0)
-            sock.connect((self.config.gps_host, self.config.gps_port))
-            sock.send(b'?WATCH={"enable":true,"json":true}\n')
-
-            data = b""
-            for _ in range(15):
-                chunk = sock.recv(4096)
-                if not chunk:
-                    break
-                data += chunk
-                for line in data.decode(errors="ignore").split("\n"):
-                    if '"class":"SKY"' in line:
-                        try:
-                            sky = json.loads(line)
-                            return sky.get("uSat", sky.get("nSat", 0))
-                        except json.JSONDecodeError:
-                            pass
-        except (socket.error, socket.timeout, OSError):
-            pass
-        finally:
+    def _ensure_gpsd_socket(self) -> socket.socket:
+        """Return the watched gpsd socket, connecting on first use."""
+        if self._gpsd_sock is None:
+            sock = socket.create_connection(
+                (self.config.gps_host, self.config.gps_port), timeout=2.0
+            )
             try:
+                sock.sendall(b'?WATCH={"enable":true,"json":true}\n')
+                sock.setblocking(False)
+            except OSError:
                 sock.close()
-            except Exception:
+                raise
+            self._gpsd_sock = sock
+            self._gpsd_buffer = b""
+        return self._gpsd_sock
+
+    def _close_gpsd_socket(self) -> None:
+        """Drop the watched gpsd socket so the next read reconnects."""
+        if self._gpsd_sock is not None:
+            try:
+                self._gpsd_sock.close()
+            except OSError:
                 pass
-        return None
+        self._gpsd_sock = None
+        self._gpsd_buffer = b""
 
-    def _read_imu_snapshot(self) -> Optional[Reading]:
-        """Get current IMU reading from ring buffer."""
-        samples = self.ring_buffer.get_latest(1)
-        if not samples:
+    def _poll_gpsd(self) -> None:
+        """Drain whatever gpsd has streamed since the last call.
+
+        Keeps the newest TPV (position) report and the newest SKY satellite
+        count. Partial lines carry over to the next call; a socket error or
+        EOF drops the connection and the next call reconnects.
+        """
+        try:
+            sock = self._ensure_gpsd_socket()
+            while True:
+                try:
+                    chunk = sock.recv(65536)
+                except BlockingIOError:
+                    break
+                if not chunk:
+                    raise ConnectionError("gpsd closed the connection")
+                self._gpsd_buffer += chunk
+        except OSError:
+            self._close_gpsd_socket()
+            self._gpsd_tpv = None
+            self._gpsd_satellites = None
+            return
+
+        lines = self._gpsd_buffer.split(b"\n")
+        self._gpsd_buffer = lines.pop()
+
+        # Only the newest report of each class matters, so parse backwards
+        need_tpv = need_sky = True
+        for line in reversed(lines):
+            if need_tpv and b'"class":"TPV"' in line:
+                try:
+                    self._gpsd_tpv = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                self._gpsd_tpv_time = time.monotonic()
+                need_tpv = False
+            elif need_sky and b'"class":"SKY"' in line:
+                try:
+                    sky = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                count = sky.get("uSat", sky.get("nSat"))
+                if count is not None:
+                    self._gpsd_satellites = count
+                    need_sky = False
+            if not (need_tpv or need_sky):
+                break
+
+    def _read_imu_snapshot(self, sample: Optional[IMUSample]) -> Optional[Reading]:
+        """Convert the tick's latest ring buffer sample into a telemetry reading."""
+        if sample is None:
             return None
 
-        sample = samples[0]
         return Reading(
             timestamp_utc=datetime.fromtimestamp(sample.timestamp, tz=timezone.utc),
             sensor_type=SensorType.IMU,
@@ -1053,8 +1238,7 @@ class UnifiedEngine:
     @staticmethod
     def _haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
         """Calculate great-circle distance between two points in km."""
-        import math
-        r = 6371.0
+        r = EARTH_RADIUS_KM
         dlat = math.radians(lat2 - lat1)
         dlon = math.radians(lon2 - lon1)
         a = (
@@ -1066,9 +1250,9 @@ class UnifiedEngine:
         return r * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
 
     def _resolve_location(self, lat: float, lon: float) -> None:
-        """Resolve GPS coordinates to a human-readable location name.
+        """Queue a place-name lookup when the interval is up or the car has moved.
 
-        Prefixes with "Near" when the matched place is >5 km away.
+        The lookup itself runs in _geocode_loop().
         """
         if not self._reverse_geocoder:
             return
@@ -1076,24 +1260,64 @@ class UnifiedEngine:
         now = time.monotonic()
         interval = self.config.location_resolution_interval_seconds
 
-        # Check if enough time has elapsed
+        # Queue when the interval is up, or sooner once the position has
+        # moved more than LOCATION_MOVE_KM since the last request. Over
+        # distances this short an equirectangular estimate is within a
+        # fraction of a percent of haversine.
         time_elapsed = (now - self._last_location_resolve_time) >= interval
+        last_lat = self._last_resolved_lat
+        last_lon = self._last_resolved_lon
+        if not time_elapsed and last_lat is not None and last_lon is not None:
+            dy = lat - last_lat
+            dx = (lon - last_lon) * math.cos(math.radians(lat))
+            if (dx * dx + dy * dy) * KM_PER_DEGREE**2 <= LOCATION_MOVE_KM**2:
+                return
 
-        # Check if position has moved >1km since last resolve
-        moved = False
-        if self._last_resolved_lat is not None and self._last_resolved_lon is not None:
-            moved = self._haversine_km(
-                lat, lon, self._last_resolved_lat, self._last_resolved_lon
-            ) > 1.0
-        else:
-            moved = True  # First resolve
-
-        if not time_elapsed and not moved:
+        try:
+            self._geocode_queue.put_nowait((lat, lon))
+        except queue.Full:
+            return  # A lookup is already waiting; its result is recent enough
+        # Gate on the request, so a slow lookup is not queued again meanwhile
+        self._last_location_resolve_time = now
+        self._last_resolved_lat = lat
+        self._last_resolved_lon = lon
+
+    def _geocode_loop(self) -> None:
+        """Resolve queued positions to place names off the telemetry thread."""
+        try:
+            # Load the cities KD-tree now rather than on the first fix.
+            # Single-process mode: the default starts a multiprocessing pool.
+            self._reverse_geocoder.search([(0.0, 0.0)], mode=1, verbose=False)
+            log.info("reverse_geocoder_loaded")
+        except Exception as e:
+            log.error("reverse_geocoder_load_error", error=str(e))
+            self._reverse_geocoder = None  # Stop queueing lookups
             return
 
+        while self._running:
+            try:
+                lat, lon = self._geocode_queue.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            self._lookup_location(lat, lon)
+
+    def _lookup_location(self, lat: float, lon: float) -> None:
+        """Look up the place nearest to a position and store its label.
+
+        Prefixes with "Near" when the matched place is >5 km away. Matches
+        are cached per ~500 m grid cell, so a parked car re-resolving on the
+        interval does not search the KD-tree again.
+        """
         try:
-            results = self._reverse_geocoder.search((lat, lon))
-            if results:
+            key = (
+                math.floor(lat * GEOCACHE_CELLS_PER_DEGREE),
+                math.floor(lon * GEOCACHE_CELLS_PER_DEGREE),
+            )
+            cached = self._geocache.get(key)
+            if cached is None:
+                results = self._reverse_geocoder.search([(lat, lon)], mode=1, verbose=False)
+                if not results:
+                    return
                 result = results[0]
                 name = result.get("name", "")
                 admin1 = result.get("admin1", "")
@@ -1103,28 +1327,57 @@ class UnifiedEngine:
                     label = name
                 else:
                     return
-
-                # "Near" prefix when >5 km from the matched place centre
-                place_lat = float(result.get("lat", lat))
-                place_lon = float(result.get("lon", lon))
-                dist_km = self._haversine_km(lat, lon, place_lat, place_lon)
-                if dist_km > 5.0:
-                    label = f"Near {label}"
-
-                self._current_location_name = label
-                self._last_location_resolve_time = now
-                self._last_resolved_lat = lat
-                self._last_resolved_lon = lon
-                log.debug(
-                    "location_resolved",
-                    location=self._current_location_name,
-                    distance_km=round(dist_km, 1),
-                    lat=round(lat, 4),
-                    lon=round(lon, 4),
+                cached = (
+                    label,
+                    float(result.get("lat", lat)),
+                    float(result.get("lon", lon)),
                 )
+                if len(self._geocache) >= GEOCACHE_MAX_ENTRIES:
+                    del self._geocache[next(iter(self._geocache))]
+                self._geocache[key] = cached
+
+            label, place_lat, place_lon = cached
+
+            # "Near" prefix when >5 km from the matched place centre
+            dist_km = self._haversine_km(lat, lon, place_lat, place_lon)
+            if dist_km > 5.0:
+                label = f"Near {label}"
+
+            self._current_location_name = label
+            log.debug(
+                "location_resolved",
+                location=self._current_location_name,
+                distance_km=round(dist_km, 1),
+                lat=round(lat, 4),
+                lon=round(lon, 4),
+            )
         except Exception as e:
             log.error("location_resolve_error", error=str(e))
 
+    def _notify_display(self) -> None:
+        """Wake the OLED only when a field it shows has changed.
+
+        Compares the notify-driven fields as drawn, read straight from engine
+        state rather than through get_status(), which queries the sync
+        backlog. G, CPU temperature and the backlog refresh on the display's
+        own interval.
+        """
+        if not self.oled_display:
+            return
+        speed = self._current_speed_kmh
+        status = (
+            self._gps_available,
+            self._gps_has_fix,
+            self._current_satellites,
+            round(speed) if speed else 0,
+            self.events_captured,
+            self.video_recorder is not None and self.video_recorder.is_recording,
+            self.connection.is_connected,
+        )
+        if status != self._last_display_status:
+            self._last_display_status = status
+            self.oled_display.notify()
+
     def get_status(self) -> dict:
         """Return current system status for the OLED display."""
         # Peak G from latest IMU sample
@@ -1132,7 +1385,7 @@ class UnifiedEngine:
         samples = self.ring_buffer.get_latest(1)
         if samples:
             s = samples[0]
-            peak_g = (s.ax**2 + s.ay**2 + s.az**2) ** 0.5
+            peak_g = math.hypot(s.ax, s.ay, s.az)
 
         return {
             "gps_available": self._gps_available,
@@ -1198,10 +1451,15 @@ class UnifiedEngine:
                 if (now - last_telemetry) >= self.config.telemetry_interval_seconds:
                     self._record_telemetry()
                     last_telemetry = now
+                    self._notify_display()
 
                 # Check for completed event captures
                 self._check_post_captures()
 
+                # Release a finished fallback-recorder ffmpeg process
+                if self.video_recorder:
+                    self.video_recorder.reap_finished()
+
                 # Timelapse capture when moving
                 self._check_timelapse(now)
 
@@ -1210,17 +1468,78 @@ class UnifiedEngine:
                     self._do_cleanup()
                     last_cleanup = now
 
-                # WAL TRUNCATE checkpoint every 5 minutes
-                if (now - self._last_wal_checkpoint) >= self.WAL_CHECKPOINT_INTERVAL_S:
-                    try:
-                        self.database.checkpoint_wal()
-                    except Exception as e:
-                        log.error("wal_checkpoint_error", error=str(e))
-                    self._last_wal_checkpoint = now
+                # Write buffered telemetry rows in one transaction per window
+                if (now - self._last_reading_flush) >= self.TELEMETRY_FLUSH_INTERVAL_S:
+                    self._flush_readings()
+                    self._last_reading_flush = now
             except Exception as e:
                 log.error("telemetry_loop_error", error=str(e))
 
-            time.sleep(0.1)
+            # Nothing above needs finer timing than the telemetry tick, so
+            # sleep until the next one instead of waking the thread at 10 Hz
+            # to contend with the sampler for the GIL.
+            next_tick = last_telemetry + self.config.telemetry_interval_seconds
+            self._stop_event.wait(min(max(next_tick - time.monotonic(), 0.1), 1.0))
+
+    def _send_boot_metric(self) -> None:
+        """Send the boot_was_crash gauge once recovery is done and the uplink is up."""
+        if self.boot_recovery is None:
+            return
+        lower_thread_priority()
+        # Poll so a shutdown during boot doesn't leave this waiting out the timeout
+        deadline = time.monotonic() + self.BOOT_METRIC_WAIT_S
+        while not self.boot_recovery.recovery_complete.wait(timeout=0.5):
+            if self._stop_event.is_set() or time.monotonic() >= deadline:
+                break
+        if self._stop_event.is_set():
+            return
+        if not (
+            self.config.prometheus_enabled
+            and self.config.uplink_enabled
+            and self.config.prometheus_remote_write_url
+        ):
+            return
+        if not self.connection.wait_for_connection(timeout=self.BOOT_METRIC_WAIT_S):
+            log.info("boot_metric_skipped_offline")
+            return
+        if self._stop_event.is_set():
+            return  # Don't start a POST while the engine is shutting down
+        was_crash = self.boot_recovery.was_crash
+        try:
+            metric_value = 1.0 if was_crash else 0.0
+            timestamp_ms = time.time_ns() // 1_000_000
+            metrics = [
+                (
+                    "shitbox_boot_was_crash",
+                    {"instance": "shitbox-car", "car": "shitbox"},
+                    metric_value,
+                    timestamp_ms,
+                )
+            ]
+            data = encode_remote_write(metrics)
+            requests.post(
+                self.config.prometheus_remote_write_url,
+                data=data,
+                headers=REMOTE_WRITE_HEADERS,
+                timeout=10,
+            )
+            log.info("boot_metric_sent", was_crash=was_crash)
+        except Exception as e:
+            log.warning("boot_metric_send_failed", error=str(e))
+
+    def _wal_checkpoint_loop(self) -> None:
+        """Checkpoint the SQLite WAL every WAL_CHECKPOINT_INTERVAL_S until stopped.
+
+        Uses this thread's own Database connection. Checkpointing here keeps
+        the WAL well under wal_autocheckpoint, so writers on the telemetry
+        thread are not left to checkpoint it themselves. The final checkpoint
+        is left to stop(), after the last writes.
+        """
+        while not self._stop_event.wait(self.WAL_CHECKPOINT_INTERVAL_S):
+            try:
+                self.database.checkpoint_wal()
+            except Exception as e:
+                log.error("wal_checkpoint_error", error=str(e))
 
     def _record_telemetry(self) -> None:
         """Record one telemetry cycle to SQLite and MQTT."""
@@ -1232,34 +1551,33 @@ class UnifiedEngine:
             if gps_reading:
                 self._gps_has_fix = True
                 readings.append(gps_reading)
-                if gps_reading.speed_kmh is not None:
-                    speed = gps_reading.speed_kmh if gps_reading.speed_kmh >= 3.0 else 0.0
-                    self._current_speed_kmh = speed
-                self._current_lat = gps_reading.latitude
-                self._current_lon = gps_reading.longitude
+                lat = gps_reading.latitude
+                lon = gps_reading.longitude
+                speed = gps_reading.speed_kmh
+                if speed is not None:
+                    self._current_speed_kmh = speed if speed >= 3.0 else 0.0
+                self._current_lat = lat
+                self._current_lon = lon
                 self._current_heading = gps_reading.heading_deg
                 self._current_altitude = gps_reading.altitude_m
                 self._current_satellites = gps_reading.satellites
                 # Resolve location name from coordinates
-                if gps_reading.latitude is not None and gps_reading.longitude is not None:
-                    self._resolve_location(gps_reading.latitude, gps_reading.longitude)
+                if lat is not None and lon is not None:
+                    self._resolve_location(lat, lon)
                     self._distance_from_start_km = self._haversine_km(
                         self.config.rally_start_lat, self.config.rally_start_lon,
-                        gps_reading.latitude, gps_reading.longitude,
+                        lat, lon,
                     )
                     self._distance_to_destination_km = self._haversine_km(
-                        gps_reading.latitude, gps_reading.longitude,
+                        lat, lon,
                         self.config.rally_destination_lat, self.config.rally_destination_lon,
                     )
                     # Odometer: accumulate distance only when speed >= 5 km/h
-                    if (
-                        gps_reading.speed_kmh is not None
-                        and gps_reading.speed_kmh >= 5.0
-                    ):
+                    if speed is not None and speed >= 5.0:
                         if self._last_known_lat is not None:
                             delta_km = self._haversine_km(
                                 self._last_known_lat, self._last_known_lon,  # type: ignore[arg-type]
-                                gps_reading.latitude, gps_reading.longitude,
+                                lat, lon,
                             )
                             # Reject implausible deltas (> 1 km/s = 3600 km/h)
                             if delta_km <= 1.0:
@@ -1275,26 +1593,29 @@ class UnifiedEngine:
                                 ):
                                     speaker.speak_distance_update(int(self._daily_km))
                                     self._last_announced_km = self._daily_km
-                        self._last_known_lat = gps_reading.latitude
-                        self._last_known_lon = gps_reading.longitude
+                        self._last_known_lat = lat
+                        self._last_known_lon = lon
 
                     # Persist odometer every 60 seconds
                     now_mono = time.monotonic()
                     if (now_mono - self._last_trip_persist) >= TRIP_PERSIST_INTERVAL_S:
                         try:
-                            self.database.set_trip_state("odometer_km", self._odometer_km)
-                            self.database.set_trip_state("daily_km", self._daily_km)
+                            self.database.set_trip_states(
+                                {"odometer_km": self._odometer_km, "daily_km": self._daily_km}
+                            )
                         except Exception as e:
                             log.error("trip_state_persist_error", error=str(e))
                         self._last_trip_persist = now_mono
 
                     # Waypoint detection (regardless of speed)
-                    self._check_waypoints(gps_reading.latitude, gps_reading.longitude)
+                    self._check_waypoints(lat, lon)
             else:
                 self._gps_has_fix = False
 
-        # IMU snapshot
-        imu_reading = self._read_imu_snapshot()
+        # IMU snapshot, shared with the overlay below
+        latest = self.ring_buffer.get_latest(1)
+        imu_sample = latest[0] if latest else None
+        imu_reading = self._read_imu_snapshot(imu_sample)
         if imu_reading:
             readings.append(imu_reading)
 
@@ -1330,15 +1651,10 @@ class UnifiedEngine:
             if system_reading:
                 readings.append(system_reading)
 
-        # Store to SQLite and publish to MQTT
-        for reading in readings:
-            try:
-                self.database.insert_reading(reading)
-                self.telemetry_readings += 1
-            except Exception as e:
-                log.error("database_store_error", error=str(e))
-
-            if self.mqtt and self.mqtt.is_connected:
+        # Queue for the next SQLite flush and publish to MQTT now
+        self._reading_batch.extend(readings)
+        if self.mqtt and self.mqtt.is_connected:
+            for reading in readings:
                 try:
                     self.mqtt.publish_reading(reading)
                 except Exception as e:
@@ -1346,7 +1662,27 @@ class UnifiedEngine:
 
         # Update video HUD overlay text files
         if self.config.overlay_enabled and self.video_ring_buffer:
-            self._update_overlay()
+            self._update_overlay(imu_sample)
+
+    def _flush_readings(self) -> None:
+        """Write buffered telemetry rows to SQLite in a single transaction."""
+        batch = self._reading_batch
+        if not batch:
+            return
+        self._reading_batch = []
+        try:
+            self.telemetry_readings += self.database.insert_readings_batch(batch)
+        except Exception as e:
+            # Keep the rows for the next flush rather than losing the window
+            batch.extend(self._reading_batch)
+            dropped = max(len(batch) - self.TELEMETRY_RETRY_MAX_ROWS, 0)
+            self._reading_batch = batch[dropped:]
+            log.error(
+                "database_store_error",
+                error=str(e),
+                retained=len(self._reading_batch),
+                dropped=dropped,
+            )
 
     def _check_waypoints(self, lat: float, lon: float) -> None:
         """Check whether the current position is within 5 km of any unreached waypoint.
@@ -1355,12 +1691,13 @@ class UnifiedEngine:
             lat: Current latitude.
             lon: Current longitude.
         """
+        reached = self._reached_waypoints
         for i, waypoint in enumerate(self.config.route_waypoints):
-            if i in self._reached_waypoints:
+            if i in reached or abs(lat - waypoint.lat) > WAYPOINT_LAT_WINDOW_DEG:
                 continue
             dist_km = self._haversine_km(lat, lon, waypoint.lat, waypoint.lon)
-            if dist_km <= 5.0:
-                self._reached_waypoints.add(i)
+            if dist_km <= WAYPOINT_REACHED_KM:
+                reached.add(i)
                 try:
                     self.database.record_waypoint_reached(i, waypoint.name, lat, lon)
                 except Exception as e:
@@ -1373,15 +1710,17 @@ class UnifiedEngine:
                 )
                 speaker.speak_waypoint_reached(waypoint.name, waypoint.day)
 
-    def _update_overlay(self) -> None:
-        """Write overlay text files for ffmpeg drawtext filters."""
+    def _update_overlay(self, sample: Optional[IMUSample]) -> None:
+        """Write overlay text files for ffmpeg drawtext filters.
+
+        Args:
+            sample: Latest IMU sample for the G readout, if any.
+        """
         g_lat = 0.0
         g_lon = 0.0
-        samples = self.ring_buffer.get_latest(1)
-        if samples:
-            s = samples[0]
-            g_lat = s.ay  # lateral (left/right cornering)
-            g_lon = s.ax  # longitudinal (braking/acceleration)
+        if sample is not None:
+            g_lat = sample.ay  # lateral (left/right cornering)
+            g_lon = sample.ax  # longitudinal (braking/acceleration)
 
         overlay.update(
             speed=self._current_speed_kmh if self._current_speed_kmh else None,
@@ -1494,6 +1833,7 @@ class UnifiedEngine:
         )
 
         self._running = True
+        self._stop_event.clear()
 
         # --- Boot recovery: detect crash BEFORE database.connect() creates the WAL ---
         was_crash = detect_unclean_shutdown(self.database.db_path)
@@ -1504,17 +1844,17 @@ class UnifiedEngine:
         self.database.connect()
 
         # Load persisted trip state
-        self._odometer_km = self.database.get_trip_state("odometer_km") or 0.0
-        self._daily_km = self.database.get_trip_state("daily_km") or 0.0
+        trip_state = self.database.get_trip_states("odometer_km", "daily_km", "daily_reset_date")
+        self._odometer_km = trip_state.get("odometer_km") or 0.0
+        self._daily_km = trip_state.get("daily_km") or 0.0
 
         # Reset daily distance on AEST day boundary
-        stored_date = self.database.get_trip_state_text("daily_reset_date")
+        stored_date = trip_state.get("daily_reset_date")
         today_aest = _current_aest_date()
         if stored_date != today_aest:
             self._daily_km = 0.0
             self._last_announced_km = 0.0
-            self.database.set_trip_state("daily_km", 0.0)
-            self.database.set_trip_state_text("daily_reset_date", today_aest)
+            self.database.set_trip_states({"daily_km": 0.0, "daily_reset_date": today_aest})
             log.info("daily_distance_reset", new_date=today_aest)
 
         # Load reached waypoints
@@ -1525,50 +1865,17 @@ class UnifiedEngine:
         self.boot_recovery.was_crash = was_crash
         self.boot_recovery.start()
 
-        def _send_boot_metric() -> None:
-            """Send boot_was_crash gauge after recovery completes."""
-            if self.boot_recovery is None:
-                return
-            self.boot_recovery.recovery_complete.wait(timeout=30)
-            try:
-                import time as _time
-
-                from shitbox.sync.prometheus_write import encode_remote_write
-
-                metric_value = 1.0 if self.boot_recovery.was_crash else 0.0
-                timestamp_ms = int(_time.time() * 1000)
-                metrics = [
-                    (
-                        "shitbox_boot_was_crash",
-                        {"instance": "shitbox-car", "car": "shitbox"},
-                        metric_value,
-                        timestamp_ms,
-                    )
-                ]
-                if (
-                    self.config.prometheus_enabled
-                    and self.config.uplink_enabled
-                    and self.config.prometheus_remote_write_url
-                    and self.connection.is_connected
-                ):
-                    import requests
-
-                    data = encode_remote_write(metrics)
-                    requests.post(
-                        self.config.prometheus_remote_write_url,
-                        data=data,
-                        headers={
-                            "Content-Type": "application/x-protobuf",
-                            "Content-Encoding": "snappy",
-                            "X-Prometheus-Remote-Write-Version": "0.1.0",
-                        },
-                        timeout=10,
-                    )
-                    log.info("boot_metric_sent", was_crash=self.boot_recovery.was_crash)
-            except Exception as e:
-                log.warning("boot_metric_send_failed", error=str(e))
-
-        threading.Thread(target=_send_boot_metric, daemon=True, name="boot-metric").start()
+        # Load the Piper voice (~5-7s) in the background while waiting for a
+        # GPS fix (up to 20s) instead of paying for both one after the other
+        speaker_init_thread: Optional[threading.Thread] = None
+        if self.config.speaker_enabled:
+            speaker_init_thread = threading.Thread(
+                target=speaker.init,
+                args=(self.config.speaker_model_path,),
+                daemon=True,
+                name="speaker-init",
+            )
+            speaker_init_thread.start()
 
         # Initialise GPS and wait for fix (up to 20 seconds)
         if self.config.gps_enabled:
@@ -1614,11 +1921,10 @@ class UnifiedEngine:
         self.thermal_monitor.start()
 
         # Instantiate health collector (thermal_monitor and batch_sync now ready)
-        data_dir = str(Path(self.config.database_path).parent)
         self._health_collector = HealthCollector(
             thermal_monitor=self.thermal_monitor,
             batch_sync=self.batch_sync,
-            data_dir=data_dir,
+            data_dir=self._data_dir,
         )
 
         # Start OLED display
@@ -1638,10 +1944,24 @@ class UnifiedEngine:
 
         # Start telemetry loop
         self._telemetry_thread = threading.Thread(
-            target=self._telemetry_loop, daemon=True
+            target=self._telemetry_loop, daemon=True, name="telemetry"
         )
         self._telemetry_thread.start()
 
+        # WAL checkpoints run on their own thread and connection so copying
+        # pages back into the database never delays a telemetry tick
+        self._wal_checkpoint_thread = threading.Thread(
+            target=self._wal_checkpoint_loop, daemon=True, name="wal-checkpoint"
+        )
+        self._wal_checkpoint_thread.start()
+
+        # Start place-name lookups
+        if self._reverse_geocoder:
+            self._geocode_thread = threading.Thread(
+                target=self._geocode_loop, daemon=True, name="geocoder"
+            )
+            self._geocode_thread.start()
+
         # Start button handler (if GPIO available)
         if self.button_handler:
             self.button_handler.start()
@@ -1652,17 +1972,17 @@ class UnifiedEngine:
             buzzer.set_boot_start_time(time.monotonic())
             buzzer.beep_boot()
             # Recovery-specific beep after boot tone
-            if self.boot_recovery and self.boot_recovery.was_crash:
+            if was_crash:
                 buzzer.beep_crash_recovery()
             else:
                 buzzer.beep_clean_boot()
 
-        # Initialise speaker (after buzzer so boot tones precede spoken announcement)
-        if self.config.speaker_enabled:
-            self._notify_systemd("WATCHDOG=1")  # Piper model load takes ~5-7s
-            speaker.init(self.config.speaker_model_path)
+        # Announce boot once the voice has loaded (after buzzer so boot tones
+        # precede the spoken announcement)
+        if speaker_init_thread is not None:
+            self._notify_systemd("WATCHDOG=1")  # Piper model may still be loading
+            speaker_init_thread.join()
             speaker.set_boot_start_time(time.monotonic())
-            was_crash = self.boot_recovery.was_crash if self.boot_recovery else False
             speaker.speak_boot(was_crash=was_crash)
 
         # Regenerate events.json from any previously stored events
@@ -1688,11 +2008,20 @@ class UnifiedEngine:
 
         log.info("unified_engine_started")
 
+        # Started last so the connection monitor is already running; the
+        # metric is sent once recovery completes and the uplink is up
+        threading.Thread(target=self._send_boot_metric, daemon=True, name="boot-metric").start()
+
     def stop(self) -> None:
         """Stop the unified engine."""
         log.info("unified_engine_stopping")
 
         self._running = False
+        self._stop_event.set()
+
+        # Let an in-flight subsystem restart finish before tearing down
+        if self._health_thread and self._health_thread.is_alive():
+            self._health_thread.join(timeout=10.0)
 
         # Stop OLED display early so it can show final state
         if self.oled_display:
@@ -1736,18 +2065,44 @@ class UnifiedEngine:
         if self._environment_collector:
             self._environment_collector.cleanup()
 
+        if self.i2c is not None:
+            try:
+                self.i2c.deinit()
+            except Exception:
+                pass
+            self.i2c = None
+
         self.connection.stop()
 
         if self._telemetry_thread and self._telemetry_thread.is_alive():
             self._telemetry_thread.join(timeout=2.0)
 
+        if self._geocode_thread and self._geocode_thread.is_alive():
+            self._geocode_thread.join(timeout=2.0)
+
+        if self._wal_checkpoint_thread and self._wal_checkpoint_thread.is_alive():
+            self._wal_checkpoint_thread.join(timeout=5.0)
+
+        self._close_gpsd_socket()
+        self._close_notify_socket()
+
+        # Deliver queued annotations before the process exits
+        if self.grafana:
+            self.grafana.stop()
+
+        # Write telemetry still waiting for its flush window
+        self._flush_readings()
+
         # Save any pending events
         for pending in self._pending_post_capture.values():
             try:
-                self.event_storage.save_event(pending["event"])
+                self.event_storage.save_event(pending.event)
             except Exception as e:
                 log.error("event_save_error_on_shutdown", error=str(e))
 
+        # Every writer has stopped: close() truncates the WAL and closes
+        self.database.close()
+
         log.info(
             "unified_engine_stopped",
             telemetry_readings=self.telemetry_readings,
@@ -1762,6 +2117,7 @@ class UnifiedEngine:
         def signal_handler(signum, frame):
             log.info("received_signal", signal=signum)
             self._running = False
+            self._stop_event.set()
 
         def capture_signal_handler(signum, frame):
             log.info("manual_capture_signal_received")
@@ -1783,18 +2139,35 @@ class UnifiedEngine:
         self.start()
 
         # Main loop with watchdog
+        watchdog_interval = _watchdog_interval_s(WATCHDOG_USEC)
         while self._running:
             self._notify_systemd("WATCHDOG=1")
             now = time.monotonic()
             elapsed = now - self._engine_start_time
             if elapsed > self.HEALTH_GRACE_PERIOD:
                 if (now - self._last_health_time) >= self.HEALTH_CHECK_INTERVAL:
-                    self._health_check()
+                    self._start_health_check()
                     self._last_health_time = now
-            time.sleep(1.0)
+            self._stop_event.wait(watchdog_interval)
 
         self.stop()
 
+    def _start_health_check(self) -> None:
+        """Run _health_check() on its own thread.
+
+        Recoveries such as reloading the Piper voice (~5-7s) or restarting
+        ffmpeg would otherwise hold up the main loop's watchdog pings past
+        WatchdogSec. Checks never overlap: while one is still running, the
+        next is skipped.
+        """
+        if self._health_thread and self._health_thread.is_alive():
+            log.warning("health_check_still_running")
+            return
+        self._health_thread = threading.Thread(
+            target=self._health_check, daemon=True, name="health-check"
+        )
+        self._health_thread.start()
+
     def _health_check(self) -> None:
         """Check subsystem health and attempt recovery."""
         issues: list[str] = []
@@ -1822,7 +2195,7 @@ class UnifiedEngine:
             log.error("telemetry_thread_dead", restarting=True)
             issues.append("telemetry_thread_dead")
             self._telemetry_thread = threading.Thread(
-                target=self._telemetry_loop, daemon=True
+                target=self._telemetry_loop, daemon=True, name="telemetry"
             )
             self._telemetry_thread.start()
             recovered.append("telemetry_thread")
@@ -1902,25 +2275,32 @@ class UnifiedEngine:
             buzzer.beep_service_recovered("subsystem")
             speaker.speak_service_recovered()
 
-    @staticmethod
-    def _notify_systemd(state: str) -> None:
+    def _notify_systemd(self, state: str) -> None:
         """Send notification to systemd."""
+        if not NOTIFY_SOCKET:
+            return
         try:
-            import os
-            import socket as sock
-
-            notify_socket = os.environ.get("NOTIFY_SOCKET")
-            if not notify_socket:
-                return
+            if self._notify_sock is None:
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+                try:
+                    sock.connect(NOTIFY_SOCKET)
+                except OSError:
+                    sock.close()
+                    raise
+                self._notify_sock = sock
+            self._notify_sock.sendall(state.encode())
+        except Exception:
+            # Reconnect on the next ping rather than sending into a dead socket
+            self._close_notify_socket()
 
-            s = sock.socket(sock.AF_UNIX, sock.SOCK_DGRAM)
+    def _close_notify_socket(self) -> None:
+        """Close the systemd notification socket, if open."""
+        if self._notify_sock is not None:
             try:
-                s.connect(notify_socket)
-                s.sendall(state.encode())
-            finally:
-                s.close()
-        except Exception:
-            pass
+                self._notify_sock.close()
+            except OSError:
+                pass
+        self._notify_sock = None
 
 
 def main():
@@ -1,10 +1,8 @@
-"""Thread-safe ring buffer for high-rate IMU samples."""
+"""Lock-free single-producer ring buffer for high-rate IMU samples."""
 
-import threading
-import time
-from collections import deque
+from array import array
 from dataclasses import dataclass
-from typing import Iterator, List, Optional
+from typing import List, Tuple
 
 
 @dataclass(slots=True)
@@ -21,10 +19,22 @@ class IMUSample:
 
 
 class RingBuffer:
-    """Thread-safe ring buffer for IMU samples.
+    """Single-producer ring buffer for IMU samples.
 
     Maintains a fixed-duration window of samples in RAM.
     Designed for ~100 Hz sampling with 20-30 second retention.
+
+    Samples are stored column-wise in preallocated float arrays rather than
+    as a deque of IMUSample objects, so the buffer holds no per-sample
+    Python objects for the garbage collector to track. IMUSample instances
+    are only built when a window is read back.
+
+    The sampler thread is the only writer and never takes a lock. Each
+    sample has a sequence number; its slot is ``seq & mask`` in arrays
+    sized to the next power of two. The writer fills a slot and then
+    publishes it by advancing ``_written``. Readers copy what they need and
+    then drop any sample the writer may have overwritten during the copy,
+    so a slow reader can never stall sampling.
     """
 
     def __init__(self, max_seconds: float = 30.0, sample_rate_hz: float = 100.0):
@@ -35,13 +45,57 @@ class RingBuffer:
             sample_rate_hz: Expected sample rate for sizing.
         """
         self.max_samples = int(max_seconds * sample_rate_hz)
-        self._buffer: deque[IMUSample] = deque(maxlen=self.max_samples)
-        self._lock = threading.Lock()
+        capacity = 1
+        while capacity < self.max_samples:
+            capacity <<= 1
+        self._mask = capacity - 1
+        self._t = array("d", bytes(8 * capacity))
+        self._ax = array("d", bytes(8 * capacity))
+        self._ay = array("d", bytes(8 * capacity))
+        self._az = array("d", bytes(8 * capacity))
+        self._gx = array("d", bytes(8 * capacity))
+        self._gy = array("d", bytes(8 * capacity))
+        self._gz = array("d", bytes(8 * capacity))
+        self._written = 0  # Samples ever appended; only the writer advances it
+        self._floor = 0  # Sequence number of the oldest sample after clear()
 
     def append(self, sample: IMUSample) -> None:
-        """Add a sample to the buffer (thread-safe)."""
-        with self._lock:
-            self._buffer.append(sample)
+        """Add a sample to the buffer. Only the sampler thread may call this."""
+        if self.max_samples <= 0:
+            return
+        i = self._written & self._mask
+        self._t[i] = sample.timestamp
+        self._ax[i] = sample.ax
+        self._ay[i] = sample.ay
+        self._az[i] = sample.az
+        self._gx[i] = sample.gx
+        self._gy[i] = sample.gy
+        self._gz[i] = sample.gz
+        self._written += 1  # Publish the slot to readers
+
+    def _bounds(self) -> Tuple[int, int]:
+        """Sequence range [lo, hi) of the samples currently retained."""
+        hi = self._written
+        return max(hi - self.max_samples, self._floor), hi
+
+    def _build(self, seqs: List[int]) -> List[IMUSample]:
+        """Build IMUSamples for the given sequence numbers, oldest first.
+
+        Samples whose slot the writer reached while they were being copied
+        are dropped rather than returned torn.
+        """
+        m = self._mask
+        t, ax, ay, az = self._t, self._ax, self._ay, self._az
+        gx, gy, gz = self._gx, self._gy, self._gz
+        samples = [
+            IMUSample(t[i], ax[i], ay[i], az[i], gx[i], gy[i], gz[i])
+            for i in (s & m for s in seqs)
+        ]
+        # The writer may be filling the slot of seq (_written - capacity)
+        oldest_intact = self._written - m
+        if seqs and seqs[0] < oldest_intact:
+            return [smp for seq, smp in zip(seqs, samples) if seq >= oldest_intact]
+        return samples
 
     def get_window(self, seconds: float) -> List[IMUSample]:
         """Get the last N seconds of samples.
@@ -52,46 +106,84 @@ class RingBuffer:
         Returns:
             List of samples (oldest first).
         """
-        with self._lock:
-            if not self._buffer:
-                return []
+        lo, hi = self._bounds()
+        if hi <= lo:
+            return []
+
+        cutoff = self._t[(hi - 1) & self._mask] - seconds
+        return self._build(list(range(self._search(lo, hi, cutoff, inclusive=True), hi)))
 
-            now = self._buffer[-1].timestamp
-            cutoff = now - seconds
-            return [s for s in self._buffer if s.timestamp >= cutoff]
+    def get_since(self, timestamp: float) -> List[IMUSample]:
+        """Get every retained sample newer than a timestamp.
+
+        Args:
+            timestamp: Exclusive lower bound on sample timestamps.
+
+        Returns:
+            List of samples (oldest first).
+        """
+        lo, hi = self._bounds()
+        if hi <= lo:
+            return []
+
+        return self._build(list(range(self._search(lo, hi, timestamp, inclusive=False), hi)))
+
+    def _search(self, lo: int, hi: int, cutoff: float, inclusive: bool) -> int:
+        """Find the first sequence number in [lo, hi) at or after a timestamp.
+
+        Samples are appended in time order, so this binary searches rather
+        than testing every retained timestamp.
+
+        Args:
+            lo: Oldest retained sequence number.
+            hi: One past the newest sequence number.
+            cutoff: Timestamp to search for.
+            inclusive: Whether a sample stamped exactly at cutoff counts.
+
+        Returns:
+            Sequence number of the first matching sample, or hi if none match.
+        """
+        t = self._t
+        m = self._mask
+        first, last = lo, hi
+        while first < last:
+            mid = (first + last) // 2
+            ts = t[mid & m]
+            if ts < cutoff or (not inclusive and ts == cutoff):
+                first = mid + 1
+            else:
+                last = mid
+        return first
 
     def get_all(self) -> List[IMUSample]:
         """Get all samples in buffer."""
-        with self._lock:
-            return list(self._buffer)
+        lo, hi = self._bounds()
+        return self._build(list(range(lo, hi)))
 
     def get_latest(self, n: int = 1) -> List[IMUSample]:
         """Get the N most recent samples."""
-        with self._lock:
-            if n >= len(self._buffer):
-                return list(self._buffer)
-            return list(self._buffer)[-n:]
+        lo, hi = self._bounds()
+        return self._build(list(range(max(lo, hi - max(n, 0)), hi)))
 
     def __len__(self) -> int:
         """Number of samples currently in buffer."""
-        with self._lock:
-            return len(self._buffer)
+        lo, hi = self._bounds()
+        return hi - lo
 
     def clear(self) -> None:
         """Clear all samples."""
-        with self._lock:
-            self._buffer.clear()
+        self._floor = self._written
 
     @property
     def duration(self) -> float:
         """Current duration of data in buffer (seconds)."""
-        with self._lock:
-            if len(self._buffer) < 2:
-                return 0.0
-            return self._buffer[-1].timestamp - self._buffer[0].timestamp
+        lo, hi = self._bounds()
+        if hi - lo < 2:
+            return 0.0
+        return self._t[(hi - 1) & self._mask] - self._t[lo & self._mask]
 
     @property
     def is_full(self) -> bool:
         """Whether buffer has reached max capacity."""
-        with self._lock:
-            return len(self._buffer) >= self.max_samples
+        lo, hi = self._bounds()
+        return hi - lo >= self.max_samples
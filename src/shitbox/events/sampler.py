@@ -157,7 +157,7 @@ class HighRateSampler:
                         return
 
         self._running = True
-        self._thread = threading.Thread(target=self._sample_loop, daemon=True)
+        self._thread = threading.Thread(target=self._sample_loop, daemon=True, name="imu-sampler")
         self._thread.start()
         log.info("high_rate_sampler_started", rate_hz=self.sample_rate_hz)
 
@@ -176,6 +176,9 @@ class HighRateSampler:
     def _sample_loop(self) -> None:
         """Main sampling loop - runs at target rate."""
         next_sample_time = time.perf_counter()
+        # Resolved once: both are fixed for the life of the sampler
+        append = self.ring_buffer.append
+        on_sample = self.on_sample
 
         while self._running:
             now = time.perf_counter()
@@ -194,12 +197,12 @@ class HighRateSampler:
             # Read sample
             try:
                 sample = self._read_sample()
-                self.ring_buffer.append(sample)
+                append(sample)
                 self.samples_total += 1
                 self._consecutive_failures = 0
 
-                if self.on_sample:
-                    self.on_sample(sample)
+                if on_sample:
+                    on_sample(sample)
 
             except Exception as e:
                 log.error("sample_read_error", error=str(e))
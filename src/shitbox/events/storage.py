@@ -15,6 +15,18 @@ from shitbox.utils.logging import get_logger
 log = get_logger(__name__)
 
 
+def _write_json(path: Path, data: object) -> None:
+    """Serialise in full, then write the file with a single call.
+
+    Serialises fully before opening the file, so a failure leaves the
+    previous contents intact. json.dumps() is also faster than streaming
+    json.dump() through the file object.
+    """
+    text = json.dumps(data, indent=2)
+    with open(path, "w") as f:
+        f.write(text)
+
+
 class EventStorage:
     """Stores detected events to disk.
 
@@ -98,8 +110,7 @@ class EventStorage:
         if video_path:
             metadata["video_path"] = str(video_path)
 
-        with open(json_path, "w") as f:
-            json.dump(metadata, f, indent=2)
+        _write_json(json_path, metadata)
 
         # Save samples as CSV
         self._write_csv(csv_path, event.samples)
@@ -126,8 +137,7 @@ class EventStorage:
             with open(json_path) as f:
                 metadata = json.load(f)
             metadata["video_path"] = str(video_path)
-            with open(json_path, "w") as f:
-                json.dump(metadata, f, indent=2)
+            _write_json(json_path, metadata)
             log.info(
                 "event_video_updated",
                 json=str(json_path),
@@ -204,25 +214,32 @@ class EventStorage:
         Returns:
             Number of files deleted.
         """
-        current_size = self.get_total_size_mb()
-        if current_size <= self.max_size_mb:
+        if not self.base_dir.exists():
             return 0
 
-        deleted = 0
-
-        # Get all event files sorted by modification time
+        # Stat every file once; the running total is updated as files go
+        # rather than re-walking the tree before each deletion
         all_files = []
+        total = 0
         for f in self.base_dir.rglob("*"):
             if f.is_file():
-                all_files.append((f.stat().st_mtime, f))
+                st = f.stat()
+                all_files.append((st.st_mtime, st.st_size, f))
+                total += st.st_size
+
+        if total <= self.max_size_mb * 1024 * 1024:
+            return 0
 
         all_files.sort()  # Oldest first
 
-        # Delete until under limit
-        for mtime, filepath in all_files:
-            if self.get_total_size_mb() <= self.max_size_mb * 0.9:
+        # Delete until under 90% of the limit
+        target = self.max_size_mb * 0.9 * 1024 * 1024
+        deleted = 0
+        for _mtime, size, filepath in all_files:
+            if total <= target:
                 break
             filepath.unlink()
+            total -= size
             deleted += 1
 
         if deleted:
@@ -264,8 +281,7 @@ class EventStorage:
             meta["status"] = "interrupted"
 
             try:
-                with open(json_file, "w") as f:
-                    json.dump(meta, f, indent=2)
+                _write_json(json_file, meta)
             except IOError as exc:
                 log.warning("orphan_close_error", file=str(json_file), error=str(exc))
                 continue
@@ -383,8 +399,7 @@ class EventStorage:
         entries.sort(key=lambda e: e["timestamp"], reverse=True)
 
         tmp_path = events_json_path.with_suffix(".tmp")
-        with open(tmp_path, "w") as f:
-            json.dump(entries, f, indent=2)
+        _write_json(tmp_path, entries)
         os.replace(tmp_path, events_json_path)
 
         log.info(
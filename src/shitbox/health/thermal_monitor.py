@@ -7,10 +7,10 @@ the Pi firmware throttle bitmask to detect under-voltage and frequency capping.
 
 from __future__ import annotations
 
+import os
 import subprocess
 import threading
 import time
-from pathlib import Path
 from typing import Optional
 
 from shitbox.capture.buzzer import (
@@ -53,6 +53,7 @@ TEMP_WARNING_C = 70.0
 TEMP_CRITICAL_C = 80.0
 HYSTERESIS_C = 5.0
 POLL_INTERVAL_S = 5.0
+SYSFS_TEMP_PATH = "/sys/class/thermal/thermal_zone0/temp"
 
 # Re-arm thresholds (temperature must drop below these before alert fires again)
 _WARN_REARM_C = TEMP_WARNING_C - HYSTERESIS_C   # 65.0 °C
@@ -123,6 +124,9 @@ class ThermalMonitorService:
         self._warning_armed = True
         self._critical_armed = True
         self._last_throttled_raw: Optional[int] = None
+        # sysfs regenerates the value on every read from offset 0, so one
+        # descriptor can be re-read for the life of the poll thread
+        self._temp_fd: Optional[int] = None
 
     # ------------------------------------------------------------------
     # Public interface
@@ -159,8 +163,19 @@ class ThermalMonitorService:
         self._running = False
         if self._thread is not None:
             self._thread.join(timeout=POLL_INTERVAL_S + 1)
+        if self._thread is None or not self._thread.is_alive():
+            self._close_temp_fd()
         log.info("thermal_monitor_stopped")
 
+    def _close_temp_fd(self) -> None:
+        """Close the cached sysfs descriptor, if open."""
+        fd, self._temp_fd = self._temp_fd, None
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
     # ------------------------------------------------------------------
     # Internal loop
     # ------------------------------------------------------------------
@@ -185,9 +200,11 @@ class ThermalMonitorService:
             Integer millidegrees (e.g. 55000 for 55 °C), or None on failure.
         """
         try:
-            raw = Path("/sys/class/thermal/thermal_zone0/temp").read_text().strip()
-            return int(raw)
-        except (IOError, ValueError, OSError) as exc:
+            if self._temp_fd is None:
+                self._temp_fd = os.open(SYSFS_TEMP_PATH, os.O_RDONLY)
+            return int(os.pread(self._temp_fd, 16, 0))
+        except (OSError, ValueError) as exc:
+            self._close_temp_fd()
             log.warning("sysfs_temp_read_error", error=str(exc))
             return None
 
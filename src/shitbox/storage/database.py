@@ -5,7 +5,7 @@ import threading
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Generator, Optional
+from typing import Generator, Optional, Union
 
 from shitbox.storage.models import Reading, SensorType, SyncCursor
 from shitbox.utils.logging import get_logger
@@ -15,6 +15,10 @@ log = get_logger(__name__)
 # Database schema version for migrations
 SCHEMA_VERSION = 4
 
+# WAL size (frames) past which checkpoint_wal() truncates the file; matches
+# wal_autocheckpoint, so a WAL this large has not been recycled normally
+WAL_TRUNCATE_PAGES = 1000
+
 SCHEMA_SQL = """
 -- Main telemetry readings table
 CREATE TABLE IF NOT EXISTS readings (
@@ -101,6 +105,54 @@ CREATE INDEX IF NOT EXISTS idx_readings_id_sensor ON readings(id, sensor_type);
 """
 
 
+INSERT_READING_SQL = """
+INSERT INTO readings (
+    timestamp_utc, sensor_type,
+    latitude, longitude, altitude_m, speed_kmh, heading_deg,
+    satellites, fix_quality,
+    accel_x, accel_y, accel_z, gyro_x, gyro_y, gyro_z,
+    temp_celsius,
+    bus_voltage_v, current_ma, power_mw,
+    pressure_hpa, humidity_pct, env_temp_celsius,
+    gas_resistance_ohms,
+    cpu_temp_celsius, disk_percent, sync_backlog, throttle_flags
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _reading_params(reading: Reading) -> tuple:
+    """Row values for INSERT_READING_SQL, in column order."""
+    return (
+        reading.timestamp_utc.isoformat(),
+        reading.sensor_type.value,
+        reading.latitude,
+        reading.longitude,
+        reading.altitude_m,
+        reading.speed_kmh,
+        reading.heading_deg,
+        reading.satellites,
+        reading.fix_quality,
+        reading.accel_x,
+        reading.accel_y,
+        reading.accel_z,
+        reading.gyro_x,
+        reading.gyro_y,
+        reading.gyro_z,
+        reading.temp_celsius,
+        reading.bus_voltage_v,
+        reading.current_ma,
+        reading.power_mw,
+        reading.pressure_hpa,
+        reading.humidity_pct,
+        reading.env_temp_celsius,
+        reading.gas_resistance_ohms,
+        reading.cpu_temp_celsius,
+        reading.disk_percent,
+        reading.sync_backlog,
+        reading.throttle_flags,
+    )
+
+
 class Database:
     """SQLite database manager with WAL mode for crash resistance.
 
@@ -278,50 +330,7 @@ class Database:
         """
         conn = self._get_connection()
         with self._write_lock:
-            cursor = conn.execute(
-                """
-                INSERT INTO readings (
-                    timestamp_utc, sensor_type,
-                    latitude, longitude, altitude_m, speed_kmh, heading_deg,
-                    satellites, fix_quality,
-                    accel_x, accel_y, accel_z, gyro_x, gyro_y, gyro_z,
-                    temp_celsius,
-                    bus_voltage_v, current_ma, power_mw,
-                    pressure_hpa, humidity_pct, env_temp_celsius,
-                    gas_resistance_ohms,
-                    cpu_temp_celsius, disk_percent, sync_backlog, throttle_flags
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    reading.timestamp_utc.isoformat(),
-                    reading.sensor_type.value,
-                    reading.latitude,
-                    reading.longitude,
-                    reading.altitude_m,
-                    reading.speed_kmh,
-                    reading.heading_deg,
-                    reading.satellites,
-                    reading.fix_quality,
-                    reading.accel_x,
-                    reading.accel_y,
-                    reading.accel_z,
-                    reading.gyro_x,
-                    reading.gyro_y,
-                    reading.gyro_z,
-                    reading.temp_celsius,
-                    reading.bus_voltage_v,
-                    reading.current_ma,
-                    reading.power_mw,
-                    reading.pressure_hpa,
-                    reading.humidity_pct,
-                    reading.env_temp_celsius,
-                    reading.gas_resistance_ohms,
-                    reading.cpu_temp_celsius,
-                    reading.disk_percent,
-                    reading.sync_backlog,
-                    reading.throttle_flags,
-                ),
-            )
+            cursor = conn.execute(INSERT_READING_SQL, _reading_params(reading))
             conn.commit()
             return cursor.lastrowid
 
@@ -341,54 +350,7 @@ class Database:
         with self._write_lock:
             conn.execute("BEGIN IMMEDIATE")
             try:
-                for reading in readings:
-                    conn.execute(
-                        """
-                        INSERT INTO readings (
-                            timestamp_utc, sensor_type,
-                            latitude, longitude, altitude_m, speed_kmh, heading_deg,
-                            satellites, fix_quality,
-                            accel_x, accel_y, accel_z, gyro_x, gyro_y, gyro_z,
-                            temp_celsius,
-                            bus_voltage_v, current_ma, power_mw,
-                            pressure_hpa, humidity_pct, env_temp_celsius,
-                            gas_resistance_ohms,
-                            cpu_temp_celsius, disk_percent, sync_backlog, throttle_flags
-                        ) VALUES (
-                            ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                            ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
-                        )
-                        """,
-                        (
-                            reading.timestamp_utc.isoformat(),
-                            reading.sensor_type.value,
-                            reading.latitude,
-                            reading.longitude,
-                            reading.altitude_m,
-                            reading.speed_kmh,
-                            reading.heading_deg,
-                            reading.satellites,
-                            reading.fix_quality,
-                            reading.accel_x,
-                            reading.accel_y,
-                            reading.accel_z,
-                            reading.gyro_x,
-                            reading.gyro_y,
-                            reading.gyro_z,
-                            reading.temp_celsius,
-                            reading.bus_voltage_v,
-                            reading.current_ma,
-                            reading.power_mw,
-                            reading.pressure_hpa,
-                            reading.humidity_pct,
-                            reading.env_temp_celsius,
-                            reading.gas_resistance_ohms,
-                            reading.cpu_temp_celsius,
-                            reading.disk_percent,
-                            reading.sync_backlog,
-                            reading.throttle_flags,
-                        ),
-                    )
+                conn.executemany(INSERT_READING_SQL, map(_reading_params, readings))
                 conn.execute("COMMIT")
             except Exception:
                 conn.execute("ROLLBACK")
@@ -686,6 +648,60 @@ class Database:
             )
             conn.commit()
 
+    def get_trip_states(self, *keys: str) -> dict[str, Union[float, str]]:
+        """Get several trip state values in one query.
+
+        Args:
+            keys: State key names.
+
+        Returns:
+            Stored value for each key that exists, numeric or text depending
+            on how it was set. Missing keys are omitted.
+        """
+        conn = self._get_connection()
+        placeholders = ", ".join("?" * len(keys))
+        cursor = conn.execute(
+            "SELECT key, COALESCE(value_real, value_text) AS value FROM trip_state"
+            f" WHERE key IN ({placeholders})",
+            keys,
+        )
+        return {row["key"]: row["value"] for row in cursor.fetchall()}
+
+    def set_trip_states(self, values: dict[str, Union[float, str]]) -> None:
+        """Upsert several trip state values in a single transaction.
+
+        Floats are stored as numeric values and strings as text, as with
+        set_trip_state() and set_trip_state_text(), but with one commit.
+
+        Args:
+            values: Mapping of state key name to value.
+        """
+        real_rows = [(k, v) for k, v in values.items() if not isinstance(v, str)]
+        text_rows = [(k, v) for k, v in values.items() if isinstance(v, str)]
+        conn = self._get_connection()
+        with self._write_lock:
+            conn.executemany(
+                """
+                INSERT INTO trip_state (key, value_real, updated_at)
+                VALUES (?, ?, datetime('now'))
+                ON CONFLICT(key) DO UPDATE SET
+                    value_real = excluded.value_real,
+                    updated_at = datetime('now')
+                """,
+                real_rows,
+            )
+            conn.executemany(
+                """
+                INSERT INTO trip_state (key, value_text, updated_at)
+                VALUES (?, ?, datetime('now'))
+                ON CONFLICT(key) DO UPDATE SET
+                    value_text = excluded.value_text,
+                    updated_at = datetime('now')
+                """,
+                text_rows,
+            )
+            conn.commit()
+
     def record_waypoint_reached(
         self, waypoint_index: int, name: str, lat: float, lon: float
     ) -> None:
@@ -734,15 +750,25 @@ class Database:
         conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
 
     def checkpoint_wal(self) -> None:
-        """Run a TRUNCATE WAL checkpoint and log only when pages were checkpointed.
-
-        Uses TRUNCATE mode so the WAL file is zeroed after a successful
-        full checkpoint. Silent when the WAL was already clean (no pages to
-        checkpoint). Logs at INFO level only when work was actually done.
+        """Checkpoint the WAL, truncating it only once it has grown large.
+
+        A PASSIVE checkpoint copies whatever it can without waiting on
+        readers, such as a batch sync query on another thread, so it never
+        stalls the caller. Only when the WAL holds more than
+        WAL_TRUNCATE_PAGES frames, meaning readers have kept SQLite from
+        recycling it, is it escalated to TRUNCATE. That mode waits out
+        readers (up to busy_timeout) and zeroes the file; only a truncation
+        is logged at INFO level.
         """
         conn = self._get_connection()
         with self._write_lock:
-            cursor = conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
-            row = cursor.fetchone()
-        if row is not None and row[2] > 0:
-            log.info("wal_checkpoint_completed", pages_checkpointed=row[2], pages_in_wal=row[1])
+            row = conn.execute("PRAGMA wal_checkpoint(PASSIVE)").fetchone()
+            if row is None or row[1] <= WAL_TRUNCATE_PAGES:
+                return
+            busy = conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()[0]
+        log.info(
+            "wal_checkpoint_completed",
+            pages_checkpointed=row[2],
+            pages_in_wal=row[1],
+            truncated=not busy,
+        )
@@ -12,9 +12,10 @@ from tenacity import retry, stop_after_attempt, wait_exponential
 from shitbox.storage.database import Database
 from shitbox.storage.models import Reading
 from shitbox.sync.connection import ConnectionMonitor
-from shitbox.sync.prometheus_write import encode_remote_write
+from shitbox.sync.prometheus_write import REMOTE_WRITE_HEADERS, encode_remote_write
 from shitbox.utils.config import PrometheusConfig
 from shitbox.utils.logging import get_logger
+from shitbox.utils.priority import lower_thread_priority
 
 log = get_logger(__name__)
 
@@ -68,6 +69,10 @@ class BatchSyncService:
         self._cursor_name = "prometheus"
         self._too_old_failures: int = 0
         self._too_old_cursor: int = -1
+        # Keep-alive connection reused across batches instead of a new
+        # TCP/TLS handshake every interval
+        self._session = requests.Session()
+        self._session.headers.update(REMOTE_WRITE_HEADERS)
 
         # Cumulative stats for sync state logging
         self._total_synced: int = 0
@@ -89,7 +94,7 @@ class BatchSyncService:
         )
 
         self._running = True
-        self._thread = threading.Thread(target=self._sync_loop, daemon=True)
+        self._thread = threading.Thread(target=self._sync_loop, daemon=True, name="batch-sync")
         self._thread.start()
 
     def stop(self) -> None:
@@ -97,9 +102,11 @@ class BatchSyncService:
         self._running = False
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=5.0)
+        self._session.close()
 
     def _sync_loop(self) -> None:
         """Main sync loop."""
+        lower_thread_priority()
         while self._running:
             # Wait for interval
             time.sleep(self.config.batch_interval_seconds)
@@ -463,14 +470,9 @@ class BatchSyncService:
 
         t0 = time.monotonic()
         try:
-            response = requests.post(
+            response = self._session.post(
                 self.config.remote_write_url,
                 data=data,
-                headers={
-                    "Content-Type": "application/x-protobuf",
-                    "Content-Encoding": "snappy",
-                    "X-Prometheus-Remote-Write-Version": "0.1.0",
-                },
                 timeout=30,
             )
         except requests.RequestException as e:
@@ -572,5 +574,5 @@ class BatchSyncService:
         if not self.connection.is_connected:
             return False
 
-        threading.Thread(target=self._sync_batch, daemon=True).start()
+        threading.Thread(target=self._sync_batch, daemon=True, name="batch-sync-now").start()
         return True
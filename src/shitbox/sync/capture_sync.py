@@ -2,13 +2,13 @@
 
 import subprocess
 import threading
-import time
 from typing import Optional
 
 from shitbox.events.storage import EventStorage
 from shitbox.sync.connection import ConnectionMonitor
 from shitbox.utils.config import CaptureSyncConfig
 from shitbox.utils.logging import get_logger
+from shitbox.utils.priority import lower_thread_priority
 
 log = get_logger(__name__)
 
@@ -39,6 +39,8 @@ class CaptureSyncService:
         self._running = False
         self._thread: Optional[threading.Thread] = None
         self._sync_lock = threading.Lock()
+        # Set by request_sync() and stop() to wake the loop before the interval
+        self._wake = threading.Event()
 
     def start(self) -> None:
         """Start the capture sync service."""
@@ -52,24 +54,43 @@ class CaptureSyncService:
         )
 
         self._running = True
-        self._thread = threading.Thread(target=self._sync_loop, daemon=True)
+        self._wake.clear()
+        self._thread = threading.Thread(target=self._sync_loop, daemon=True, name="capture-sync")
         self._thread.start()
 
     def stop(self) -> None:
         """Stop the capture sync service."""
         self._running = False
+        self._wake.set()
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=5.0)
 
+    def request_sync(self) -> None:
+        """Ask the sync thread to sync now instead of at the next interval.
+
+        Returns immediately; requests made while a sync is pending or
+        running are folded into one.
+        """
+        self._wake.set()
+
     def _sync_loop(self) -> None:
         """Main sync loop."""
+        lower_thread_priority()  # rsync inherits it
         while self._running:
-            time.sleep(self.config.interval_seconds)
+            requested = self._wake.wait(self.config.interval_seconds)
+            self._wake.clear()
 
             if not self._running:
                 break
 
-            if not self.connection.is_connected:
+            if requested:
+                # The monitor's cached state can be a full check interval
+                # old; probe now so a fresh capture goes up straight away
+                connected = self.connection.check_connectivity()
+                log.info("capture_sync_requested", connected=connected)
+            else:
+                connected = self.connection.is_connected
+            if not connected:
                 log.debug("capture_sync_skipped_no_connection")
                 continue
 
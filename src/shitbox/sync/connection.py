@@ -88,7 +88,9 @@ class ConnectionMonitor:
         )
 
         self._running = True
-        self._thread = threading.Thread(target=self._monitor_loop, daemon=True)
+        self._thread = threading.Thread(
+            target=self._monitor_loop, daemon=True, name="connection-monitor"
+        )
         self._thread.start()
 
     def stop(self) -> None:
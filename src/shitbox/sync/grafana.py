@@ -1,6 +1,8 @@
 """Grafana annotation client for driving events."""
 
+import queue
 import threading
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -12,6 +14,14 @@ from shitbox.utils.logging import get_logger
 
 log = get_logger(__name__)
 
+ANNOTATION_QUEUE_SIZE = 128
+POST_ATTEMPTS = 3
+RETRY_BACKOFF_S = 2.0
+STOP_TIMEOUT_S = 10.0
+
+# Queued after the last annotation to tell the worker to exit
+_STOP = object()
+
 
 class GrafanaAnnotator:
     """Posts annotations to Grafana when driving events are detected."""
@@ -24,9 +34,21 @@ class GrafanaAnnotator:
             "Authorization": f"Bearer {config.api_token}",
             "Content-Type": "application/json",
         }
+        self._queue: queue.Queue = queue.Queue(maxsize=ANNOTATION_QUEUE_SIZE)
+        self._worker: Optional[threading.Thread] = None
+        # Serialises producers and worker start/stop
+        self._worker_lock = threading.Lock()
+        self._stopped = False
 
     def annotate_event(self, event: Event, video_path: Optional[Path] = None) -> None:
-        """Post an annotation for a driving event in a background thread."""
+        """Queue an annotation for a driving event.
+
+        Annotations are posted in order by one background worker. When the
+        queue is full the oldest annotation is dropped. Does nothing once
+        stop() has been called.
+        """
+        if self._stopped:
+            return
         text = (
             f"{event.event_type.value} \u2014 peak {event.peak_value:.2f}g, "
             f"{event.duration:.1f}s"
@@ -48,25 +70,101 @@ class GrafanaAnnotator:
             "text": text,
         }
 
-        t = threading.Thread(target=self._post_annotation, args=(payload,), daemon=True)
-        t.start()
+        self._enqueue(payload)
+        self._ensure_worker()
+
+    def stop(self, timeout: float = STOP_TIMEOUT_S) -> None:
+        """Post the annotations already queued, then stop the worker.
+
+        Args:
+            timeout: Seconds to wait for the queue to drain.
+        """
+        with self._worker_lock:
+            self._stopped = True
+            worker = self._worker
+            self._worker = None
+        if worker is None or not worker.is_alive():
+            return
+        self._enqueue(_STOP)
+        worker.join(timeout=timeout)
+        if worker.is_alive():
+            log.warning("grafana_annotator_stop_timeout", unsent=self._queue.qsize() - 1)
+
+    def _enqueue(self, item: object) -> None:
+        """Queue an item without blocking, dropping the oldest annotation when full.
+
+        The stop sentinel is never dropped: if it is the oldest item it goes
+        back on the queue and the next annotation is dropped instead.
+        """
+        with self._worker_lock:
+            while True:
+                try:
+                    self._queue.put_nowait(item)
+                    return
+                except queue.Full:
+                    try:
+                        dropped = self._queue.get_nowait()
+                    except queue.Empty:
+                        continue
+                    if dropped is _STOP:
+                        # Producers hold the lock and the worker only takes,
+                        # so the slot just freed is still free
+                        self._queue.put_nowait(_STOP)
+                        if self._queue.qsize() > 1:
+                            continue
+                        return  # Only the stop is queued; the worker is exiting
+                    log.warning("grafana_annotation_dropped", tags=dropped.get("tags"))
 
-    def _post_annotation(self, payload: dict) -> None:
-        """POST annotation to Grafana API."""
+    def _ensure_worker(self) -> None:
+        """Start the posting thread on first use; never after stop()."""
+        with self._worker_lock:
+            if self._stopped:
+                return
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._worker_loop, name="grafana-annotator", daemon=True
+                )
+                self._worker.start()
+
+    def _worker_loop(self) -> None:
+        """Post queued annotations one at a time over a shared session."""
+        session = requests.Session()
+        session.headers.update(self._headers)
         try:
-            resp = requests.post(
-                self._url,
-                json=payload,
-                headers=self._headers,
-                timeout=self._config.timeout_seconds,
-            )
-            if resp.ok:
-                log.info("grafana_annotation_posted", tags=payload.get("tags"))
-            else:
+            while True:
+                payload = self._queue.get()
+                if payload is _STOP:
+                    return
+                self._post_annotation(session, payload)
+        finally:
+            session.close()
+
+    def _post_annotation(self, session: requests.Session, payload: dict) -> bool:
+        """POST annotation to Grafana API, retrying network and server errors.
+
+        Returns:
+            True if Grafana accepted the annotation.
+        """
+        for attempt in range(POST_ATTEMPTS):
+            if attempt:
+                time.sleep(RETRY_BACKOFF_S * 2 ** (attempt - 1))
+            try:
+                resp = session.post(
+                    self._url,
+                    json=payload,
+                    timeout=self._config.timeout_seconds,
+                )
+                if resp.ok:
+                    log.info("grafana_annotation_posted", tags=payload.get("tags"))
+                    return True
                 log.warning(
                     "grafana_annotation_failed",
                     status=resp.status_code,
                     body=resp.text[:200],
+                    attempt=attempt + 1,
                 )
-        except Exception as e:
-            log.warning("grafana_annotation_error", error=str(e))
+                if resp.status_code < 500:
+                    return False  # Rejected; resending the same payload won't help
+            except Exception as e:
+                log.warning("grafana_annotation_error", error=str(e), attempt=attempt + 1)
+        return False
@@ -4,7 +4,8 @@ import json
 import queue
 import threading
 import time
-from typing import Optional
+from types import ModuleType
+from typing import Optional, Union
 
 import paho.mqtt.client as mqtt
 
@@ -14,6 +15,22 @@ from shitbox.utils.logging import get_logger
 
 log = get_logger(__name__)
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to stdlib json
+    orjson: Optional[ModuleType] = None  # type: ignore[no-redef]
+
+
+def _dumps(payload: dict) -> Union[str, bytes]:
+    """Serialise a payload for publishing.
+
+    orjson returns UTF-8 bytes, which paho publishes as-is; stdlib json
+    returns a str that paho encodes on publish.
+    """
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload)
+
 
 class MQTTPublisher:
     """Publish telemetry data to MQTT broker.
@@ -102,7 +119,7 @@ class MQTTPublisher:
         # Start publish thread
         self._running = True
         self._publish_thread = threading.Thread(
-            target=self._publish_loop, daemon=True
+            target=self._publish_loop, daemon=True, name="mqtt-publisher"
         )
         self._publish_thread.start()
 
@@ -178,7 +195,7 @@ class MQTTPublisher:
             return False
 
         topic = f"{self.config.topic_prefix}/{reading.sensor_type.value}"
-        payload = json.dumps(reading.to_mqtt_payload())
+        payload = _dumps(reading.to_mqtt_payload())
 
         try:
             self._message_queue.put_nowait((topic, payload))
@@ -200,12 +217,34 @@ class MQTTPublisher:
             return False
 
         topic = f"{self.config.topic_prefix}/status/health"
-        payload = json.dumps(health.to_mqtt_payload())
+        payload = _dumps(health.to_mqtt_payload())
+
+        try:
+            self._message_queue.put_nowait((topic, payload))
+            return True
+        except queue.Full:
+            return False
+
+    def publish_event(self, event_payload: dict) -> bool:
+        """Queue a detected event for publishing.
+
+        Args:
+            event_payload: Event as returned by Event.to_dict().
+
+        Returns:
+            True if queued, False if queue is full.
+        """
+        if not self._running:
+            return False
+
+        topic = f"{self.config.topic_prefix}/event"
+        payload = _dumps(event_payload)
 
         try:
             self._message_queue.put_nowait((topic, payload))
             return True
         except queue.Full:
+            log.warning("mqtt_queue_full", dropped_event=event_payload.get("type"))
             return False
 
     def _publish_loop(self) -> None:
@@ -3,6 +3,7 @@
 Implements the protobuf + snappy format required by Prometheus remote_write API.
 """
 
+import functools
 import struct
 from typing import List, Tuple
 
@@ -13,6 +14,13 @@ WIRE_VARINT = 0
 WIRE_FIXED64 = 1
 WIRE_LENGTH_DELIMITED = 2
 
+# The remote_write spec requires snappy on every request, however small
+REMOTE_WRITE_HEADERS = {
+    "Content-Type": "application/x-protobuf",
+    "Content-Encoding": "snappy",
+    "X-Prometheus-Remote-Write-Version": "0.1.0",
+}
+
 
 def _encode_varint(value: int) -> bytes:
     """Encode an integer as a protobuf varint."""
@@ -70,31 +78,42 @@ def _encode_sample(value: float, timestamp_ms: int) -> bytes:
     return _encode_double(1, value) + _encode_int64(2, timestamp_ms)
 
 
-def _encode_timeseries(
-    labels: List[Tuple[str, str]], samples: List[Tuple[float, int]]
-) -> bytes:
+@functools.lru_cache(maxsize=1024)
+def _encode_labels(metric_name: str, labels: Tuple[Tuple[str, str], ...]) -> bytes:
+    """Encode the repeated Label fields of a TimeSeries, __name__ first.
+
+    A batch repeats the same few metric names and label sets thousands of
+    times, so the encoded block is cached and only samples are encoded
+    per series.
+    """
+    result = bytearray()
+    for name, value in (("__name__", metric_name),) + labels:
+        label_data = _encode_label(name, value)
+        result += _encode_field(1, WIRE_LENGTH_DELIMITED, _encode_varint(len(label_data)))
+        result += label_data
+    return bytes(result)
+
+
+def _encode_timeseries(label_block: bytes, samples: List[Tuple[float, int]]) -> bytes:
     """Encode a TimeSeries message.
 
     message TimeSeries {
         repeated Label labels = 1;
         repeated Sample samples = 2;
     }
-    """
-    result = b""
 
-    for name, value in labels:
-        label_data = _encode_label(name, value)
-        result += _encode_field(
-            1, WIRE_LENGTH_DELIMITED, _encode_varint(len(label_data)) + label_data
-        )
+    Args:
+        label_block: Encoded label fields from _encode_labels().
+        samples: List of (value, timestamp_ms).
+    """
+    result = bytearray(label_block)
 
     for value, timestamp_ms in samples:
         sample_data = _encode_sample(value, timestamp_ms)
-        result += _encode_field(
-            2, WIRE_LENGTH_DELIMITED, _encode_varint(len(sample_data)) + sample_data
-        )
+        result += _encode_field(2, WIRE_LENGTH_DELIMITED, _encode_varint(len(sample_data)))
+        result += sample_data
 
-    return result
+    return bytes(result)
 
 
 def _encode_write_request(timeseries_list: List[bytes]) -> bytes:
@@ -104,12 +123,13 @@ def _encode_write_request(timeseries_list: List[bytes]) -> bytes:
         repeated TimeSeries timeseries = 1;
     }
     """
-    result = b""
+    # Appending to one bytearray grows it in place. Concatenating bytes copied
+    # the whole request so far for every series, quadratic in the batch size.
+    result = bytearray()
     for ts_data in timeseries_list:
-        result += _encode_field(
-            1, WIRE_LENGTH_DELIMITED, _encode_varint(len(ts_data)) + ts_data
-        )
-    return result
+        result += _encode_field(1, WIRE_LENGTH_DELIMITED, _encode_varint(len(ts_data)))
+        result += ts_data
+    return bytes(result)
 
 
 def encode_remote_write(
@@ -126,12 +146,8 @@ def encode_remote_write(
     timeseries_list = []
 
     for metric_name, labels, value, timestamp_ms in metrics:
-        # Build labels list - __name__ must be first
-        label_pairs = [("__name__", metric_name)]
-        label_pairs.extend(sorted(labels.items()))
-
-        ts_data = _encode_timeseries(label_pairs, [(value, timestamp_ms)])
-        timeseries_list.append(ts_data)
+        label_block = _encode_labels(metric_name, tuple(sorted(labels.items())))
+        timeseries_list.append(_encode_timeseries(label_block, [(value, timestamp_ms)]))
 
     write_request = _encode_write_request(timeseries_list)
     return snappy.compress(write_request)
@@ -6,6 +6,10 @@ from typing import Any, List
 
 import yaml
 
+# libyaml's C loader when PyYAML was built against it; it parses the same
+# documents as SafeLoader several times faster
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass
 class WaypointConfig:
@@ -60,6 +64,7 @@ class TemperatureConfig:
     i2c_bus: int = 1
     address: int = 0x18
     sample_rate_hz: float = 0.1
+    i2c_frequency_hz: int = 400_000  # Needs dtparam=i2c_arm_baudrate=400000
 
 
 @dataclass
@@ -250,7 +255,9 @@ class OLEDConfig:
     enabled: bool = False
     i2c_bus: int = 1
     address: int = 0x3C
-    update_interval_seconds: float = 1.0
+    update_interval_seconds: float = 1.0  # Longest gap between redraws
+    min_interval_seconds: float = 0.2  # Shortest gap, when the engine signals changes
+    i2c_frequency_hz: int = 400_000  # Needs dtparam=i2c_arm_baudrate=400000
 
 
 @dataclass
@@ -332,7 +339,7 @@ def load_config(config_path: str | Path | None = None) -> Config:
         return Config()
 
     with open(config_file) as f:
-        data = yaml.safe_load(f) or {}
+        data = yaml.load(f, Loader=_YAML_LOADER) or {}
 
     # Build config from nested dataclasses
     capture_data = data.get("capture", {})
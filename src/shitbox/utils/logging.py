@@ -25,6 +25,10 @@ def setup_logging(log_level: str = "INFO") -> None:
     # Configure structlog
     structlog.configure(
         processors=[
+            # Drop events below the configured level before any other
+            # processor runs; otherwise filtered debug calls are still
+            # timestamped and rendered, then discarded by stdlib logging
+            structlog.stdlib.filter_by_level,
             # Add log level to event dict
             structlog.stdlib.add_log_level,
             # Add timestamp
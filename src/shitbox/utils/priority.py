@@ -0,0 +1,26 @@
+"""Scheduling priority helpers for background threads."""
+
+import os
+
+from shitbox.utils.logging import get_logger
+
+log = get_logger(__name__)
+
+BACKGROUND_NICE_INCREMENT = 10
+
+
+def lower_thread_priority(increment: int = BACKGROUND_NICE_INCREMENT) -> None:
+    """Raise the calling thread's nice value so it yields to the IMU sampler.
+
+    On Linux the nice value is per thread, so only the caller (and any
+    subprocess it spawns, such as rsync) is affected. SCHED_IDLE is avoided
+    on purpose: an idle-class thread preempted while holding the GIL could
+    stall the sampler until the CPU goes idle.
+
+    Args:
+        increment: Amount to add to the thread's nice value.
+    """
+    try:
+        os.nice(increment)
+    except OSError as e:
+        log.debug("thread_priority_unchanged", error=str(e))
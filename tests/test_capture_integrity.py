@@ -19,6 +19,7 @@ Tests cover:
     - Partial save (pre-only) still produces a valid callback path
 """
 
+import itertools
 import threading
 import time
 from pathlib import Path
@@ -393,8 +394,9 @@ def test_boot_save_skipped_no_segments(tmp_path: Path) -> None:
 
     # Engine state
     engine._pending_post_capture = {}
-    engine._event_json_paths = {}
-    engine._event_video_paths = {}
+    engine._awaiting_video = {}
+    engine._capture_lock = threading.Lock()
+    engine._capture_ids = itertools.count(1)
     engine._current_lat = None
     engine._current_lon = None
     engine._current_speed_kmh = 0.0
@@ -513,3 +515,226 @@ def test_partial_save_pre_only(tmp_path: Path) -> None:
     assert callback_result == [valid_path], (
         "Partial save (pre-event segments only) should still deliver valid path to callback"
     )
+
+
+def _make_capture_engine(tmp_path: Path):
+    """Engine with just the state the capture bookkeeping touches."""
+    from shitbox.events.engine import UnifiedEngine
+
+    engine = UnifiedEngine.__new__(UnifiedEngine)
+    engine.config = MagicMock()
+    engine.config.detector.post_event_seconds = 0.0
+    engine.config.uplink_enabled = False
+    engine.config.captures_dir = str(tmp_path)
+    engine._pending_post_capture = {}
+    engine._awaiting_video = {}
+    engine._capture_lock = threading.Lock()
+    engine._events_json_dirty = False
+    engine.ring_buffer = MagicMock()
+    engine.ring_buffer.get_since.return_value = []
+    engine.event_storage = MagicMock()
+    engine.event_storage.save_event.return_value = (tmp_path / "event.json", None)
+    engine.grafana = None
+    engine.oled_display = None
+    engine.events_captured = 0
+    return engine
+
+
+def _queue_capture(engine, capture_id: int, awaiting_video: bool):
+    from shitbox.events.engine import PendingCapture
+    from shitbox.events.storage import Event, EventType
+
+    event = Event(
+        event_type=EventType.HIGH_G,
+        start_time=time.time(),
+        end_time=time.time(),
+        peak_value=1.0,
+        peak_ax=0.0,
+        peak_ay=1.0,
+        peak_az=1.0,
+    )
+    engine._pending_post_capture[capture_id] = PendingCapture(
+        event=event, capture_until=0.0, awaiting_video=awaiting_video
+    )
+    return event
+
+
+def test_late_video_updates_saved_event(tmp_path: Path) -> None:
+    """A video that finishes after the event is saved is attached to that event's JSON."""
+    engine = _make_capture_engine(tmp_path)
+    _queue_capture(engine, 1, awaiting_video=True)
+
+    with patch.object(engine, "_find_capture_video", return_value=None):
+        engine._check_post_captures()
+
+    assert engine._pending_post_capture == {}
+    assert 1 in engine._awaiting_video
+
+    video = tmp_path / "high_g.mp4"
+    with patch("shitbox.capture.buzzer.beep_capture_end"), patch(
+        "shitbox.capture.speaker.speak_capture_end"
+    ):
+        engine._on_video_complete(1, video)
+
+    engine.event_storage.update_event_video.assert_called_once_with(
+        tmp_path / "event.json", video
+    )
+    assert engine._awaiting_video == {}
+    assert engine.event_storage.generate_events_json.call_count == 1
+
+    # The callback only marks the index dirty; the telemetry thread rebuilds it
+    engine._check_post_captures()
+    assert engine.event_storage.generate_events_json.call_count == 2
+    engine._check_post_captures()
+    assert engine.event_storage.generate_events_json.call_count == 2
+
+
+def test_early_video_is_saved_with_event(tmp_path: Path) -> None:
+    """A video that finishes inside the post-event window is saved with the event."""
+    engine = _make_capture_engine(tmp_path)
+    event = _queue_capture(engine, 7, awaiting_video=True)
+
+    video = tmp_path / "high_g.mp4"
+    with patch("shitbox.capture.buzzer.beep_capture_end"), patch(
+        "shitbox.capture.speaker.speak_capture_end"
+    ):
+        engine._on_video_complete(7, video)
+    engine._check_post_captures()
+
+    engine.event_storage.save_event.assert_called_once_with(event, video_path=video)
+    engine.event_storage.update_event_video.assert_not_called()
+    assert engine._pending_post_capture == {}
+    assert engine._awaiting_video == {}
+
+
+def test_video_finishing_during_save_updates_event(tmp_path: Path) -> None:
+    """A video callback that lands while the event JSON is written is not lost."""
+    engine = _make_capture_engine(tmp_path)
+    event = _queue_capture(engine, 3, awaiting_video=True)
+    video = tmp_path / "high_g.mp4"
+
+    def save_event(saved_event, video_path=None):
+        with patch("shitbox.capture.buzzer.beep_capture_end"), patch(
+            "shitbox.capture.speaker.speak_capture_end"
+        ):
+            engine._on_video_complete(3, video)
+        return tmp_path / "event.json", None
+
+    engine.event_storage.save_event.side_effect = save_event
+    with patch.object(engine, "_find_capture_video", return_value=None):
+        engine._check_post_captures()
+
+    engine.event_storage.save_event.assert_called_once_with(event, video_path=None)
+    engine.event_storage.update_event_video.assert_called_once_with(
+        tmp_path / "event.json", video
+    )
+    assert engine._pending_post_capture == {}
+    assert engine._awaiting_video == {}
+
+
+def test_events_json_rebuilt_once_per_batch(tmp_path: Path) -> None:
+    """Several captures completing in one pass regenerate events.json once."""
+    engine = _make_capture_engine(tmp_path)
+    for capture_id in (1, 2, 3):
+        _queue_capture(engine, capture_id, awaiting_video=False)
+
+    with patch.object(engine, "_find_capture_video", return_value=None):
+        engine._check_post_captures()
+
+    assert engine.event_storage.save_event.call_count == 3
+    engine.event_storage.generate_events_json.assert_called_once_with()
+    assert engine._events_json_dirty is False
+
+
+def test_saved_captures_request_one_background_sync(tmp_path: Path) -> None:
+    """Saving captures asks the sync thread to upload once, without probing inline."""
+    engine = _make_capture_engine(tmp_path)
+    engine.config.uplink_enabled = True
+    engine.connection = MagicMock()
+    engine.capture_sync = MagicMock()
+    for capture_id in (1, 2):
+        _queue_capture(engine, capture_id, awaiting_video=False)
+
+    with patch.object(engine, "_find_capture_video", return_value=None):
+        engine._check_post_captures()
+        engine._check_post_captures()  # Nothing new saved
+
+    engine.capture_sync.request_sync.assert_called_once_with()
+    engine.capture_sync._do_sync.assert_not_called()
+    engine.connection.check_connectivity.assert_not_called()
+
+
+def test_find_capture_video_picks_newest_matching_mp4(tmp_path: Path) -> None:
+    """Only <event_type>_*.mp4 files in the event's local day count; the newest wins."""
+    import os
+
+    engine = _make_capture_engine(tmp_path)
+    event = _queue_capture(engine, 1, awaiting_video=False)
+    day = time.strftime("%Y-%m-%d", time.localtime(event.start_time))
+
+    assert engine._find_capture_video(event) is None  # No day directory yet
+
+    day_dir = tmp_path / day
+    day_dir.mkdir()
+    for name, mtime in [
+        ("high_g_100.mp4", 100),
+        ("high_g_300.mp4", 300),
+        ("high_g_200.mp4", 200),
+        ("high_g_900.json", 900),
+        ("hard_brake_900.mp4", 900),
+    ]:
+        (day_dir / name).touch()
+        os.utime(day_dir / name, (mtime, mtime))
+
+    assert engine._find_capture_video(event) == day_dir / "high_g_300.mp4"
+
+
+def test_recorder_video_path_kept_for_event(tmp_path: Path) -> None:
+    """Without a ring buffer, the recorder's output path is saved with the event."""
+    from shitbox.events.engine import UnifiedEngine
+
+    engine = _make_capture_engine(tmp_path)
+    engine.config.capture_video_duration = 60
+    engine._capture_ids = itertools.count(1)
+    engine._current_lat = None
+    engine._current_lon = None
+    engine._current_speed_kmh = 0.0
+    engine._current_location_name = None
+    engine._distance_from_start_km = None
+    engine._distance_to_destination_km = None
+    engine.mqtt = None
+    engine.video_ring_buffer = None
+    engine.video_recorder = MagicMock()
+    engine.video_recorder.is_recording = False
+    video = tmp_path / "high_g_120000_001.mp4"
+    engine.video_recorder.start_recording.return_value = video
+
+    event = _queue_capture(engine, 99, awaiting_video=False)
+    del engine._pending_post_capture[99]
+    UnifiedEngine._on_event(engine, event)
+
+    pending = engine._pending_post_capture[1]
+    assert pending.video_path == video
+    assert pending.awaiting_video is False
+
+
+def test_cleanup_by_size_deletes_oldest_down_to_ninety_percent(tmp_path: Path) -> None:
+    """Oldest event files go first until storage is back under 90% of the limit."""
+    import os
+
+    from shitbox.events.storage import EventStorage
+
+    storage = EventStorage(base_dir=str(tmp_path / "events"))
+    storage.max_size_mb = 100_000 / (1024 * 1024)  # 100 kB
+    day_dir = tmp_path / "events" / "2026-03-01"
+    day_dir.mkdir(parents=True)
+    for i in range(12):
+        path = day_dir / f"event_{i:02d}.json"
+        path.write_bytes(b"x" * 10_000)
+        os.utime(path, (1000 + i, 1000 + i))
+
+    assert storage.cleanup_by_size() == 3  # 120 kB -> 90 kB
+    assert sorted(p.name for p in day_dir.iterdir()) == [
+        f"event_{i:02d}.json" for i in range(3, 12)
+    ]
+    assert storage.cleanup_by_size() == 0  # Under the limit now
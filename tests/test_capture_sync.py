@@ -0,0 +1,63 @@
+"""Tests for CaptureSyncService scheduling."""
+
+import time
+from unittest.mock import MagicMock, patch
+
+from shitbox.sync.capture_sync import CaptureSyncService
+from shitbox.utils.config import CaptureSyncConfig
+
+
+def _make_service(connected: bool) -> CaptureSyncService:
+    connection = MagicMock()
+    connection.is_connected = False  # Stale monitor state
+    connection.check_connectivity.return_value = connected
+    return CaptureSyncService(
+        CaptureSyncConfig(enabled=True, interval_seconds=3600), connection, "/tmp/captures"
+    )
+
+
+def _wait_for(predicate) -> bool:
+    for _ in range(200):
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_request_sync_runs_on_sync_thread_with_fresh_probe() -> None:
+    """request_sync() returns at once; the sync thread probes and syncs well before the interval."""
+    service = _make_service(connected=True)
+    with patch.object(service, "_do_sync") as do_sync:
+        service.start()
+        try:
+            service.request_sync()
+            assert _wait_for(lambda: do_sync.call_count == 1)
+        finally:
+            service.stop()
+
+    service.connection.check_connectivity.assert_called_once_with()
+
+
+def test_request_sync_skipped_when_probe_fails() -> None:
+    """No rsync is attempted when the on-demand probe finds no uplink."""
+    service = _make_service(connected=False)
+    with patch.object(service, "_do_sync") as do_sync:
+        service.start()
+        try:
+            service.request_sync()
+            assert _wait_for(lambda: service.connection.check_connectivity.called)
+        finally:
+            service.stop()
+
+    do_sync.assert_not_called()
+
+
+def test_stop_wakes_the_sync_loop() -> None:
+    """stop() does not wait out the sync interval."""
+    service = _make_service(connected=True)
+    service.start()
+    t0 = time.monotonic()
+    service.stop()
+
+    assert time.monotonic() - t0 < 1.0
+    assert not service._thread.is_alive()
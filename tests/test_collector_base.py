@@ -0,0 +1,39 @@
+"""Unit tests for BaseCollector error-rate tracking."""
+
+from typing import Optional
+
+from shitbox.collectors.base import ERROR_RATE_MIN_SAMPLES, BaseCollector
+from shitbox.storage.models import Reading, SensorType
+
+
+class _FakeCollector(BaseCollector[float]):
+    """Minimal concrete collector reporting a CPU temperature."""
+
+    def setup(self) -> None:
+        pass
+
+    def read(self) -> Optional[float]:
+        return None
+
+    def to_reading(self, data: float) -> Reading:
+        return Reading(sensor_type=SensorType.SYSTEM, cpu_temp_celsius=data)
+
+
+def test_isolated_failure_does_not_trip_error_rate() -> None:
+    """A single transient failure amongst successes never exceeds the threshold."""
+    collector = _FakeCollector(name="fake", sample_rate_hz=1.0)
+    outcomes = [False] * 50 + [True] + [False] * 50
+    assert not any(collector._error_rate_exceeded(failed) for failed in outcomes)
+
+
+def test_sustained_failures_trip_error_rate() -> None:
+    """A mostly-failing sensor trips the EWMA threshold despite interleaved successes."""
+    collector = _FakeCollector(name="fake", sample_rate_hz=1.0)
+    tripped_at = None
+    for i in range(500):
+        # Two failures for every success: never 10 consecutive errors
+        if collector._error_rate_exceeded(i % 3 != 0):
+            tripped_at = i
+            break
+    assert tripped_at is not None
+    assert tripped_at + 1 >= ERROR_RATE_MIN_SAMPLES
@@ -0,0 +1,22 @@
+"""Tests for YAML configuration loading."""
+
+from pathlib import Path
+
+import yaml
+
+from shitbox.events.engine import EngineConfig
+from shitbox.utils import config as config_module
+from shitbox.utils.config import load_config
+
+REPO_CONFIG = Path(__file__).resolve().parent.parent / "config" / "config.yaml"
+
+
+def test_shipped_config_loads_the_same_with_either_yaml_loader(monkeypatch) -> None:
+    """The C loader, when present, builds the same config as the pure-Python one."""
+    fast = EngineConfig.from_yaml_config(load_config(REPO_CONFIG))
+
+    monkeypatch.setattr(config_module, "_YAML_LOADER", yaml.SafeLoader)
+    slow = EngineConfig.from_yaml_config(load_config(REPO_CONFIG))
+
+    assert fast == slow
+    assert fast.oled_i2c_frequency_hz == 400_000
@@ -0,0 +1,89 @@
+"""Unit tests for EventDetector threshold logic."""
+
+import math
+import random
+
+import pytest
+
+from shitbox.events.detector import DetectorConfig, EventDetector, EventType
+from shitbox.events.ring_buffer import IMUSample, RingBuffer
+
+
+def _reference_stddev(values: list) -> float:
+    """Population standard deviation computed the slow, obvious way."""
+    mean = sum(values) / len(values)
+    return math.sqrt(sum((v - mean) ** 2 for v in values) / len(values))
+
+
+def test_rough_road_window_matches_reference_stddev() -> None:
+    """Running-sum variance agrees with a full recompute over the same window."""
+    detector = EventDetector(RingBuffer(), DetectorConfig(rough_road_window_ms=500))
+    size = detector._az_window_size
+    rng = random.Random(42)
+    history: list = []
+
+    for i in range(10 * size + 7):
+        az = 1.0 + rng.gauss(0.0, 0.4 if (i // 120) % 2 else 0.05)
+        history.append(az)
+        variance = detector._update_az_window(az)
+        if len(history) < size:
+            assert variance is None
+        else:
+            expected = _reference_stddev(history[-size:])
+            assert math.sqrt(variance) == pytest.approx(expected, abs=1e-9)
+
+
+def _sample(t: float, ax: float = 0.0, ay: float = 0.0, az: float = 1.0) -> IMUSample:
+    return IMUSample(timestamp=t, ax=ax, ay=ay, az=az, gx=0.0, gy=0.0, gz=0.0)
+
+
+def test_high_g_event_reports_combined_magnitude() -> None:
+    """HIGH_G fires on the squared-magnitude check and reports the true peak g."""
+    events: list = []
+    detector = EventDetector(
+        RingBuffer(), DetectorConfig(cooldown_seconds=0.0), on_event=events.append
+    )
+    t = 1_700_000_000.0
+    for i in range(30):  # 300 ms at ~0.89g combined; neither axis alone triggers
+        detector.process_sample(_sample(t + i * 0.01, ax=0.8, ay=0.4))
+    detector.process_sample(_sample(t + 0.3))
+
+    high_g = [e for e in events if e.event_type == EventType.HIGH_G]
+    assert len(high_g) == 1
+    assert high_g[0].peak_value == pytest.approx(math.hypot(0.8, 0.4))
+    assert [e.event_type for e in events] == [EventType.HIGH_G]
+
+
+def _run(detector: EventDetector, samples: list) -> list:
+    """Feed samples one at a time and collect the events process_sample completes."""
+    events = [detector.process_sample(s) for s in samples]
+    return [e for e in events if e is not None]
+
+
+def test_process_sample_returns_completed_event() -> None:
+    """process_sample returns the event it completes once braking stops."""
+    detector = EventDetector(RingBuffer(), DetectorConfig(cooldown_seconds=0.0))
+    t = 1_700_000_000.0
+    braking = [_sample(t + i * 0.01, ax=-0.6) for i in range(40)]
+    recovery = [_sample(t + 0.4 + i * 0.01) for i in range(10)]
+
+    events = _run(detector, braking + recovery)
+
+    assert [e.event_type for e in events] == [EventType.HARD_BRAKE]
+    assert events[0].peak_value == pytest.approx(0.6)
+    assert detector.events_detected[EventType.HARD_BRAKE] == 1
+
+
+def test_cooldown_follows_sample_timestamps() -> None:
+    """Cooldown is measured on sample time, not the wall clock."""
+    detector = EventDetector(RingBuffer(), DetectorConfig(cooldown_seconds=5.0))
+    t = 1_000.0  # Far in the past of the wall clock
+
+    def brake(start: float) -> list:
+        return [_sample(start + i * 0.01, ax=-0.6) for i in range(40)] + [
+            _sample(start + 0.4)
+        ]
+
+    events = _run(detector, brake(t) + brake(t + 2.0) + brake(t + 6.0))
+
+    assert [e.start_time for e in events] == [t, t + 6.0]
@@ -155,3 +155,378 @@ def test_full_recovery_flow(tmp_path):
     assert "end_time" in updated
 
     db2.close()
+
+
+def test_gps_fix_wait_wakes_on_stop():
+    """_wait_for_gps_fix() returns as soon as the stop event is set, not after max_wait."""
+    import threading
+    import time
+
+    from shitbox.events.engine import UnifiedEngine
+
+    engine = UnifiedEngine.__new__(UnifiedEngine)
+    engine._running = True
+    engine._stop_event = threading.Event()
+    engine._read_gps = lambda: None  # No fix yet
+
+    threading.Timer(0.05, engine._stop_event.set).start()
+    t0 = time.monotonic()
+    assert engine._wait_for_gps_fix(max_wait=20) is False
+    assert time.monotonic() - t0 < 1.0
+
+
+def _make_gps_engine(port: int):
+    from types import SimpleNamespace
+
+    from shitbox.events.engine import UnifiedEngine
+
+    engine = UnifiedEngine.__new__(UnifiedEngine)
+    engine.config = SimpleNamespace(gps_host="127.0.0.1", gps_port=port)
+    engine._gps_available = True
+    engine._gpsd_sock = None
+    engine._gpsd_buffer = b""
+    engine._gpsd_tpv = None
+    engine._gpsd_tpv_time = 0.0
+    engine._gpsd_satellites = None
+    engine._clock_synced_from_gps = True
+    return engine
+
+
+def test_gpsd_stream_reuses_one_connection():
+    """One watched gpsd connection serves every tick; a drop reconnects on the next call."""
+    import socket
+    import time
+
+    server = socket.create_server(("127.0.0.1", 0))
+    engine = _make_gps_engine(server.getsockname()[1])
+
+    def poll_until(predicate):
+        for _ in range(100):
+            engine._poll_gpsd()
+            if predicate():
+                return True
+            time.sleep(0.01)
+        return False
+
+    try:
+        engine._poll_gpsd()
+        assert engine._gpsd_satellites is None
+        conn, _ = server.accept()
+        assert conn.recv(1024).startswith(b"?WATCH=")
+
+        conn.sendall(b'{"class":"TPV","mode":3}\n{"class":"SKY","uSat":7,"nSat":12}\n')
+        assert poll_until(lambda: engine._gpsd_satellites == 7)
+        assert engine._gpsd_tpv == {"class": "TPV", "mode": 3}
+        # A partial line waits for its newline; the last good count is kept meanwhile
+        conn.sendall(b'{"class":"SKY","uSat":9')
+        engine._poll_gpsd()
+        assert engine._gpsd_satellites == 7
+        conn.sendall(b"}\n")
+        assert poll_until(lambda: engine._gpsd_satellites == 9)
+
+        conn.close()
+        assert poll_until(lambda: engine._gpsd_sock is None)
+        assert engine._gpsd_satellites is None and engine._gpsd_tpv is None
+
+        engine._poll_gpsd()
+        conn2, _ = server.accept()
+        assert conn2.recv(1024).startswith(b"?WATCH=")
+        conn2.close()
+    finally:
+        engine._close_gpsd_socket()
+        server.close()
+
+
+def test_read_gps_builds_reading_from_newest_tpv():
+    """_read_gps() uses the latest TPV and SKY reports and ignores stale or 2D-only fields."""
+    import socket
+    import time
+    from datetime import datetime, timezone
+
+    from shitbox.events import engine as engine_module
+
+    server = socket.create_server(("127.0.0.1", 0))
+    engine = _make_gps_engine(server.getsockname()[1])
+    try:
+        assert engine._read_gps() is None
+        conn, _ = server.accept()
+        conn.sendall(
+            b'{"class":"TPV","mode":3,"lat":-30.0,"lon":140.0,"time":"2026-03-01T00:00:00.000Z"}\n'
+            b'{"class":"SKY","uSat":8}\n'
+            b'{"class":"TPV","mode":3,"time":"2026-03-01T00:00:01.000Z","lat":-30.1,'
+            b'"lon":140.1,"altMSL":212.5,"speed":25.0,"track":181.5}\n'
+        )
+        for _ in range(100):
+            reading = engine._read_gps()
+            if reading is not None:
+                break
+            time.sleep(0.01)
+
+        assert reading.timestamp_utc == datetime(2026, 3, 1, 0, 0, 1, tzinfo=timezone.utc)
+        assert (reading.latitude, reading.longitude) == (-30.1, 140.1)
+        assert reading.altitude_m == 212.5
+        assert reading.speed_kmh == 90.0
+        assert reading.heading_deg == 181.5
+        assert reading.satellites == 8
+        assert reading.fix_quality == 3
+
+        # A 2D fix carries no altitude
+        conn.sendall(b'{"class":"TPV","mode":2,"lat":-30.2,"lon":140.2,"alt":99.0}\n')
+        for _ in range(100):
+            reading = engine._read_gps()
+            if reading.fix_quality == 2:
+                break
+            time.sleep(0.01)
+        assert reading.latitude == -30.2 and reading.altitude_m is None
+
+        # Nothing new from gpsd for too long: no fix rather than a stale position
+        engine._gpsd_tpv_time -= engine_module.GPSD_REPORT_MAX_AGE_S + 1
+        assert engine._read_gps() is None
+        conn.close()
+    finally:
+        engine._close_gpsd_socket()
+        server.close()
+
+
+def test_wal_checkpoint_loop_runs_until_stopped():
+    """The checkpoint thread checkpoints each interval and leaves closing to stop()."""
+    import threading
+    import time
+    from unittest.mock import MagicMock
+
+    from shitbox.events.engine import UnifiedEngine
+
+    engine = UnifiedEngine.__new__(UnifiedEngine)
+    engine._stop_event = threading.Event()
+    engine.database = MagicMock()
+    engine.database.checkpoint_wal.side_effect = [OSError("disk I/O error"), None, None, None]
+    engine.WAL_CHECKPOINT_INTERVAL_S = 0.01
+
+    thread = threading.Thread(target=engine._wal_checkpoint_loop, daemon=True)
+    thread.start()
+    for _ in range(200):
+        if engine.database.checkpoint_wal.call_count >= 2:
+            break
+        time.sleep(0.01)
+    engine._stop_event.set()
+    thread.join(timeout=1.0)
+
+    assert not thread.is_alive()
+    assert engine.database.checkpoint_wal.call_count >= 2  # An error doesn't end the loop
+    engine.database.close.assert_not_called()
+
+
+def test_notify_systemd_reuses_one_socket(tmp_path, monkeypatch):
+    """Watchdog pings share one connected datagram socket and reconnect after a failure."""
+    import socket
+
+    from shitbox.events import engine as engine_module
+    from shitbox.events.engine import UnifiedEngine
+
+    path = str(tmp_path / "notify")
+    receiver = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    receiver.bind(path)
+    receiver.settimeout(1.0)
+    monkeypatch.setattr(engine_module, "NOTIFY_SOCKET", path)
+
+    engine = UnifiedEngine.__new__(UnifiedEngine)
+    engine._notify_sock = None
+    try:
+        engine._notify_systemd("READY=1")
+        sock = engine._notify_sock
+        engine._notify_systemd("WATCHDOG=1")
+
+        assert engine._notify_sock is sock
+        assert receiver.recv(64) == b"READY=1"
+        assert receiver.recv(64) == b"WATCHDOG=1"
+
+        sock.close()
+        engine._notify_systemd("WATCHDOG=1")  # Fails and drops the dead socket
+        assert engine._notify_sock is None
+        engine._notify_systemd("WATCHDOG=1")
+        assert receiver.recv(64) == b"WATCHDOG=1"
+    finally:
+        engine._close_notify_socket()
+        receiver.close()
+
+
+@pytest.mark.parametrize("online", [True, False])
+def test_boot_metric_waits_for_recovery_and_uplink(online):
+    """The boot gauge is posted only once recovery is done and the uplink comes up."""
+    import threading
+    from unittest.mock import MagicMock
+
+    from shitbox.events import engine as engine_module
+    from shitbox.events.engine import UnifiedEngine
+
+    engine = UnifiedEngine.__new__(UnifiedEngine)
+    engine.boot_recovery = MagicMock()
+    engine.boot_recovery.recovery_complete = threading.Event()
+    engine.boot_recovery.recovery_complete.set()
+    engine.boot_recovery.was_crash = True
+    engine._stop_event = threading.Event()
+    engine.config = MagicMock(
+        prometheus_enabled=True,
+        uplink_enabled=True,
+        prometheus_remote_write_url="http://prom/api/v1/write",
+    )
+    engine.connection = MagicMock()
+    engine.connection.wait_for_connection.return_value = online
+
+    with patch.object(engine_module.requests, "post") as mock_post, patch.object(
+        engine_module, "lower_thread_priority"
+    ):
+        engine._send_boot_metric()
+
+    engine.connection.wait_for_connection.assert_called_once_with(
+        timeout=UnifiedEngine.BOOT_METRIC_WAIT_S
+    )
+    assert mock_post.called is online
+    if online:
+        assert mock_post.call_args.args == ("http://prom/api/v1/write",)
+        assert mock_post.call_args.kwargs["headers"] == engine_module.REMOTE_WRITE_HEADERS
+
+
+def test_health_check_runs_off_the_main_loop_without_overlapping():
+    """A slow health check runs on its own thread and the next round is skipped meanwhile."""
+    import threading
+
+    from shitbox.events.engine import UnifiedEngine
+
+    release = threading.Event()
+    calls = []
+
+    engine = UnifiedEngine.__new__(UnifiedEngine)
+    engine._health_thread = None
+
+    def slow_check():
+        calls.append(threading.current_thread().name)
+        release.wait(2.0)
+
+    engine._health_check = slow_check
+    engine._start_health_check()
+    first = engine._health_thread
+    engine._start_health_check()  # Previous check still busy
+
+    assert engine._health_thread is first
+    release.set()
+    first.join(timeout=2.0)
+    assert calls == ["health-check"]
+
+
+def test_boot_metric_gives_up_on_shutdown():
+    """A stop during boot wakes the boot-metric thread without waiting out recovery."""
+    import threading
+    import time
+    from unittest.mock import MagicMock
+
+    from shitbox.events import engine as engine_module
+    from shitbox.events.engine import UnifiedEngine
+
+    engine = UnifiedEngine.__new__(UnifiedEngine)
+    engine.boot_recovery = MagicMock()
+    engine.boot_recovery.recovery_complete = threading.Event()  # Never completes
+    engine._stop_event = threading.Event()
+    engine._stop_event.set()
+    engine.connection = MagicMock()
+
+    start = time.monotonic()
+    with patch.object(engine_module, "lower_thread_priority"):
+        engine._send_boot_metric()
+
+    assert time.monotonic() - start < 2.0
+    engine.connection.wait_for_connection.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "watchdog_usec, expected",
+    [(None, 1.0), ("", 1.0), ("junk", 1.0), ("10000000", 5.0), ("1000000", 1.0)],
+)
+def test_watchdog_interval_is_half_of_watchdog_sec(watchdog_usec, expected):
+    """Pings go out at half of WatchdogSec, never more often than once a second."""
+    from shitbox.events.engine import _watchdog_interval_s
+
+    assert _watchdog_interval_s(watchdog_usec) == expected
+
+
+def test_failed_flush_keeps_rows_for_the_next_flush(tmp_path):
+    """A failed telemetry write is retried on the next flush instead of dropping the window."""
+    from datetime import datetime, timezone
+
+    from shitbox.events.engine import UnifiedEngine
+    from shitbox.storage.models import Reading, SensorType
+
+    def reading(i: int) -> Reading:
+        return Reading(
+            timestamp_utc=datetime.now(timezone.utc),
+            sensor_type=SensorType.SYSTEM,
+            cpu_temp_celsius=float(i),
+        )
+
+    db = Database(tmp_path / "telemetry.db")
+    db.connect()
+    engine = UnifiedEngine.__new__(UnifiedEngine)
+    engine.database = db
+    engine.telemetry_readings = 0
+    engine._reading_batch = [reading(i) for i in range(3)]
+
+    with patch.object(db, "insert_readings_batch", side_effect=OSError("disk I/O error")):
+        engine._flush_readings()
+    assert len(engine._reading_batch) == 3
+
+    engine._reading_batch.append(reading(3))
+    engine._flush_readings()
+
+    temps = [r[0] for r in db._get_connection().execute(
+        "SELECT cpu_temp_celsius FROM readings ORDER BY id"
+    )]
+    assert temps == [0.0, 1.0, 2.0, 3.0]
+    assert engine._reading_batch == []
+    assert engine.telemetry_readings == 4
+    db.close()
+
+
+def test_failed_flush_caps_retained_rows():
+    """Repeated failures keep only the newest TELEMETRY_RETRY_MAX_ROWS rows."""
+    from unittest.mock import MagicMock
+
+    from shitbox.events.engine import UnifiedEngine
+
+    engine = UnifiedEngine.__new__(UnifiedEngine)
+    engine.database = MagicMock()
+    engine.database.insert_readings_batch.side_effect = OSError("disk full")
+    engine.TELEMETRY_RETRY_MAX_ROWS = 5
+    engine._reading_batch = list(range(4))
+
+    engine._flush_readings()
+    engine._reading_batch.extend(range(4, 8))
+    engine._flush_readings()
+
+    assert engine._reading_batch == [3, 4, 5, 6, 7]
+
+
+def test_notify_display_only_on_shown_change():
+    """The OLED is woken when a displayed field changes, not on every telemetry tick."""
+    from unittest.mock import MagicMock
+
+    from shitbox.events.engine import UnifiedEngine
+
+    engine = UnifiedEngine.__new__(UnifiedEngine)
+    engine.oled_display = MagicMock()
+    engine._last_display_status = None
+    engine._gps_available = True
+    engine._gps_has_fix = True
+    engine._current_satellites = 7
+    engine._current_speed_kmh = 60.2
+    engine.events_captured = 0
+    engine.video_recorder = None
+    engine.connection = MagicMock(is_connected=True)
+
+    engine._notify_display()
+    engine._current_speed_kmh = 59.8  # Still shown as 60km/h
+    engine._notify_display()
+    assert engine.oled_display.notify.call_count == 1
+
+    engine.events_captured = 1
+    engine._notify_display()
+    assert engine.oled_display.notify.call_count == 2
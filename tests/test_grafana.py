@@ -0,0 +1,105 @@
+"""Tests for the Grafana annotation queue and retry policy."""
+
+import time
+from unittest.mock import MagicMock, patch
+
+from shitbox.events.detector import Event, EventType
+from shitbox.sync import grafana
+from shitbox.sync.grafana import GrafanaAnnotator
+from shitbox.utils.config import GrafanaConfig
+
+
+def _event(start: float) -> Event:
+    return Event(
+        event_type=EventType.HARD_BRAKE,
+        start_time=start,
+        end_time=start + 1.5,
+        peak_value=0.7,
+        peak_ax=-0.7,
+        peak_ay=0.0,
+        peak_az=1.0,
+    )
+
+
+def _make_annotator() -> GrafanaAnnotator:
+    return GrafanaAnnotator(GrafanaConfig(enabled=True, url="http://grafana.local/", api_token="t"))
+
+
+def test_annotations_queue_in_order_and_drop_oldest_when_full(monkeypatch) -> None:
+    """annotate_event() never blocks; overflow discards the oldest queued annotation."""
+    monkeypatch.setattr(grafana, "ANNOTATION_QUEUE_SIZE", 2)
+    annotator = _make_annotator()
+
+    with patch.object(annotator, "_ensure_worker"):
+        for start in (1000.0, 2000.0, 3000.0):
+            annotator.annotate_event(_event(start))
+
+    queued = [annotator._queue.get_nowait()["time"] for _ in range(2)]
+    assert queued == [2_000_000, 3_000_000]
+
+
+def test_post_retries_server_errors_but_not_rejections() -> None:
+    """5xx responses and network errors are retried; a 4xx is given up on at once."""
+    annotator = _make_annotator()
+    session = MagicMock()
+    server_error = MagicMock(ok=False, status_code=503, text="")
+    accepted = MagicMock(ok=True, status_code=200)
+    session.post.side_effect = [ConnectionError("offline"), server_error, accepted]
+
+    with patch.object(time, "sleep") as sleep:
+        assert annotator._post_annotation(session, {"tags": ["shitbox"]}) is True
+    assert session.post.call_count == 3
+    assert [c.args[0] for c in sleep.call_args_list] == [2.0, 4.0]
+
+    session.reset_mock(side_effect=True)
+    session.post.return_value = MagicMock(ok=False, status_code=401, text="bad token")
+    with patch.object(time, "sleep"):
+        assert annotator._post_annotation(session, {"tags": ["shitbox"]}) is False
+    assert session.post.call_count == 1
+
+
+def test_worker_posts_queued_annotations_and_stops() -> None:
+    """The worker delivers queued annotations with the auth header; stop() drains it."""
+    annotator = _make_annotator()
+    posted = []
+
+    def fake_post(self, url, json, timeout):
+        posted.append((url, self.headers["Authorization"], json["time"]))
+        return MagicMock(ok=True)
+
+    with patch("requests.Session.post", fake_post), patch(
+        "requests.Session.close"
+    ) as close:
+        annotator.annotate_event(_event(1000.0))
+        annotator.annotate_event(_event(2000.0))
+        worker = annotator._worker
+        annotator.stop(timeout=2.0)
+
+    assert not worker.is_alive()
+    close.assert_called_once_with()
+    url = "http://grafana.local/api/annotations"
+    assert posted == [(url, "Bearer t", 1_000_000), (url, "Bearer t", 2_000_000)]
+    annotator.stop()  # Already stopped: no-op
+
+
+def test_stop_sentinel_survives_a_full_queue(monkeypatch) -> None:
+    """Overflow drops annotations but never the queued stop request."""
+    monkeypatch.setattr(grafana, "ANNOTATION_QUEUE_SIZE", 2)
+    annotator = _make_annotator()
+    annotator._enqueue(grafana._STOP)
+    annotator._enqueue({"tags": ["a"]})
+    annotator._enqueue({"tags": ["b"]})
+
+    queued = [annotator._queue.get_nowait() for _ in range(2)]
+    assert queued == [grafana._STOP, {"tags": ["b"]}]
+
+
+def test_annotate_after_stop_is_a_no_op() -> None:
+    """Once stopped, annotations are ignored and no worker is started."""
+    annotator = _make_annotator()
+    annotator.stop()
+
+    annotator.annotate_event(_event(1000.0))
+
+    assert annotator._worker is None
+    assert annotator._queue.empty()
@@ -0,0 +1,86 @@
+"""Unit tests for the IMU sample RingBuffer."""
+
+import threading
+
+from shitbox.events.ring_buffer import IMUSample, RingBuffer
+
+
+def _sample(t: float) -> IMUSample:
+    return IMUSample(timestamp=t, ax=t, ay=-t, az=1.0, gx=0.1, gy=0.2, gz=0.3)
+
+
+def test_wraps_and_keeps_newest_samples_in_order() -> None:
+    """Once full, the oldest samples are overwritten and reads stay oldest-first."""
+    buf = RingBuffer(max_seconds=1.0, sample_rate_hz=5.0)  # 5 slots
+    for i in range(12):
+        buf.append(_sample(float(i)))
+
+    assert len(buf) == 5
+    assert buf.is_full
+    assert [s.timestamp for s in buf.get_all()] == [7.0, 8.0, 9.0, 10.0, 11.0]
+    assert buf.get_latest(2) == [_sample(10.0), _sample(11.0)]
+    assert buf.get_latest(50) == buf.get_all()
+    assert buf.duration == 4.0
+
+
+def test_get_window_filters_on_latest_timestamp() -> None:
+    """get_window returns samples within N seconds of the newest one."""
+    buf = RingBuffer(max_seconds=1.0, sample_rate_hz=10.0)
+    for i in range(7):
+        buf.append(_sample(i * 0.5))
+
+    assert [s.timestamp for s in buf.get_window(1.0)] == [2.0, 2.5, 3.0]
+
+    buf.clear()
+    assert buf.get_window(1.0) == []
+    assert buf.get_latest() == []
+    assert buf.duration == 0.0
+
+
+def test_get_window_matches_linear_scan_across_wrap() -> None:
+    """The binary-searched window start agrees with filtering every sample."""
+    buf = RingBuffer(max_seconds=2.0, sample_rate_hz=10.0)  # 20 of 32 slots
+    for n in range(1, 75):
+        buf.append(_sample(n * 0.1))
+        retained = buf.get_all()
+        for seconds in (0.0, 0.05, 0.3, 1.0, 1.95, 5.0):
+            cutoff = retained[-1].timestamp - seconds
+            expected = [s for s in retained if s.timestamp >= cutoff]
+            assert buf.get_window(seconds) == expected
+
+
+def test_get_since_matches_linear_scan_across_wrap() -> None:
+    """get_since returns exactly the retained samples strictly newer than the bound."""
+    buf = RingBuffer(max_seconds=2.0, sample_rate_hz=10.0)
+    assert buf.get_since(0.0) == []
+    for n in range(1, 75):
+        buf.append(_sample(n * 0.1))
+        retained = buf.get_all()
+        for bound in (0.0, retained[0].timestamp, n * 0.05, retained[-1].timestamp, 99.0):
+            assert buf.get_since(bound) == [s for s in retained if s.timestamp > bound]
+
+
+def test_reads_never_return_torn_samples_while_writing() -> None:
+    """A reader racing the writer only sees whole, ordered samples."""
+    buf = RingBuffer(max_seconds=0.5, sample_rate_hz=100.0)
+    stop = threading.Event()
+
+    def writer() -> None:
+        t = 0.0
+        while not stop.is_set():
+            t += 1.0
+            buf.append(_sample(t))
+
+    thread = threading.Thread(target=writer, daemon=True)
+    thread.start()
+    try:
+        for _ in range(200):
+            samples = buf.get_all()
+            assert len(samples) <= buf.max_samples
+            for s in samples:
+                assert s.ax == s.timestamp and s.ay == -s.timestamp
+            stamps = [s.timestamp for s in samples]
+            assert stamps == sorted(stamps)
+    finally:
+        stop.set()
+        thread.join(timeout=2.0)
@@ -0,0 +1,73 @@
+"""Tests for MQTTPublisher event queuing and payload serialisation."""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from shitbox.storage.models import Reading, SensorType
+from shitbox.sync import mqtt_publisher
+from shitbox.sync.mqtt_publisher import MQTTPublisher
+from shitbox.utils.config import MQTTConfig
+
+
+def _make_publisher() -> MQTTPublisher:
+    """Create a publisher that queues without a broker connection."""
+    publisher = MQTTPublisher(MQTTConfig(topic_prefix="car"))
+    publisher._running = True
+    return publisher
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_publish_event_queues_serialised_payload(monkeypatch, use_orjson) -> None:
+    """publish_event() queues the event dict on <prefix>/event, with or without orjson."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(mqtt_publisher, "orjson", None)
+
+    publisher = _make_publisher()
+    event_payload = {"type": "hard_brake", "peak_value": 0.612, "lat": -33.865143}
+
+    assert publisher.publish_event(event_payload) is True
+
+    topic, payload = publisher._message_queue.get_nowait()
+    assert topic == "car/event"
+    assert isinstance(payload, bytes if use_orjson else str)
+    assert json.loads(payload) == event_payload
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_publish_reading_queues_serialised_payload(monkeypatch, use_orjson) -> None:
+    """publish_reading() serialises on the caller's thread and queues per-sensor topics."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(mqtt_publisher, "orjson", None)
+
+    publisher = _make_publisher()
+    reading = Reading(
+        timestamp_utc=datetime(2026, 3, 1, 2, 3, 4, tzinfo=timezone.utc),
+        sensor_type=SensorType.GPS,
+        latitude=-33.865143,
+        longitude=151.2099,
+        speed_kmh=None,
+        satellites=9,
+        fix_quality=3,
+    )
+
+    assert publisher.publish_reading(reading) is True
+
+    topic, payload = publisher._message_queue.get_nowait()
+    assert topic == "car/gps"
+    assert json.loads(payload) == reading.to_mqtt_payload() | {
+        "ts": "2026-03-01T02:03:04+00:00"
+    }
+
+
+def test_publish_event_not_running_returns_false() -> None:
+    """Nothing is queued before connect() has started the publisher."""
+    publisher = MQTTPublisher(MQTTConfig())
+
+    assert publisher.publish_event({"type": "boot"}) is False
+    assert publisher.queue_size == 0
@@ -0,0 +1,159 @@
+"""Unit tests for the OLED display write path (no I2C hardware required)."""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from shitbox.display.oled import DATA_CONTROL_BYTE, PAGES, WIDTH, OLEDDisplayService
+from shitbox.utils.config import OLEDConfig
+
+FRAME_SIZE = WIDTH * PAGES
+
+
+def _make_service() -> OLEDDisplayService:
+    """Build a service wired to a mock SSD1306 driver."""
+    service = OLEDDisplayService(OLEDConfig(enabled=True), engine=MagicMock())
+    service._display = MagicMock()
+    # The write buffer is reused, so snapshot each burst as it is sent
+    writes: list = []
+    service._display.i2c_device.write.side_effect = (
+        lambda buf, start=0, end=None: writes.append(bytes(buf[start:end]))
+    )
+    service._display.writes = writes
+    return service
+
+
+def _page_writes(service: OLEDDisplayService) -> list:
+    """Return the data bursts written to the panel."""
+    return service._display.writes
+
+
+def test_flush_skips_unchanged_frame() -> None:
+    """An unchanged framebuffer sends nothing over I2C."""
+    service = _make_service()
+    service._flush(bytes(FRAME_SIZE))
+    assert _page_writes(service) == []
+
+
+def test_flush_sends_only_changed_pages() -> None:
+    """A change confined to one page sends exactly that 128-byte page."""
+    service = _make_service()
+    frame = bytearray(FRAME_SIZE)
+    frame[10 * PAGES + 6] = 0xFF  # column 10, page 6
+
+    service._flush(bytes(frame))
+
+    writes = _page_writes(service)
+    assert len(writes) == 1
+    assert writes[0][0] == DATA_CONTROL_BYTE
+    assert len(writes[0]) == WIDTH + 1
+    assert writes[0][11] == 0xFF
+    service._display.write_cmd.assert_any_call(6)
+
+    # Flushing again with no further change sends nothing new
+    service._flush(bytes(frame))
+    assert len(_page_writes(service)) == 1
+
+
+def test_flush_full_redraw_is_one_burst() -> None:
+    """When every page changes the whole framebuffer goes out in one write."""
+    service = _make_service()
+
+    service._flush(b"\x55" * FRAME_SIZE)
+
+    writes = _page_writes(service)
+    assert writes == [bytes((DATA_CONTROL_BYTE,)) + b"\x55" * FRAME_SIZE]
+
+
+def test_frame_bytes_matches_ssd1306_layout() -> None:
+    """_frame_bytes puts pixel (x, y) in byte x*PAGES + y//8, bit y%8."""
+    image_mod = pytest.importorskip("PIL.Image")
+
+    service = _make_service()
+    service._image = image_mod.new("1", (WIDTH, PAGES * 8))
+    service._transpose = getattr(image_mod, "Transpose", image_mod).TRANSPOSE
+    for x, y in ((0, 0), (5, 9), (127, 63), (64, 31)):
+        service._image.putpixel((x, y), 1)
+
+    frame = service._frame_bytes()
+
+    assert len(frame) == FRAME_SIZE
+    expected = bytearray(FRAME_SIZE)
+    for x, y in ((0, 0), (5, 9), (127, 63), (64, 31)):
+        expected[x * PAGES + y // 8] |= 1 << (y % 8)
+    assert frame == bytes(expected)
+
+
+def test_flush_page_run_is_column_interleaved() -> None:
+    """A run of pages is sent in vertical-addressing order (pages within columns)."""
+    service = _make_service()
+    frame = bytearray(FRAME_SIZE)
+    frame[0 * PAGES + 2] = 0x01  # column 0, page 2
+    frame[0 * PAGES + 3] = 0x02  # column 0, page 3
+    frame[1 * PAGES + 2] = 0x04  # column 1, page 2
+
+    service._flush(bytes(frame))
+
+    writes = _page_writes(service)
+    assert len(writes) == 1
+    assert writes[0][1:5] == bytes((0x01, 0x02, 0x04, 0x00))
+    assert len(writes[0]) == 2 * WIDTH + 1
+
+
+def test_chrome_labels_line_up_with_values() -> None:
+    """Values drawn after the chrome labels match drawing the whole string."""
+    image_mod = pytest.importorskip("PIL.Image")
+    draw_mod = pytest.importorskip("PIL.ImageDraw")
+    font_mod = pytest.importorskip("PIL.ImageFont")
+
+    service = _make_service()
+    service._font = font_mod.load_default()
+    service._image = image_mod.new("1", (WIDTH, PAGES * 8))
+    service._draw = draw_mod.Draw(service._image)
+    service._build_chrome(image_mod, draw_mod)
+    service._build_glyphs(image_mod, draw_mod)
+
+    service._image.paste(service._chrome)
+    service._draw_text(service._value_x["EVT:"], 16, "12")
+
+    expected = image_mod.new("1", (WIDTH, PAGES * 8))
+    draw = draw_mod.Draw(expected)
+    draw.text((0, 0), "GPS:", font=service._font, fill=255)
+    draw.text((42, 16), "EVT:12", font=service._font, fill=255)
+    draw.text((36, 48), "BKL:", font=service._font, fill=255)
+    assert service._image.tobytes() == expected.tobytes()
+
+
+def test_notify_wakes_render_loop() -> None:
+    """A notify() renders straight away instead of waiting out the idle interval."""
+    service = OLEDDisplayService(
+        OLEDConfig(enabled=True, update_interval_seconds=30.0, min_interval_seconds=0.0),
+        engine=MagicMock(),
+    )
+    rendered = threading.Event()
+    service._render = rendered.set  # type: ignore[method-assign]
+    service._running = True
+    service._thread = threading.Thread(target=service._display_loop, daemon=True)
+    service._thread.start()
+
+    service.notify()
+
+    assert rendered.wait(timeout=2.0)
+    service.stop()
+    assert not service._thread.is_alive()
+
+
+def test_flush_separate_runs_reuse_write_buffer() -> None:
+    """Two page runs in one flush each send their own data from the shared buffer."""
+    service = _make_service()
+    frame = bytearray(FRAME_SIZE)
+    frame[3 * PAGES + 1] = 0x11  # column 3, page 1
+    frame[7 * PAGES + 5] = 0x22  # column 7, page 5
+
+    service._flush(bytes(frame))
+
+    first, second = _page_writes(service)
+    assert len(first) == len(second) == WIDTH + 1
+    assert first[4] == 0x11 and sum(first[1:]) == 0x11
+    assert second[8] == 0x22 and sum(second[1:]) == 0x22
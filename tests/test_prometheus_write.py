@@ -0,0 +1,56 @@
+"""Tests for the Prometheus remote_write encoder."""
+
+import struct
+
+import snappy
+
+from shitbox.sync.prometheus_write import encode_remote_write
+
+
+def _length_delimited(field_number: int, data: bytes) -> bytes:
+    assert len(data) < 128  # Single-byte varint lengths keep the fixtures readable
+    return bytes([(field_number << 3) | 2, len(data)]) + data
+
+
+def _expected_timeseries(name: str, labels: dict, value: float, timestamp_ms: int) -> bytes:
+    """Build a TimeSeries message byte by byte, independently of the encoder."""
+    ts = b""
+    for label_name, label_value in [("__name__", name)] + sorted(labels.items()):
+        label = _length_delimited(1, label_name.encode()) + _length_delimited(
+            2, label_value.encode()
+        )
+        ts += _length_delimited(1, label)
+    varint = bytearray()
+    while timestamp_ms > 127:
+        varint.append((timestamp_ms & 0x7F) | 0x80)
+        timestamp_ms >>= 7
+    varint.append(timestamp_ms)
+    sample = b"\x09" + struct.pack("<d", value) + b"\x10" + bytes(varint)
+    return ts + _length_delimited(2, sample)
+
+
+def test_encodes_write_request_wire_format() -> None:
+    """Each metric becomes one TimeSeries with __name__ first and sorted labels."""
+    metrics = [
+        ("shitbox_temp", {"sensor": "mcp9808"}, 21.5, 1700000000000),
+        ("shitbox_ax", {"sensor": "imu", "car": "shitbox"}, -0.25, 1700000000010),
+    ]
+
+    payload = snappy.decompress(encode_remote_write(metrics))
+
+    expected = b"".join(
+        _length_delimited(1, _expected_timeseries(*metric)) for metric in metrics
+    )
+    assert payload == expected
+
+
+def test_encodes_large_batch() -> None:
+    """A full backlog batch encodes every series and uses multi-byte lengths."""
+    metrics = [
+        ("shitbox_speed", {"sensor": "gps", "zone": "z" * 120}, float(i), 1700000000000 + i)
+        for i in range(6000)
+    ]
+
+    payload = snappy.decompress(encode_remote_write(metrics))
+
+    assert payload.count(b"shitbox_speed") == 6000
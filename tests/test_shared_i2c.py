@@ -0,0 +1,21 @@
+"""Tests for sharing one I2C bus object between I2C devices."""
+
+from unittest.mock import MagicMock
+
+from shitbox.collectors.environment import EnvironmentCollector
+from shitbox.collectors.power import PowerCollector
+from shitbox.utils.config import EnvironmentConfig, PowerConfig
+
+
+def test_cleanup_leaves_shared_bus_open() -> None:
+    """A collector given the engine's bus releases it without calling deinit()."""
+    bus = MagicMock()
+    power = PowerCollector(PowerConfig(), i2c=bus)
+    env = EnvironmentCollector(EnvironmentConfig(), i2c=bus)
+
+    power.cleanup()
+    env.cleanup()
+
+    bus.deinit.assert_not_called()
+    assert power._i2c is None
+    assert env._i2c is None
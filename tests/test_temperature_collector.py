@@ -0,0 +1,43 @@
+"""Unit tests for the MCP9808 raw register read (no I2C hardware required)."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from shitbox.collectors.temperature import TemperatureCollector
+from shitbox.utils.config import TemperatureConfig
+
+
+def _collector_returning(msb: int, lsb: int) -> TemperatureCollector:
+    """Build a collector whose shared bus answers the ambient register read."""
+    bus = MagicMock()
+    bus.try_lock.return_value = True
+
+    def _read(address: int, out: bytes, buf: bytearray) -> None:
+        assert out == b"\x05"
+        buf[0], buf[1] = msb, lsb
+
+    bus.writeto_then_readfrom.side_effect = _read
+    collector = TemperatureCollector(TemperatureConfig(), i2c=bus)
+    collector._sensor = MagicMock()
+    return collector
+
+
+@pytest.mark.parametrize(
+    ("msb", "lsb", "expected"),
+    [
+        (0x01, 0x94, 25.25),
+        (0xC1, 0x94, 25.25),  # Alert flag bits are ignored
+        (0x1F, 0xF0, -1.0),
+        (0x1E, 0x00, -32.0),
+    ],
+)
+def test_read_converts_ambient_register(msb: int, lsb: int, expected: float) -> None:
+    """The 13-bit two's complement register converts to Celsius."""
+    collector = _collector_returning(msb, lsb)
+
+    reading = collector.read()
+
+    assert reading is not None
+    assert reading.temp_celsius == expected
+    collector._i2c.unlock.assert_called_once()
@@ -26,6 +26,27 @@ def test_temp_published_to_shared_state() -> None:
     assert service.current_temp_celsius == 55.0
 
 
+def test_sysfs_temp_rereads_one_descriptor(tmp_path) -> None:
+    """THRM-01: The sysfs file is opened once and re-read from offset 0 each poll."""
+    temp_file = tmp_path / "temp"
+    temp_file.write_text("55000\n")
+    service = ThermalMonitorService()
+
+    with patch("shitbox.health.thermal_monitor.SYSFS_TEMP_PATH", str(temp_file)):
+        assert service._read_sysfs_temp() == 55000
+        fd = service._temp_fd
+        temp_file.write_text("61250\n")
+        assert service._read_sysfs_temp() == 61250
+        assert service._temp_fd == fd
+
+        service.stop()
+        assert service._temp_fd is None
+
+        temp_file.unlink()
+        assert service._read_sysfs_temp() is None
+        assert service._temp_fd is None
+
+
 def test_temp_thread_safe() -> None:
     """THRM-01: Concurrent reads/writes to current_temp_celsius raise no exceptions."""
     service = ThermalMonitorService()
@@ -4,8 +4,9 @@ Covers STGE-01 (cumulative distance), STGE-02 (daily distance with AEST reset),
 and STGE-03 (waypoint proximity detection and persistence).
 """
 
+import math
 from datetime import datetime, timezone
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -49,6 +50,20 @@ def test_trip_state_missing_key(db) -> None:
     assert result is None
 
 
+def test_trip_states_bulk_round_trip(db) -> None:
+    """set_trip_states/get_trip_states handle numeric and text keys together."""
+    db.set_trip_state("odometer_km", 100.0)
+    db.set_trip_states({"odometer_km": 250.5, "daily_km": 12.0, "daily_reset_date": "2026-02-27"})
+
+    assert db.get_trip_states("odometer_km", "daily_km", "daily_reset_date", "missing") == {
+        "odometer_km": pytest.approx(250.5),
+        "daily_km": pytest.approx(12.0),
+        "daily_reset_date": "2026-02-27",
+    }
+    assert db.get_trip_state("daily_km") == pytest.approx(12.0)
+    assert db.get_trip_state_text("daily_reset_date") == "2026-02-27"
+
+
 # ---------------------------------------------------------------------------
 # Waypoint persistence tests
 # ---------------------------------------------------------------------------
@@ -142,12 +157,12 @@ def _make_engine_with_state(**kwargs):
     engine._last_location_resolve_time = 0.0
     engine._last_resolved_lat = None
     engine._last_resolved_lon = None
+    engine._geocache = {}
     engine._reverse_geocoder = None
     engine._health_collector = None
     engine._power_collector = None
     engine._environment_collector = None
     engine._last_timelapse_time = 0.0
-    engine._last_wal_checkpoint = 0.0
     engine.ring_buffer = MagicMock()
     engine.ring_buffer.get_latest.return_value = []
     engine.batch_sync = None
@@ -263,7 +278,7 @@ def test_odometer_rejects_implausible_delta() -> None:
 
 
 def test_odometer_persists() -> None:
-    """STGE-01: set_trip_state is called with 'odometer_km' once TRIP_PERSIST_INTERVAL_S elapses."""
+    """STGE-01: odometer and daily km are persisted once TRIP_PERSIST_INTERVAL_S elapses."""
     import time as real_time
 
     engine = _make_engine_with_state(
@@ -278,12 +293,14 @@ def test_odometer_persists() -> None:
 
     # Trigger persistence logic
     if (now_mono - engine._last_trip_persist) >= TRIP_PERSIST_INTERVAL_S:
-        engine.database.set_trip_state("odometer_km", engine._odometer_km)
-        engine.database.set_trip_state("daily_km", engine._daily_km)
+        engine.database.set_trip_states(
+            {"odometer_km": engine._odometer_km, "daily_km": engine._daily_km}
+        )
         engine._last_trip_persist = now_mono
 
-    engine.database.set_trip_state.assert_any_call("odometer_km", pytest.approx(42.5))
-    engine.database.set_trip_state.assert_any_call("daily_km", pytest.approx(10.0))
+    engine.database.set_trip_states.assert_called_once_with(
+        {"odometer_km": pytest.approx(42.5), "daily_km": pytest.approx(10.0)}
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -296,26 +313,27 @@ def test_daily_reset_new_day() -> None:
     engine = _make_engine_with_state(daily_km=55.3)
 
     # Return yesterday's date from the DB
-    engine.database.get_trip_state.side_effect = lambda key: {
+    engine.database.get_trip_states.return_value = {
         "odometer_km": 200.0,
         "daily_km": 55.3,
-    }.get(key)
-    engine.database.get_trip_state_text.return_value = "2026-02-26"  # yesterday
+        "daily_reset_date": "2026-02-26",  # yesterday
+    }
 
     from shitbox.events.engine import _current_aest_date
 
     today_aest = _current_aest_date()
 
     # Simulate the boot logic
-    stored_date = engine.database.get_trip_state_text("daily_reset_date")
+    trip_state = engine.database.get_trip_states("odometer_km", "daily_km", "daily_reset_date")
+    stored_date = trip_state.get("daily_reset_date")
     if stored_date != today_aest:
         engine._daily_km = 0.0
-        engine.database.set_trip_state("daily_km", 0.0)
-        engine.database.set_trip_state_text("daily_reset_date", today_aest)
+        engine.database.set_trip_states({"daily_km": 0.0, "daily_reset_date": today_aest})
 
     assert engine._daily_km == pytest.approx(0.0)
-    engine.database.set_trip_state.assert_any_call("daily_km", 0.0)
-    engine.database.set_trip_state_text.assert_any_call("daily_reset_date", today_aest)
+    engine.database.set_trip_states.assert_called_once_with(
+        {"daily_km": 0.0, "daily_reset_date": today_aest}
+    )
 
 
 def test_daily_persists_same_day() -> None:
@@ -325,23 +343,21 @@ def test_daily_persists_same_day() -> None:
     today_aest = _current_aest_date()
     engine = _make_engine_with_state(daily_km=33.7)
 
-    engine.database.get_trip_state.side_effect = lambda key: {
+    engine.database.get_trip_states.return_value = {
         "odometer_km": 150.0,
         "daily_km": 33.7,
-    }.get(key)
-    engine.database.get_trip_state_text.return_value = today_aest
+        "daily_reset_date": today_aest,
+    }
 
     # Simulate boot logic
-    stored_date = engine.database.get_trip_state_text("daily_reset_date")
+    trip_state = engine.database.get_trip_states("odometer_km", "daily_km", "daily_reset_date")
+    stored_date = trip_state.get("daily_reset_date")
     if stored_date != today_aest:
         engine._daily_km = 0.0
-        engine.database.set_trip_state("daily_km", 0.0)
-        engine.database.set_trip_state_text("daily_reset_date", today_aest)
+        engine.database.set_trip_states({"daily_km": 0.0, "daily_reset_date": today_aest})
 
     assert engine._daily_km == pytest.approx(33.7)  # unchanged
-    # set_trip_state_text should NOT have been called with today's date for reset
-    for c in engine.database.set_trip_state.call_args_list:
-        assert c != call("daily_km", 0.0), "daily_km should not have been reset"
+    engine.database.set_trip_states.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
@@ -381,6 +397,21 @@ def test_waypoint_not_reached() -> None:
     assert 0 not in engine._reached_waypoints
 
 
+@pytest.mark.parametrize("km_north, reached", [(4.95, True), (5.05, False)])
+def test_waypoint_radius_due_north(km_north: float, reached: bool) -> None:
+    """STGE-03: The latitude pre-filter does not cut into the 5 km radius."""
+    from shitbox.events.engine import EARTH_RADIUS_KM
+
+    waypoint = WaypointConfig(name="North Town", day=1, lat=-16.4838, lon=145.4673)
+    engine = _make_engine_with_state()
+    engine.config.route_waypoints = [waypoint]
+
+    lat = waypoint.lat - math.degrees(km_north / EARTH_RADIUS_KM)
+    engine._check_waypoints(lat, waypoint.lon)
+
+    assert (0 in engine._reached_waypoints) is reached
+
+
 def test_waypoint_already_reached_skipped() -> None:
     """STGE-03: Already-reached waypoint is not recorded again."""
     waypoint = WaypointConfig(name="Test Town", day=1, lat=-16.4838, lon=145.4673)
@@ -504,3 +535,108 @@ def test_get_status_includes_trip_fields() -> None:
     assert status["daily_km"] == pytest.approx(87.3)
     assert status["waypoints_reached"] == 3
     assert status["waypoints_total"] == 4
+
+
+# ---------------------------------------------------------------------------
+# Location resolution
+# ---------------------------------------------------------------------------
+
+
+def test_resolve_location_queues_lookup_off_telemetry_thread() -> None:
+    """_resolve_location() only queues, dropping requests while one is pending."""
+    import queue
+
+    engine = _make_engine_with_state()
+    engine._reverse_geocoder = MagicMock()
+    engine._geocode_queue = queue.Queue(maxsize=1)
+
+    engine._resolve_location(-16.92, 145.77)
+    engine._resolve_location(-16.95, 145.80)  # Dropped: a lookup is pending
+
+    engine._reverse_geocoder.search.assert_not_called()
+    assert engine._geocode_queue.get_nowait() == (-16.92, 145.77)
+    assert engine._geocode_queue.empty()
+    # The gate tracks the queued request, not the dropped one
+    assert (engine._last_resolved_lat, engine._last_resolved_lon) == (-16.92, 145.77)
+    assert engine._last_location_resolve_time > 0.0
+
+
+def test_geocode_loop_disables_lookups_when_load_fails() -> None:
+    """A KD-tree load failure ends the loop and stops further lookups being queued."""
+    import queue
+
+    engine = _make_engine_with_state()
+    engine._reverse_geocoder = MagicMock()
+    engine._reverse_geocoder.search.side_effect = OSError("no cities file")
+    engine._geocode_queue = queue.Queue(maxsize=1)
+
+    engine._geocode_loop()
+    engine._resolve_location(-16.92, 145.77)
+
+    assert engine._reverse_geocoder is None
+    assert engine._geocode_queue.empty()
+
+
+@pytest.mark.parametrize(
+    "bearing_deg, distance_km, queued",
+    [(0, 0.95, False), (0, 1.05, True), (90, 0.95, False), (90, 1.05, True), (225, 1.05, True)],
+)
+def test_resolve_location_move_gate_matches_haversine(bearing_deg, distance_km, queued) -> None:
+    """Before the interval is up, only a move of more than 1 km queues a lookup."""
+    import queue
+    import time
+
+    lat0, lon0 = -37.8, 144.9
+    bearing = math.radians(bearing_deg)
+    lat = lat0 + math.degrees(distance_km * math.cos(bearing) / 6371.0)
+    lon = lon0 + math.degrees(
+        distance_km * math.sin(bearing) / (6371.0 * math.cos(math.radians(lat0)))
+    )
+    engine = _make_engine_with_state()
+    assert engine._haversine_km(lat0, lon0, lat, lon) == pytest.approx(
+        distance_km, rel=1e-3
+    )
+    engine._reverse_geocoder = MagicMock()
+    engine._geocode_queue = queue.Queue(maxsize=1)
+    engine._last_location_resolve_time = time.monotonic()
+    engine._last_resolved_lat = lat0
+    engine._last_resolved_lon = lon0
+
+    engine._resolve_location(lat, lon)
+
+    assert engine._geocode_queue.empty() is not queued
+
+
+def test_lookup_location_labels_distant_place_as_near() -> None:
+    """_lookup_location() stores the label, prefixed "Near" for a distant place."""
+    engine = _make_engine_with_state()
+    engine._reverse_geocoder = MagicMock()
+    engine._reverse_geocoder.search.return_value = [
+        {"name": "Cairns", "admin1": "Queensland", "lat": "-16.92366", "lon": "145.76613"}
+    ]
+
+    engine._lookup_location(-17.0, 145.9)
+
+    assert engine._current_location_name == "Near Cairns, Queensland"
+    engine._reverse_geocoder.search.assert_called_once_with(
+        [(-17.0, 145.9)], mode=1, verbose=False
+    )
+
+
+def test_lookup_location_reuses_place_within_grid_cell() -> None:
+    """A second lookup in the same ~500 m cell skips the search but re-measures distance."""
+    engine = _make_engine_with_state()
+    engine._reverse_geocoder = MagicMock()
+    engine._reverse_geocoder.search.return_value = [
+        {"name": "Cairns", "admin1": "Queensland", "lat": "-16.92366", "lon": "145.76613"}
+    ]
+
+    engine._lookup_location(-16.9601, 145.8001)  # ~5.4 km from the centre
+    assert engine._current_location_name == "Near Cairns, Queensland"
+
+    engine._lookup_location(-16.9649, 145.8049)  # Same cell
+    assert engine._reverse_geocoder.search.call_count == 1
+    assert engine._current_location_name == "Near Cairns, Queensland"
+
+    engine._lookup_location(-16.9549, 145.8001)  # Next cell north
+    assert engine._reverse_geocoder.search.call_count == 2
@@ -0,0 +1,85 @@
+"""Unit tests for VideoRecorder housekeeping (no ffmpeg or camera required)."""
+
+import os
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from shitbox.capture import video as video_module
+from shitbox.capture.video import VideoRecorder
+
+
+def _touch(path: Path, age_days: float = 0.0) -> Path:
+    """Create a file and backdate its mtime by age_days."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x")
+    mtime = time.time() - age_days * 86400
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_cleanup_removes_old_media_and_prunes_nested_dirs(tmp_path: Path) -> None:
+    """Old .mp4/.jpg files are deleted and emptied nested date dirs are removed."""
+    recorder = VideoRecorder(output_dir=str(tmp_path))
+    old_video = _touch(tmp_path / "2026-01-01" / "high_g_120000_001.mp4", age_days=30)
+    old_image = _touch(tmp_path / "timelapse" / "2026-01-01" / "timelapse_120000.jpg", 30)
+    new_video = _touch(tmp_path / "2026-02-01" / "manual_capture_120000_001.mp4")
+    other = _touch(tmp_path / "2026-01-01" / "notes.txt", age_days=30)
+
+    deleted = recorder.cleanup_old_captures(max_age_days=14)
+
+    assert deleted == 2
+    assert not old_video.exists()
+    assert not old_image.exists()
+    assert new_video.exists()
+    assert other.exists()
+    assert not (tmp_path / "timelapse").exists()
+    assert tmp_path.exists()
+
+
+def test_cleanup_missing_output_dir(tmp_path: Path) -> None:
+    """A missing captures directory is a no-op."""
+    recorder = VideoRecorder(output_dir=str(tmp_path / "missing"))
+    assert recorder.cleanup_old_captures() == 0
+
+
+def test_date_subdir_created_once_per_day(tmp_path: Path) -> None:
+    """_ensure_date_subdir caches the day's directory and cleanup never prunes it."""
+    recorder = VideoRecorder(output_dir=str(tmp_path))
+    first = recorder._ensure_date_subdir(tmp_path)
+    assert first.is_dir()
+    assert recorder._ensure_date_subdir(tmp_path) is first
+
+    old_day = tmp_path / "2020-01-01"
+    old_day.mkdir()
+    recorder.cleanup_old_captures()  # prunes empty directories except today's
+    assert not old_day.exists()
+    assert first.is_dir()
+    assert recorder._ensure_date_subdir(tmp_path) == first
+
+
+def test_reap_finished_releases_exited_process_once(tmp_path: Path) -> None:
+    """is_recording only polls; reap_finished reports an exited ffmpeg exactly once."""
+    recorder = VideoRecorder(output_dir=str(tmp_path))
+    output = _touch(tmp_path / "2026-02-01" / "high_g_120000_001.mp4")
+    process = MagicMock()
+    process.poll.return_value = None
+    recorder._current_process = process
+    recorder._current_output = output
+    recorder._recording_start = time.time()
+
+    assert recorder.is_recording is True
+    recorder.reap_finished()
+    assert recorder._current_process is process  # Still running
+
+    process.poll.return_value = 0
+    assert recorder.is_recording is False
+    assert recorder._current_process is process  # No side effects
+
+    with patch.object(video_module.log, "info") as mock_info:
+        recorder.reap_finished()
+        recorder.reap_finished()
+
+    assert recorder._current_process is None
+    assert [c.args[0] for c in mock_info.call_args_list] == ["video_recording_complete"]
+    process.stderr.close.assert_called_once()